@@ -0,0 +1,61 @@
+"""Measures how many 20 ms stereo frames per second a single core can put
+through :class:`discord.PCMVolumeTransformer`, comparing the per-sample
+loop it used to run with each PCM processing backend available here.
+
+Usage: python benchmarks/pcm_volume.py [seconds per case]
+"""
+
+from __future__ import annotations
+
+import array
+import os
+import sys
+import time
+from math import floor
+
+from discord import pcm
+from discord.opus import Encoder
+
+FRAME = os.urandom(Encoder.FRAME_SIZE)
+
+
+def legacy(data: bytes, volume: float) -> bytes:
+    samples = array.array("h")
+    samples.frombytes(data)
+    for i in range(len(samples)):
+        samples[i] = int(floor(min(0x7FFF, max(samples[i] * volume, -0x8000))))
+    return samples.tobytes()
+
+
+def run(name: str, func, seconds: float) -> float:
+    frames = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(50):
+            func()
+        frames += 50
+    rate = frames / (time.perf_counter() - start)
+    print(f"{name:<32} {rate:>12,.0f} frames/s  {rate / 50:>9,.1f} realtime streams")
+    return rate
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    print(f"default backend: {pcm.BACKEND}")
+    run("legacy loop", lambda: legacy(FRAME, 0.5), seconds)
+
+    backends = {"python": pcm._process_python}
+    if pcm.HAS_AUDIOOP:
+        backends["audioop"] = pcm._process_audioop
+    if pcm.HAS_NUMPY:
+        backends["numpy"] = pcm._process_numpy
+
+    for name, process in backends.items():
+        run(f"{name} gain", lambda: process(FRAME, 0.5, 0.5, None), seconds)
+        run(f"{name} fade", lambda: process(FRAME, 0.5, 0.25, None), seconds)
+        run(f"{name} gain + soft limit", lambda: process(FRAME, 1.5, 1.5, 0.8), seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measures how many messages per second :meth:`discord.ext.commands.Bot.process_commands`
+handles when 0%, 10% and 100% of them invoke a command, with a single prefix
+and with a long per-guild prefix list.
+
+Usage: python benchmarks/process_commands.py [seconds per case]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from types import SimpleNamespace
+
+import discord
+from discord.ext import commands
+
+BOT_ID = 1
+AUTHOR = SimpleNamespace(id=2, bot=False)
+# a guild with many custom prefixes, the mention prefixes come first
+PREFIXES = [f"<@{BOT_ID}> ", f"<@!{BOT_ID}> "] + [f"p{i}!" for i in range(100)]
+
+
+def make_message(bot: commands.Bot, content: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        _state=bot._connection,
+        content=content,
+        author=AUTHOR,
+        guild=None,
+        channel=None,
+        edited_at=None,
+        created_at=discord.utils.utcnow(),
+    )
+
+
+def make_messages(
+    bot: commands.Bot, prefix: str, hit_rate: float, count: int = 100
+) -> list:
+    hits = int(count * hit_rate)
+    return [make_message(bot, f"{prefix}ping") for _ in range(hits)] + [
+        make_message(bot, "just chatting about the weather today")
+        for _ in range(count - hits)
+    ]
+
+
+async def run(name: str, bot: commands.Bot, messages: list, seconds: float) -> float:
+    processed = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for message in messages:
+            await bot.process_commands(message)
+        processed += len(messages)
+        # let the invoked commands finish
+        await asyncio.sleep(0)
+    rate = processed / (time.perf_counter() - start)
+    print(f"{name:<48} {rate:>12,.0f} messages/s")
+    return rate
+
+
+async def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+
+    for label, command_prefix, prefix in (
+        ("single prefix", "!", "!"),
+        ("100 prefixes", lambda bot, message: PREFIXES, PREFIXES[-1]),
+    ):
+        bot = commands.Bot(command_prefix=command_prefix, help_command=None)
+        bot._connection.user = SimpleNamespace(id=BOT_ID)
+
+        @bot.command()
+        async def ping(ctx: commands.Context) -> None:
+            pass
+
+        for hit_rate in (0.0, 0.1, 1.0):
+            await run(
+                f"{label}, {hit_rate:.0%} commands",
+                bot,
+                make_messages(bot, prefix, hit_rate),
+                seconds,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
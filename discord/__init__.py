@@ -32,6 +32,7 @@ from .asset import *
 from .audit_logs import *
 from .automod import *
 from .bot import *
+from .cache import *
 from .channel import *
 from .client import *
 from .cog import *
@@ -59,6 +60,7 @@ from .partial_emoji import *
 from .permissions import *
 from .player import *
 from .poll import *
+from .ratelimits import *
 from .raw_models import *
 from .reaction import *
 from .role import *
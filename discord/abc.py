@@ -337,6 +337,7 @@ class GuildChannel:
     flags: ChannelFlags
     _state: ConnectionState
     _overwrites: list[_Overwrites]
+    _resolved_permissions: tuple[int, dict[tuple[int, Any], int]] | None
 
     if TYPE_CHECKING:
 
@@ -538,6 +539,9 @@ class GuildChannel:
             )
 
     def _fill_overwrites(self, data: GuildChannelPayload) -> None:
+        # a fresh permission cache, copies made before the update keep the
+        # one matching their overwrites
+        self._resolved_permissions = None
         self._overwrites = []
         everyone_index = 0
         everyone_id = self.guild.id
@@ -719,6 +723,35 @@ class GuildChannel:
             The resolved permissions for the member or role.
         """
 
+        cache = self.guild._permission_cache
+        if cache is None:
+            return self._resolve_permissions(obj)
+
+        # permissions only depend on the roles of members, on top of the
+        # guild and channel state that invalidates the cache when it changes
+        if isinstance(obj, Role):
+            key = (obj.id, obj._permissions)
+        else:
+            key = (obj.id, obj._roles.tobytes())
+
+        resolved = self._resolved_permissions
+        if resolved is None or resolved[0] != cache.generation:
+            resolved = self._resolved_permissions = (cache.generation, {})
+
+        entries = resolved[1]
+        try:
+            value = entries[key]
+        except KeyError:
+            cache.misses += 1
+            value = self._resolve_permissions(obj).value
+            if len(entries) >= cache.max_entries:
+                entries.clear()
+            entries[key] = value
+        else:
+            cache.hits += 1
+        return Permissions(value)
+
+    def _resolve_permissions(self, obj: Member | Role, /) -> Permissions:
         # The current cases can be explained as:
         # Guild owner get all permissions -- no questions asked. Otherwise...
         # The @everyone role gets the first application.
@@ -97,6 +97,8 @@ class ApplicationCommandMixin(ABC):
         super().__init__(*args, **kwargs)
         self._pending_application_commands = []
         self._application_commands = {}
+        # (name, type, guild_id): command, for interactions with an unknown id
+        self._command_index = None
 
     @property
     def all_commands(self):
@@ -149,8 +151,13 @@ class ApplicationCommandMixin(ABC):
             if cmd == command:
                 command.id = cmd.id
                 self._application_commands[command.id] = command
+                # the command now comes before the ones that are only pending
+                self._command_index = None
                 break
         self._pending_application_commands.append(command)
+        if self._command_index is not None:
+            for key in self._command_keys(command):
+                self._command_index.setdefault(key, command)
 
     def remove_application_command(
         self, command: ApplicationCommand
@@ -174,10 +181,38 @@ class ApplicationCommandMixin(ABC):
         if command.id:
             self._application_commands.pop(command.id, None)
 
+        # another command may have the same keys
+        self._command_index = None
+
         if command in self._pending_application_commands:
             self._pending_application_commands.remove(command)
             return command
 
+    @staticmethod
+    def _command_keys(
+        command: ApplicationCommand,
+    ) -> list[tuple[str, int, int | None]]:
+        if command.guild_ids is None:
+            return [(command.name, command.type, None)]
+        return [
+            (command.name, command.type, guild_id) for guild_id in command.guild_ids
+        ]
+
+    def _get_command_from_index(
+        self, name: str, type: int, guild_id: int | None
+    ) -> ApplicationCommand | None:
+        index = self._command_index
+        if index is None:
+            # built lazily since syncing reassigns ids and guild_ids, the
+            # first command wins like a search through both lists would
+            index = self._command_index = {}
+            for command in (
+                self.application_commands + self.pending_application_commands
+            ):
+                for key in self._command_keys(command):
+                    index.setdefault(key, command)
+        return index.get((name, type, guild_id))
+
     @property
     def get_command(self):
         """Shortcut for :meth:`.get_application_command`.
@@ -679,6 +714,7 @@ class ApplicationCommandMixin(ABC):
             cmd.id = i["id"]
             self._application_commands[cmd.id] = cmd
 
+        self._command_index = None
         return registered
 
     async def sync_commands(
@@ -807,6 +843,8 @@ class ApplicationCommandMixin(ABC):
                     cmd.id = i["id"]
                     self._application_commands[cmd.id] = cmd
 
+        self._command_index = None
+
     async def process_application_commands(
         self, interaction: Interaction, auto_sync: bool | None = None
     ) -> None:
@@ -849,21 +887,14 @@ class ApplicationCommandMixin(ABC):
             if interaction.data:
                 command = self._application_commands[interaction.data["id"]]  # type: ignore
         except KeyError:
-            for cmd in self.application_commands + self.pending_application_commands:
-                if interaction.data:
-                    guild_id = interaction.data.get("guild_id")
-                    if guild_id:
-                        guild_id = int(guild_id)
-                    if cmd.name == interaction.data["name"] and (  # type: ignore
-                        guild_id == cmd.guild_ids
-                        or (
-                            isinstance(cmd.guild_ids, list)
-                            and guild_id in cmd.guild_ids
-                        )
-                    ):
-                        command = cmd
-                        break
-            else:
+            if interaction.data:
+                guild_id = interaction.data.get("guild_id")
+                command = self._get_command_from_index(
+                    interaction.data["name"],  # type: ignore
+                    interaction.data.get("type", 1),  # type: ignore
+                    int(guild_id) if guild_id else None,
+                )
+            if command is None:
                 if auto_sync and interaction.data:
                     guild_id = interaction.data.get("guild_id")
                     if guild_id is None:
@@ -1174,6 +1205,7 @@ class BotBase(ApplicationCommandMixin, CogMixin, ABC):
         self.owner_id = options.get("owner_id")
         self.owner_ids = options.get("owner_ids", set())
         self.auto_sync_commands = options.get("auto_sync_commands", True)
+        self.cooldown_backend = options.pop("cooldown_backend", None)
 
         self.debug_guilds = options.pop("debug_guilds", None)
         self.default_command_contexts = options.pop(
@@ -1506,6 +1538,16 @@ class Bot(BotBase, Client):
         Defaults to a set containing :attr:`IntegrationType.guild_install`.
 
         .. versionadded:: 2.6
+    cooldown_backend: Optional[:class:`~discord.ext.commands.CooldownBackend`]
+        Where to keep command cooldowns so that they hold across shards or processes,
+        e.g. an :class:`~discord.ext.commands.InMemoryCooldownBackend` shared by several bots.
+        Used by both application commands and prefixed commands. Defaults to ``None``, which
+        keeps cooldowns local to each command. When it is set, commands no longer keep a
+        bucket per user and the ``is_on_cooldown`` and ``get_cooldown_retry_after`` methods
+        of commands answer from :meth:`~discord.ext.commands.CooldownBackend.peek_retry_after`,
+        use :meth:`~.ApplicationCommand.fetch_cooldown_retry_after` to query the backend.
+
+        .. versionadded:: 2.7
     """
 
     @property
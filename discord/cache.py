@@ -0,0 +1,423 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Any, Callable, Iterator, MutableMapping, TypeVar
+
+__all__ = (
+    "LRUCache",
+    "TTLCache",
+    "NoCache",
+    "NameIndex",
+    "PermissionCache",
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+CacheFactory = Callable[[], MutableMapping[int, Any]]
+
+# the caches that can be swapped out through the cache_providers option
+CACHE_TYPES = frozenset(
+    {"users", "guilds", "emojis", "stickers", "members", "channels", "threads"}
+)
+
+_MISSING: Any = object()
+
+
+class LRUCache(OrderedDict[K, V]):
+    """A mapping holding at most ``maxsize`` items, evicting the least
+    recently accessed item when full.
+
+    This can be used as a cache provider, e.g. ``lambda: LRUCache(1000)``.
+
+    .. versionadded:: 2.7
+
+    .. note::
+
+        Looking an item up moves it to the end, so iterating over the
+        mapping or one of its views while looking items up raises
+        :exc:`RuntimeError`. Iterate over a copy, e.g. ``list(cache.values())``,
+        as the properties of :class:`Client` and :class:`Guild` do.
+
+    Parameters
+    ----------
+    maxsize: :class:`int`
+        The maximum number of items to hold.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        super().__init__()
+        self.maxsize: int = maxsize
+
+    def __getitem__(self, key: K) -> V:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key: K, default: Any = None) -> Any:
+        value = super().get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class TTLCache(OrderedDict[K, V]):
+    """A mapping whose items expire ``ttl`` seconds after being set.
+
+    Expired items are dropped lazily, oldest first, so expiring is
+    amortized over the operations on the mapping. An optional ``maxsize``
+    evicts the oldest item when full.
+
+    This can be used as a cache provider, e.g. ``lambda: TTLCache(600)``.
+
+    .. versionadded:: 2.7
+
+    .. note::
+
+        Setting an item or looking up an expired one removes expired
+        items, so iterating over the mapping or one of its views while
+        doing so raises :exc:`RuntimeError`. Iterate over a copy, e.g.
+        ``list(cache.values())``, as the properties of :class:`Client`
+        and :class:`Guild` do.
+
+    Parameters
+    ----------
+    ttl: :class:`float`
+        The number of seconds an item is kept for.
+    maxsize: Optional[:class:`int`]
+        The maximum number of items to hold.
+    """
+
+    def __init__(self, ttl: float, maxsize: int | None = None) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        super().__init__()
+        self.ttl: float = ttl
+        self.maxsize: int | None = maxsize
+        self._expires: dict[K, float] = {}
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        expires = self._expires
+        # items are kept in the order they were set, which is also
+        # the order they expire in
+        while expires:
+            key = next(iter(expires))
+            if expires[key] > now:
+                break
+            super().__delitem__(key)
+            del expires[key]
+
+    def __getitem__(self, key: K) -> V:
+        if self._expires[key] <= time.monotonic():
+            self.__delitem__(key)
+            raise KeyError(key)
+        return super().__getitem__(key)
+
+    def get(self, key: K, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        expires = self._expires.get(key)  # type: ignore
+        return expires is not None and expires > time.monotonic()
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._expire()
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._expires.pop(key, None)
+        self._expires[key] = time.monotonic() + self.ttl
+        if self.maxsize is not None and len(self._expires) > self.maxsize:
+            self.__delitem__(next(iter(self._expires)))
+
+    def __delitem__(self, key: K) -> None:
+        super().__delitem__(key)
+        del self._expires[key]
+
+    def pop(self, key: K, default: Any = _MISSING) -> Any:
+        try:
+            value = self[key]
+        except KeyError:
+            if default is _MISSING:
+                raise
+            return default
+        self.__delitem__(key)
+        return value
+
+    def popitem(self, last: bool = True) -> tuple[K, V]:
+        self._expire()
+        if not self._expires:
+            raise KeyError("dictionary is empty")
+        key = next(reversed(self._expires) if last else iter(self._expires))
+        value = super().__getitem__(key)
+        self.__delitem__(key)
+        return key, value
+
+    def setdefault(self, key: K, default: V = None) -> V:  # type: ignore
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def clear(self) -> None:
+        super().clear()
+        self._expires.clear()
+
+    def __len__(self) -> int:
+        self._expire()
+        return super().__len__()
+
+    def __iter__(self) -> Iterator[K]:
+        self._expire()
+        return super().__iter__()
+
+    def keys(self):
+        self._expire()
+        return super().keys()
+
+    def values(self):
+        self._expire()
+        return super().values()
+
+    def items(self):
+        self._expire()
+        return super().items()
+
+
+class NoCache(MutableMapping[K, V]):
+    """A mapping that never holds anything.
+
+    This can be used as a cache provider for entities that are never
+    looked up from the cache, e.g. ``cache_providers={"users": NoCache}``.
+
+    .. versionadded:: 2.7
+    """
+
+    def __getitem__(self, key: K) -> V:
+        raise KeyError(key)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        pass
+
+    def __delitem__(self, key: K) -> None:
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return "<NoCache>"
+
+
+class NameIndex:
+    """An index of IDs by case-folded names, allowing to look up entities
+    by name or name prefix without scanning a whole cache.
+
+    This is maintained by the library for cached members and users when
+    the ``name_index`` client option is enabled.
+
+    .. versionadded:: 2.7
+    """
+
+    __slots__ = ("_ids", "_names", "_sorted")
+
+    def __init__(self) -> None:
+        self._ids: dict[str, dict[int, None]] = {}
+        self._names: dict[int, tuple[str, ...]] = {}
+        self._sorted: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._names
+
+    def add(self, id: int, *names: str | None) -> None:
+        r"""Indexes an ID under the given names, replacing the names it was
+        previously indexed under. ``None`` and empty names are ignored.
+
+        Parameters
+        ----------
+        id: :class:`int`
+            The ID to index.
+        \*names: Optional[:class:`str`]
+            The names to index the ID under.
+        """
+        keys = tuple({name.casefold(): None for name in names if name})
+        old = self._names.get(id)
+        if old == keys:
+            return
+        if old is not None:
+            self._discard(id, old)
+        if not keys:
+            self._names.pop(id, None)
+            return
+
+        self._names[id] = keys
+        for key in keys:
+            ids = self._ids.get(key)
+            if ids is None:
+                self._ids[key] = ids = {}
+                if self._sorted is not None:
+                    insort(self._sorted, key)
+            ids[id] = None
+
+    def remove(self, id: int) -> None:
+        """Removes an ID from the index, if present.
+
+        Parameters
+        ----------
+        id: :class:`int`
+            The ID to remove.
+        """
+        keys = self._names.pop(id, None)
+        if keys is not None:
+            self._discard(id, keys)
+
+    def _discard(self, id: int, keys: tuple[str, ...]) -> None:
+        for key in keys:
+            ids = self._ids[key]
+            del ids[id]
+            if not ids:
+                del self._ids[key]
+                if self._sorted is not None:
+                    del self._sorted[bisect_left(self._sorted, key)]
+
+    def get(self, name: str) -> list[int]:
+        """Returns the IDs indexed under a name, ignoring case.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name to look up.
+
+        Returns
+        -------
+        List[:class:`int`]
+            The matching IDs, in the order they were indexed in.
+        """
+        return list(self._ids.get(name.casefold(), ()))
+
+    def search(self, prefix: str) -> list[int]:
+        """Returns the IDs indexed under a name starting with the prefix,
+        ignoring case.
+
+        Parameters
+        ----------
+        prefix: :class:`str`
+            The prefix to look up.
+
+        Returns
+        -------
+        List[:class:`int`]
+            The matching IDs, sorted by name.
+        """
+        prefix = prefix.casefold()
+        if self._sorted is None:
+            # sorted on first use, then kept sorted as names are indexed
+            self._sorted = sorted(self._ids)
+
+        names = self._sorted
+        found: dict[int, None] = {}
+        for i in range(bisect_left(names, prefix), len(names)):
+            name = names[i]
+            if not name.startswith(prefix):
+                break
+            found.update(self._ids[name])
+        return list(found)
+
+    def clear(self) -> None:
+        """Removes every ID from the index."""
+        self._ids.clear()
+        self._names.clear()
+        self._sorted = None
+
+
+class PermissionCache:
+    """The memoized permission resolution of a guild's channels.
+
+    Results of :meth:`abc.GuildChannel.permissions_for` are kept per channel,
+    keyed by the member's roles or the role's permissions. They are dropped
+    when a channel's overwrites are updated, and for the whole guild when
+    its roles or the guild itself are updated.
+
+    This is only available when the ``cache_permissions`` client option is
+    enabled, through :attr:`Guild.permission_cache`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The number of resolutions served from the cache.
+    misses: :class:`int`
+        The number of resolutions that had to be computed.
+    generation: :class:`int`
+        Incremented each time the whole guild's cache is invalidated.
+    max_entries: :class:`int`
+        The maximum number of results kept per channel.
+    """
+
+    __slots__ = ("hits", "misses", "generation", "max_entries")
+
+    def __init__(self, *, max_entries: int = 4096) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.generation: int = 0
+        self.max_entries: int = max_entries
+
+    def __repr__(self) -> str:
+        return f"<PermissionCache hits={self.hits} misses={self.misses}>"
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of resolutions served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def invalidate(self) -> None:
+        """Drops every cached result of the guild."""
+        self.generation += 1
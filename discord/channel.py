@@ -192,6 +192,7 @@ class _TextChannel(discord.abc.GuildChannel, Hashable):
         "position",
         "slowmode_delay",
         "_overwrites",
+        "_resolved_permissions",
         "_type",
         "last_message_id",
         "default_auto_archive_duration",
@@ -1362,6 +1363,7 @@ class VocalGuildChannel(discord.abc.Connectable, discord.abc.GuildChannel, Hasha
         "position",
         "slowmode_delay",
         "_overwrites",
+        "_resolved_permissions",
         "category_id",
         "rtc_region",
         "video_quality_mode",
@@ -2617,6 +2619,7 @@ class CategoryChannel(discord.abc.GuildChannel, Hashable):
         "_state",
         "position",
         "_overwrites",
+        "_resolved_permissions",
         "category_id",
         "flags",
     )
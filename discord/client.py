@@ -46,6 +46,7 @@ from .enums import ChannelType, Status
 from .errors import *
 from .flags import ApplicationFlags, Intents
 from .gateway import *
+from .gateway import GatewayDecompressor, _resolve_decompressor
 from .guild import Guild
 from .http import HTTPClient
 from .invite import Invite
@@ -58,7 +59,7 @@ from .state import ConnectionState
 from .sticker import GuildSticker, StandardSticker, StickerPack, _sticker_factory
 from .template import Template
 from .threads import Thread
-from .ui.view import View
+from .ui.view import View, ViewStoreStats
 from .user import ClientUser, User
 from .utils import MISSING
 from .voice_client import VoiceClient
@@ -70,7 +71,9 @@ if TYPE_CHECKING:
     from .channel import DMChannel
     from .member import Member
     from .message import Message
+    from .player import VoiceScheduler
     from .poll import Poll
+    from .ratelimits import RatelimitStore
     from .voice_client import VoiceProtocol
 
 __all__ = ("Client",)
@@ -130,6 +133,24 @@ class Client:
 
         .. versionchanged:: 1.3
             Allow disabling the message cache and change the default size to ``1000``.
+    max_channel_messages: Optional[:class:`int`]
+        The maximum number of messages of a single channel to store in the internal message
+        cache. Once reached, the oldest cached message of that channel is evicted.
+        Defaults to ``None``, meaning only ``max_messages`` applies.
+
+        .. versionadded:: 2.7
+    max_guild_messages: Optional[:class:`int`]
+        The maximum number of messages of a single guild to store in the internal message
+        cache. Once reached, the oldest cached message of that guild is evicted.
+        Defaults to ``None``, meaning only ``max_messages`` applies.
+
+        .. versionadded:: 2.7
+    message_cache_lru: :class:`bool`
+        Whether the internal message cache evicts the least recently accessed message
+        instead of the oldest one when full. Messages are accessed when they are edited,
+        deleted or reacted to. Defaults to ``False``.
+
+        .. versionadded:: 2.7
     loop: Optional[:class:`asyncio.AbstractEventLoop`]
         The :class:`asyncio.AbstractEventLoop` to use for asynchronous operations.
         Defaults to ``None``, in which case the default event loop is used via
@@ -191,6 +212,19 @@ class Client:
         sync your system clock to Google's NTP server.
 
         .. versionadded:: 1.3
+    max_global_requests: :class:`int`
+        The maximum number of requests per second to send to Discord before pre-emptively
+        waiting for the global rate limit to reset. Defaults to ``50``, which is the global
+        rate limit of most bots. Cannot be passed along with ``ratelimit_store``,
+        pass it to the store instead.
+
+        .. versionadded:: 2.7
+    ratelimit_store: Optional[:class:`RatelimitStore`]
+        Where to keep the HTTP rate limit state. Passing a :class:`UnixSocketRatelimitStore`
+        lets several processes of the same bot share their rate limits.
+        Defaults to an :class:`InMemoryRatelimitStore` local to this client.
+
+        .. versionadded:: 2.7
     enable_debug_events: :class:`bool`
         Whether to enable events that are useful only for debugging gateway related information.
 
@@ -199,6 +233,23 @@ class Client:
         To enable these events, this must be set to ``True``. Defaults to ``False``.
 
         .. versionadded:: 2.0
+    gateway_compression: Optional[:class:`str`]
+        The transport compression to request from the gateway. Can be ``"zlib-stream"``,
+        the default, or ``"zstd-stream"``, which requires the ``zstandard`` library.
+        Passing ``None`` disables transport compression.
+
+        .. versionadded:: 2.7
+    skip_unobserved_events: :class:`bool`
+        Whether to skip decoding gateway events that do not update the cache when
+        no event handler, listener or :meth:`wait_for` is waiting for any of the events
+        they dispatch, e.g. ``TYPING_START`` without an :func:`on_typing` or :func:`on_raw_typing`
+        handler. The cache is still updated by the ``PRESENCE_UPDATE`` and ``GUILD_MEMBER_UPDATE``
+        events, but :func:`on_presence_update` and :func:`on_member_update` are then only
+        dispatched when something listens to them. Do not turn this on when overriding
+        :meth:`dispatch` or otherwise receiving events without registering handlers.
+        Defaults to ``False``.
+
+        .. versionadded:: 2.7
     cache_app_emojis: :class:`bool`
         Whether to automatically fetch and cache the application's emojis on startup and when fetching. Defaults to ``False``.
 
@@ -209,6 +260,62 @@ class Client:
             run :func:`fetch_emojis`.
 
         .. versionadded:: 2.7
+    cache_providers: Dict[:class:`str`, Callable[[], MutableMapping]]
+        A mapping of cache names to zero-argument factories returning the mapping used as
+        that cache, e.g. ``{"members": lambda: LRUCache(1000), "users": NoCache}``.
+        The supported names are ``users``, ``guilds``, ``emojis``, ``stickers``, as well as
+        ``members``, ``channels`` and ``threads``, which are created once per guild.
+        Caches not listed use a regular :class:`dict`. See :class:`LRUCache`, :class:`TTLCache`
+        and :class:`NoCache` for the bundled providers. The message cache is configured
+        through ``max_messages`` and its related options instead.
+
+        .. warning::
+
+            Entities evicted from a bounded cache are no longer returned by the ``get_``
+            methods and properties such as :attr:`Guild.members`, and a guild whose member
+            cache is bounded may never be reported as :attr:`Guild.chunked`.
+
+        .. versionadded:: 2.7
+    compact_member_threshold: Optional[:class:`int`]
+        The member count from which guilds store their cached members in compact,
+        array-backed columns instead of as :class:`Member` objects, reducing the memory
+        used by large chunked guilds. Only :attr:`Guild.me` and the 1024 most recently
+        accessed members of each guild are kept as objects, others are rebuilt when accessed,
+        so a member object that hasn't been used in a while may no longer be updated by
+        later events. The users of those members are only returned by :meth:`get_user`
+        and not by :attr:`users`. Cannot be combined with a ``members`` entry in
+        ``cache_providers``. Defaults to ``None``, which disables compact storage.
+
+        .. note::
+
+            This trades CPU time for memory. A member without a presence takes about
+            140 bytes instead of about 850 bytes as :class:`Member` and :class:`User`
+            objects, roughly 6 times less rather than an order of magnitude. Looking up
+            members that aren't kept as objects builds new ones, and :attr:`Guild.members`
+            builds every member of the guild each time it is accessed, so prefer
+            :meth:`Guild.get_member` for large guilds.
+
+        .. versionadded:: 2.7
+    name_index: :class:`bool`
+        Whether to maintain :class:`NameIndex` indexes of cached guild members and users,
+        so that :meth:`Guild.get_member_named` and the user and member converters of the
+        commands extension do not scan the whole cache. The user index is not maintained
+        when the ``users`` cache is replaced through ``cache_providers``.
+        Defaults to ``False``.
+
+        .. versionadded:: 2.7
+    cache_permissions: :class:`bool`
+        Whether to memoize the results of :meth:`abc.GuildChannel.permissions_for`
+        per channel. Cached results are invalidated when roles, channel overwrites or the guild
+        are updated, and the cache's statistics are available through :attr:`Guild.permission_cache`.
+        Defaults to ``False``.
+
+        .. versionadded:: 2.7
+    voice_scheduler: Optional[:class:`VoiceScheduler`]
+        The scheduler which sends the audio of every voice client of this client,
+        instead of each playing voice client using its own thread. Defaults to ``None``.
+
+        .. versionadded:: 2.7
 
     Attributes
     -----------
@@ -239,12 +346,16 @@ class Client:
         proxy: str | None = options.pop("proxy", None)
         proxy_auth: aiohttp.BasicAuth | None = options.pop("proxy_auth", None)
         unsync_clock: bool = options.pop("assume_unsync_clock", True)
+        max_global_requests: int | None = options.pop("max_global_requests", None)
+        ratelimit_store: RatelimitStore | None = options.pop("ratelimit_store", None)
         self.http: HTTPClient = HTTPClient(
             connector,
             proxy=proxy,
             proxy_auth=proxy_auth,
             unsync_clock=unsync_clock,
             loop=self.loop,
+            max_global_requests=max_global_requests,
+            ratelimit_store=ratelimit_store,
         )
 
         self._handlers: dict[str, Callable] = {"ready": self._handle_ready}
@@ -254,6 +365,12 @@ class Client:
         }
 
         self._enable_debug_events: bool = options.pop("enable_debug_events", False)
+        self._voice_scheduler: VoiceScheduler | None = options.pop(
+            "voice_scheduler", None
+        )
+        self._gateway_compression: type[GatewayDecompressor] | None = (
+            _resolve_decompressor(options.pop("gateway_compression", "zlib-stream"))
+        )
         self._connection: ConnectionState = self._get_state(**options)
         self._connection.shard_count = self.shard_count
         self._closed: bool = False
@@ -464,6 +581,14 @@ class Client:
         task.add_done_callback(self._tasks.discard)
         return task
 
+    def _has_listeners(self, event: str) -> bool:
+        method = f"on_{event}"
+        return (
+            event in self._listeners
+            or bool(self._event_handlers.get(method))
+            or hasattr(self, method)
+        )
+
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         _log.debug("Dispatching event %s", event)
         method = f"on_{event}"
@@ -2030,6 +2155,15 @@ class Client:
         """
         return self._connection.persistent_views
 
+    @property
+    def view_store_stats(self) -> ViewStoreStats:
+        """The size of the store views are dispatched from and how long
+        routing component interactions to them takes.
+
+        .. versionadded:: 2.7
+        """
+        return self._connection.view_store_stats
+
     async def fetch_role_connection_metadata_records(
         self,
     ) -> list[ApplicationRoleConnectionMetadata]:
@@ -97,7 +97,7 @@ if TYPE_CHECKING:
 
     from .. import Permissions
     from ..cog import Cog
-    from ..ext.commands.cooldowns import CooldownMapping, MaxConcurrency
+    from ..ext.commands.cooldowns import Cooldown, CooldownMapping, MaxConcurrency
 
 T = TypeVar("T")
 CogT = TypeVar("CogT", bound="Cog")
@@ -333,13 +333,44 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
                 InteractionContextType.private_channel,
             }
 
-    def _prepare_cooldowns(self, ctx: ApplicationContext):
+    def _backend_key(self, ctx: ApplicationContext) -> str:
+        key = self._buckets._bucket_key(ctx)  # type: ignore # ctx instead of non-existent message
+        return f"{self.qualified_name}:{key}"
+
+    def _get_bucket(
+        self, ctx: ApplicationContext, current: float | None = None
+    ) -> Cooldown | None:
+        if ctx.bot.cooldown_backend is not None:
+            # the backend keeps the state, the bucket only describes the
+            # cooldown so it isn't cached
+            return self._buckets.create_bucket(ctx)  # type: ignore # ctx instead of non-existent message
+        return self._buckets.get_bucket(ctx, current)  # type: ignore # ctx instead of non-existent message
+
+    def _get_retry_after(self, ctx: ApplicationContext) -> float:
+        bucket = self._get_bucket(ctx)
+        if bucket is None:
+            return 0.0
+        current = utcnow().timestamp()
+        backend = ctx.bot.cooldown_backend
+        if backend is None:
+            return bucket.get_retry_after(current)
+        return backend.peek_retry_after(
+            self._backend_key(ctx), bucket.rate, bucket.per, current
+        )
+
+    async def _prepare_cooldowns(self, ctx: ApplicationContext):
         if self._buckets.valid:
             current = datetime.datetime.now().timestamp()
-            bucket = self._buckets.get_bucket(ctx, current)  # type: ignore # ctx instead of non-existent message
+            bucket = self._get_bucket(ctx, current)
 
             if bucket is not None:
-                retry_after = bucket.update_rate_limit(current)
+                backend = ctx.bot.cooldown_backend
+                if backend is None:
+                    retry_after = bucket.update_rate_limit(current)
+                else:
+                    retry_after = await backend._update(
+                        self._backend_key(ctx), bucket.rate, bucket.per, current
+                    )
 
                 if retry_after:
                     from ..ext.commands.errors import CommandOnCooldown
@@ -360,7 +391,7 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
             await self._max_concurrency.acquire(ctx)  # type: ignore # ctx instead of non-existent message
 
         try:
-            self._prepare_cooldowns(ctx)
+            await self._prepare_cooldowns(ctx)
             await self.call_before_hooks(ctx)
         except:
             if self._max_concurrency is not None:
@@ -383,13 +414,16 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
         -------
         :class:`bool`
             A boolean indicating if the command is on cooldown.
+
+        .. versionchanged:: 2.7
+            With a :attr:`~.Bot.cooldown_backend`, this relies on
+            :meth:`~.CooldownBackend.peek_retry_after`, use
+            :meth:`fetch_cooldown_retry_after` to query the backend.
         """
         if not self._buckets.valid:
             return False
 
-        bucket = self._buckets.get_bucket(ctx)  # type: ignore
-        current = utcnow().timestamp()
-        return bucket.get_tokens(current) == 0
+        return self._get_retry_after(ctx) > 0
 
     def reset_cooldown(self, ctx: ApplicationContext) -> None:
         """Resets the cooldown on this command.
@@ -398,10 +432,19 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
         ----------
         ctx: :class:`.ApplicationContext`
             The invocation context to reset the cooldown under.
+
+        .. versionchanged:: 2.7
+            The bucket is also reset in the bot's :attr:`~.Bot.cooldown_backend`, if any.
+            That reset happens in the background, invocations of the command made by
+            this bot wait for it to complete.
         """
         if self._buckets.valid:
-            bucket = self._buckets.get_bucket(ctx)  # type: ignore # ctx instead of non-existent message
-            bucket.reset()
+            backend = ctx.bot.cooldown_backend
+            if backend is not None:
+                backend._reset_later(ctx.bot.loop, self._backend_key(ctx))
+            else:
+                bucket = self._buckets.get_bucket(ctx)  # type: ignore # ctx instead of non-existent message
+                bucket.reset()
 
     def get_cooldown_retry_after(self, ctx: ApplicationContext) -> float:
         """Retrieves the amount of seconds before this command can be tried again.
@@ -420,14 +463,47 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
         :class:`float`
             The amount of time left on this command's cooldown in seconds.
             If this is ``0.0`` then the command isn't on cooldown.
+
+        .. versionchanged:: 2.7
+            With a :attr:`~.Bot.cooldown_backend`, this relies on
+            :meth:`~.CooldownBackend.peek_retry_after`, use
+            :meth:`fetch_cooldown_retry_after` to query the backend.
         """
         if self._buckets.valid:
-            bucket = self._buckets.get_bucket(ctx)  # type: ignore
-            current = utcnow().timestamp()
-            return bucket.get_retry_after(current)
+            return self._get_retry_after(ctx)
 
         return 0.0
 
+    async def fetch_cooldown_retry_after(self, ctx: ApplicationContext) -> float:
+        """|coro|
+
+        Retrieves the amount of seconds before this command can be tried again,
+        from the bot's :attr:`~.Bot.cooldown_backend` if it has one.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        ctx: :class:`.ApplicationContext`
+            The invocation context to retrieve the cooldown from.
+
+        Returns
+        -------
+        :class:`float`
+            The amount of time left on this command's cooldown in seconds.
+            If this is ``0.0`` then the command isn't on cooldown.
+        """
+        backend = ctx.bot.cooldown_backend
+        if backend is None or not self._buckets.valid:
+            return self.get_cooldown_retry_after(ctx)
+
+        bucket = self._get_bucket(ctx)
+        if bucket is None:
+            return 0.0
+        return await backend._get_retry_after(
+            self._backend_key(ctx), bucket.rate, bucket.per, utcnow().timestamp()
+        )
+
     async def invoke(self, ctx: ApplicationContext) -> None:
         await self.prepare(ctx)
 
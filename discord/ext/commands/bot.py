@@ -109,6 +109,54 @@ def _is_submodule(parent: str, child: str) -> bool:
     return parent == child or child.startswith(f"{parent}.")
 
 
+class _PrefixNode:
+    __slots__ = ("children", "index")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixNode] = {}
+        self.index: int | None = None
+
+
+class _PrefixMatcher:
+    """A trie of the prefixes returned by :meth:`.Bot.get_prefix`.
+
+    Matching walks the message content once instead of testing every
+    prefix, and returns the earliest prefix in the original order that
+    the content starts with, like :func:`discord.utils.find` would.
+    """
+
+    __slots__ = ("prefixes", "root")
+
+    def __init__(self, prefixes: tuple[str, ...]) -> None:
+        self.prefixes: tuple[str, ...] = prefixes
+        self.root: _PrefixNode = _PrefixNode()
+        for index, prefix in enumerate(prefixes):
+            if not isinstance(prefix, str):
+                raise TypeError(f"prefix must be str, not {prefix.__class__.__name__}")
+
+            node = self.root
+            for char in prefix:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _PrefixNode()
+                node = child
+
+            if node.index is None:
+                node.index = index
+
+    def match(self, content: str) -> str | None:
+        node = self.root
+        best = node.index
+        for char in content:
+            node = node.children.get(char)  # type: ignore
+            if node is None:
+                break
+            if node.index is not None and (best is None or node.index < best):
+                best = node.index
+
+        return None if best is None else self.prefixes[best]
+
+
 class BotBase(GroupMixin, discord.cog.CogMixin):
     _help_command = None
     _supports_prefixed_commands = True
@@ -132,6 +180,11 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
             DefaultHelpCommand() if help_command is MISSING else help_command
         )
         self.strip_after_prefix = options.get("strip_after_prefix", False)
+        # prefixes returned by get_prefix: matcher, oldest first
+        self._prefix_matchers: collections.OrderedDict[
+            tuple[str, ...], _PrefixMatcher
+        ] = collections.OrderedDict()
+        self.max_prefix_matchers: int = options.get("max_prefix_matchers", 1024)
 
     @discord.utils.copy_doc(discord.Client.close)
     async def close(self) -> None:
@@ -251,6 +304,20 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
 
         return ret
 
+    def _get_prefix_matcher(self, prefixes: tuple[str, ...]) -> _PrefixMatcher:
+        # matchers are cached by the prefixes they were built from, so a
+        # changed get_prefix result never hits a stale matcher
+        matchers = self._prefix_matchers
+        matcher = matchers.get(prefixes)
+        if matcher is not None:
+            matchers.move_to_end(prefixes)
+            return matcher
+
+        matcher = matchers[prefixes] = _PrefixMatcher(prefixes)
+        if len(matchers) > self.max_prefix_matchers:
+            matchers.popitem(last=False)
+        return matcher
+
     async def get_context(self, message: Message, *, cls: type[CXT] = Context) -> CXT:
         r"""|coro|
 
@@ -295,13 +362,7 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
                 return ctx
         else:
             try:
-                # if the context class' __init__ consumes something from the view this
-                # will be wrong.  That seems unreasonable though.
-                if message.content.startswith(tuple(prefix)):
-                    invoked_prefix = discord.utils.find(view.skip_string, prefix)
-                else:
-                    return ctx
-
+                matcher = self._get_prefix_matcher(tuple(prefix))
             except TypeError:
                 if not isinstance(prefix, list):
                     raise TypeError(
@@ -321,6 +382,13 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
                 # Getting here shouldn't happen
                 raise
 
+            # if the context class' __init__ consumes something from the view this
+            # will be wrong.  That seems unreasonable though.
+            invoked_prefix = matcher.match(message.content)
+            if invoked_prefix is None:
+                return ctx
+            view.skip_string(invoked_prefix)
+
         if self.strip_after_prefix:
             view.skip_ws()
 
@@ -448,6 +516,12 @@ class Bot(BotBase, discord.Bot):
         the ``command_prefix`` is set to ``!``. Defaults to ``False``.
 
         .. versionadded:: 1.7
+    max_prefix_matchers: :class:`int`
+        The number of distinct prefix lists returned by :meth:`.get_prefix` to keep
+        compiled prefix matchers for, e.g. one per guild with custom prefixes.
+        The least recently used matchers are discarded first. Defaults to ``1024``.
+
+        .. versionadded:: 2.7
     """
 
 
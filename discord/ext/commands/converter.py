@@ -284,6 +284,16 @@ class UserConverter(IDConverter[discord.User]):
         passed, and it's not available in cache.
     """
 
+    @staticmethod
+    def _users_named(state, name: str) -> Iterable[discord.User]:
+        # the cached users that may have the name, narrowed down
+        # through the name index when it is enabled
+        index = state._user_names
+        if index is None:
+            return state._users.values()
+        users = (state._users.get(user_id) for user_id in index.get(name))
+        return [u for u in users if u is not None]
+
     async def convert(self, ctx: Context, argument: str) -> discord.User:
         match = self._get_id_match(argument) or re.match(
             r"<@!?([0-9]{15,20})>$", argument
@@ -316,12 +326,12 @@ class UserConverter(IDConverter[discord.User]):
             discrim = arg[-4:]
             name = arg[:-5]
             predicate = lambda u: u.name == name and u.discriminator == discrim
-            result = discord.utils.find(predicate, state._users.values())
+            result = discord.utils.find(predicate, self._users_named(state, name))
             if result is not None:
                 return result
 
         predicate = lambda u: arg in (u.name, u.global_name)
-        result = discord.utils.find(predicate, state._users.values())
+        result = discord.utils.find(predicate, self._users_named(state, arg))
 
         if result is None:
             raise UserNotFound(argument)
@@ -26,9 +26,12 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import logging
 import time
 from collections import deque
-from typing import TYPE_CHECKING, Any, Callable, Deque, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Deque, Tuple, TypeVar
 
 import discord.abc
 from discord.enums import Enum
@@ -43,13 +46,45 @@ __all__ = (
     "BucketType",
     "Cooldown",
     "CooldownMapping",
+    "CooldownBackend",
+    "InMemoryCooldownBackend",
     "DynamicCooldownMapping",
     "MaxConcurrency",
 )
 
+_log = logging.getLogger(__name__)
+
 C = TypeVar("C", bound="CooldownMapping")
 MC = TypeVar("MC", bound="MaxConcurrency")
 
+# (expires, sequence, key, bucket); the sequence keeps buckets from being compared
+_ExpiryEntry = Tuple[float, int, Any, "Cooldown"]
+_expiry_sequence = itertools.count()
+
+
+def _schedule_expiry(
+    heap: list[_ExpiryEntry], key: Any, bucket: Cooldown, current: float
+) -> None:
+    heapq.heappush(heap, (current + bucket.per, next(_expiry_sequence), key, bucket))
+
+
+def _expire_buckets(
+    cache: dict[Any, Cooldown], heap: list[_ExpiryEntry], current: float
+) -> None:
+    # buckets are ordered by the earliest time they could expire, so only
+    # the entries that are due are looked at instead of the whole cache.
+    # a bucket that was used since it was scheduled is pushed back to
+    # the end of its new window.
+    while heap and heap[0][0] < current:
+        _, _, key, bucket = heapq.heappop(heap)
+        if cache.get(key) is not bucket:
+            continue
+        expires = bucket._last + bucket.per
+        if current > expires:
+            del cache[key]
+        else:
+            heapq.heappush(heap, (expires, next(_expiry_sequence), key, bucket))
+
 
 class BucketType(Enum):
     default = 0
@@ -214,12 +249,14 @@ class CooldownMapping:
             raise TypeError("Cooldown type must be a BucketType or callable")
 
         self._cache: dict[Any, Cooldown] = {}
+        self._expiry: list[_ExpiryEntry] = []
         self._cooldown: Cooldown | None = original
         self._type: Callable[[Message], Any] = type
 
     def copy(self) -> CooldownMapping:
         ret = CooldownMapping(self._cooldown, self._type)
         ret._cache = self._cache.copy()
+        ret._expiry = self._expiry.copy()
         return ret
 
     @property
@@ -242,9 +279,7 @@ class CooldownMapping:
         # in a cooldown window. e.g. if we have a  command that has a
         # cooldown of 60s, and it has not been used in 60s then that key should be deleted
         current = current or time.time()
-        dead_keys = [k for k, v in self._cache.items() if current > v._last + v.per]
-        for k in dead_keys:
-            del self._cache[k]
+        _expire_buckets(self._cache, self._expiry, current)
 
     def create_bucket(self, message: Message) -> Cooldown:
         return self._cooldown.copy()  # type: ignore
@@ -259,6 +294,7 @@ class CooldownMapping:
             bucket = self.create_bucket(message)
             if bucket is not None:
                 self._cache[key] = bucket
+                _schedule_expiry(self._expiry, key, bucket, current or time.time())
         else:
             bucket = self._cache[key]
 
@@ -271,6 +307,215 @@ class CooldownMapping:
         return bucket.update_rate_limit(current)
 
 
+class CooldownBackend:
+    """Represents where the cooldown state of commands is kept when it
+    has to be shared, e.g. between the shards or processes of a bot.
+
+    Subclass this to keep cooldowns in an external store. Buckets are
+    identified by opaque strings built from the qualified name of the command
+    and the key of its bucket, so implementations only need to apply the
+    token bucket described by ``rate`` and ``per`` to them. Subclasses
+    overriding ``__init__`` must call ``super().__init__()``.
+
+    .. versionadded:: 2.7
+    """
+
+    def __init__(self) -> None:
+        # resets in flight, uses of their bucket wait for them
+        self._resets: dict[str, asyncio.Task] = {}
+        # bucket -> time its cooldown ends, as last reported to this bot
+        self._cooldowns: dict[str, float] = {}
+        self._prune_at: int = 1024
+
+    async def update_rate_limit(
+        self, key: str, rate: int, per: float, current: float
+    ) -> float | None:
+        """|coro|
+
+        Uses a token from a bucket.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The bucket to use a token from.
+        rate: :class:`int`
+            The total number of tokens available per ``per`` seconds.
+        per: :class:`float`
+            The length of the cooldown period in seconds.
+        current: :class:`float`
+            The time in seconds since Unix epoch the command was invoked at.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The retry-after time in seconds if rate limited.
+        """
+        raise NotImplementedError
+
+    async def get_retry_after(
+        self, key: str, rate: int, per: float, current: float
+    ) -> float:
+        """|coro|
+
+        Returns the time until a token is available in a bucket, without using one.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The bucket to check.
+        rate: :class:`int`
+            The total number of tokens available per ``per`` seconds.
+        per: :class:`float`
+            The length of the cooldown period in seconds.
+        current: :class:`float`
+            The time in seconds since Unix epoch to check at.
+
+        Returns
+        -------
+        :class:`float`
+            The retry-after time in seconds, ``0.0`` if a token is available.
+        """
+        raise NotImplementedError
+
+    async def reset(self, key: str) -> None:
+        """|coro|
+
+        Resets a bucket to its initial state.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The bucket to reset.
+        """
+        raise NotImplementedError
+
+    def peek_retry_after(
+        self, key: str, rate: int, per: float, current: float
+    ) -> float:
+        """Returns the time until a token is available in a bucket as far as it is
+        known without querying the store, for synchronous methods such as
+        :meth:`.Command.get_cooldown_retry_after`.
+
+        The default implementation only knows about the cooldowns that commands
+        of this bot ran into, tokens used by other bots sharing the store are
+        missed until then.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The bucket to check.
+        rate: :class:`int`
+            The total number of tokens available per ``per`` seconds.
+        per: :class:`float`
+            The length of the cooldown period in seconds.
+        current: :class:`float`
+            The time in seconds since Unix epoch to check at.
+
+        Returns
+        -------
+        :class:`float`
+            The retry-after time in seconds, ``0.0`` if a token is available.
+        """
+        until = self._cooldowns.get(key)
+        if until is None:
+            return 0.0
+        if until <= current:
+            del self._cooldowns[key]
+            return 0.0
+        return until - current
+
+    async def _update(
+        self, key: str, rate: int, per: float, current: float
+    ) -> float | None:
+        await self._wait_for_reset(key)
+        retry_after = await self.update_rate_limit(key, rate, per, current)
+        if retry_after:
+            cooldowns = self._cooldowns
+            cooldowns[key] = current + retry_after
+            if len(cooldowns) > self._prune_at:
+                for other, until in list(cooldowns.items()):
+                    if until <= current:
+                        del cooldowns[other]
+                self._prune_at = max(1024, len(cooldowns) * 2)
+        return retry_after
+
+    async def _get_retry_after(
+        self, key: str, rate: int, per: float, current: float
+    ) -> float:
+        await self._wait_for_reset(key)
+        return await self.get_retry_after(key, rate, per, current)
+
+    def _reset_later(self, loop: asyncio.AbstractEventLoop, key: str) -> None:
+        # keeps a reference to the task until it is done, so that it can't be
+        # garbage collected and uses of the bucket can wait for it
+        self._cooldowns.pop(key, None)
+        resets = self._resets
+        task = loop.create_task(self.reset(key))
+        resets[key] = task
+
+        def done(task: asyncio.Task) -> None:
+            if resets.get(key) is task:
+                del resets[key]
+            if not task.cancelled() and task.exception() is not None:
+                _log.error(
+                    "Failed to reset the cooldown bucket %s.",
+                    key,
+                    exc_info=task.exception(),
+                )
+
+        task.add_done_callback(done)
+
+    async def _wait_for_reset(self, key: str) -> None:
+        task = self._resets.get(key)
+        if task is not None:
+            # the reset logs its own errors
+            await asyncio.wait((task,))
+
+
+class InMemoryCooldownBackend(CooldownBackend):
+    """A :class:`CooldownBackend` that keeps cooldowns in memory.
+
+    A single instance can be passed to several bots running in the same
+    process, e.g. one per shard, to share their cooldowns.
+
+    .. versionadded:: 2.7
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buckets: dict[str, Cooldown] = {}
+        self._expiry: list[_ExpiryEntry] = []
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def update_rate_limit(
+        self, key: str, rate: int, per: float, current: float
+    ) -> float | None:
+        _expire_buckets(self._buckets, self._expiry, current)
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.rate != rate or bucket.per != per:
+            bucket = self._buckets[key] = Cooldown(rate, per)
+            _schedule_expiry(self._expiry, key, bucket, current)
+        return bucket.update_rate_limit(current)
+
+    async def get_retry_after(
+        self, key: str, rate: int, per: float, current: float
+    ) -> float:
+        return self.peek_retry_after(key, rate, per, current)
+
+    def peek_retry_after(
+        self, key: str, rate: int, per: float, current: float
+    ) -> float:
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.rate != rate or bucket.per != per:
+            return 0.0
+        return bucket.get_retry_after(current)
+
+    async def reset(self, key: str) -> None:
+        self._buckets.pop(key, None)
+
+
 class DynamicCooldownMapping(CooldownMapping):
     def __init__(
         self, factory: Callable[[Message], Cooldown], type: Callable[[Message], Any]
@@ -281,6 +526,7 @@ class DynamicCooldownMapping(CooldownMapping):
     def copy(self) -> DynamicCooldownMapping:
         ret = DynamicCooldownMapping(self._factory, self._type)
         ret._cache = self._cache.copy()
+        ret._expiry = self._expiry.copy()
         return ret
 
     @property
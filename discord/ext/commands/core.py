@@ -850,13 +850,19 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         if hook is not None:
             await hook(ctx)
 
-    def _prepare_cooldowns(self, ctx: Context) -> None:
+    async def _prepare_cooldowns(self, ctx: Context) -> None:
         if self._buckets.valid:
             dt = ctx.message.edited_at or ctx.message.created_at
             current = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
-            bucket = self._buckets.get_bucket(ctx.message, current)
+            bucket = self._get_bucket(ctx, current)
             if bucket is not None:
-                retry_after = bucket.update_rate_limit(current)
+                backend = ctx.bot.cooldown_backend
+                if backend is None:
+                    retry_after = bucket.update_rate_limit(current)
+                else:
+                    retry_after = await backend._update(
+                        self._backend_key(ctx), bucket.rate, bucket.per, current
+                    )
                 if retry_after:
                     raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
 
@@ -875,9 +881,9 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         try:
             if self.cooldown_after_parsing:
                 await self._parse_arguments(ctx)
-                self._prepare_cooldowns(ctx)
+                await self._prepare_cooldowns(ctx)
             else:
-                self._prepare_cooldowns(ctx)
+                await self._prepare_cooldowns(ctx)
                 await self._parse_arguments(ctx)
 
             await self.call_before_hooks(ctx)
@@ -890,6 +896,31 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
     def cooldown(self) -> Cooldown | None:
         return self._buckets._cooldown
 
+    def _backend_key(self, ctx: Context) -> str:
+        return f"{self.qualified_name}:{self._buckets._bucket_key(ctx.message)}"
+
+    def _get_bucket(
+        self, ctx: Context, current: float | None = None
+    ) -> Cooldown | None:
+        if ctx.bot.cooldown_backend is not None:
+            # the backend keeps the state, the bucket only describes the
+            # cooldown so it isn't cached
+            return self._buckets.create_bucket(ctx.message)
+        return self._buckets.get_bucket(ctx.message, current)
+
+    def _get_retry_after(self, ctx: Context) -> float:
+        bucket = self._get_bucket(ctx)
+        if bucket is None:
+            return 0.0
+        dt = ctx.message.edited_at or ctx.message.created_at
+        current = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
+        backend = ctx.bot.cooldown_backend
+        if backend is None:
+            return bucket.get_retry_after(current)
+        return backend.peek_retry_after(
+            self._backend_key(ctx), bucket.rate, bucket.per, current
+        )
+
     def is_on_cooldown(self, ctx: Context) -> bool:
         """Checks whether the command is currently on cooldown.
 
@@ -902,14 +933,16 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         -------
         :class:`bool`
             A boolean indicating if the command is on cooldown.
+
+        .. versionchanged:: 2.7
+            With a :attr:`~.Bot.cooldown_backend`, this relies on
+            :meth:`~.CooldownBackend.peek_retry_after`, use
+            :meth:`fetch_cooldown_retry_after` to query the backend.
         """
         if not self._buckets.valid:
             return False
 
-        bucket = self._buckets.get_bucket(ctx.message)
-        dt = ctx.message.edited_at or ctx.message.created_at
-        current = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
-        return bucket.get_tokens(current) == 0
+        return self._get_retry_after(ctx) > 0
 
     def reset_cooldown(self, ctx: Context) -> None:
         """Resets the cooldown on this command.
@@ -918,10 +951,19 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         ----------
         ctx: :class:`.Context`
             The invocation context to reset the cooldown under.
+
+        .. versionchanged:: 2.7
+            The bucket is also reset in the bot's :attr:`~.Bot.cooldown_backend`, if any.
+            That reset happens in the background, invocations of the command made by
+            this bot wait for it to complete.
         """
         if self._buckets.valid:
-            bucket = self._buckets.get_bucket(ctx.message)
-            bucket.reset()
+            backend = ctx.bot.cooldown_backend
+            if backend is not None:
+                backend._reset_later(ctx.bot.loop, self._backend_key(ctx))
+            else:
+                bucket = self._buckets.get_bucket(ctx.message)
+                bucket.reset()
 
     def get_cooldown_retry_after(self, ctx: Context) -> float:
         """Retrieves the amount of seconds before this command can be tried again.
@@ -938,15 +980,49 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         :class:`float`
             The amount of time left on this command's cooldown in seconds.
             If this is ``0.0`` then the command isn't on cooldown.
+
+        .. versionchanged:: 2.7
+            With a :attr:`~.Bot.cooldown_backend`, this relies on
+            :meth:`~.CooldownBackend.peek_retry_after`, use
+            :meth:`fetch_cooldown_retry_after` to query the backend.
         """
         if self._buckets.valid:
-            bucket = self._buckets.get_bucket(ctx.message)
-            dt = ctx.message.edited_at or ctx.message.created_at
-            current = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
-            return bucket.get_retry_after(current)
+            return self._get_retry_after(ctx)
 
         return 0.0
 
+    async def fetch_cooldown_retry_after(self, ctx: Context) -> float:
+        """|coro|
+
+        Retrieves the amount of seconds before this command can be tried again,
+        from the bot's :attr:`~.Bot.cooldown_backend` if it has one.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        ctx: :class:`.Context`
+            The invocation context to retrieve the cooldown from.
+
+        Returns
+        -------
+        :class:`float`
+            The amount of time left on this command's cooldown in seconds.
+            If this is ``0.0`` then the command isn't on cooldown.
+        """
+        backend = ctx.bot.cooldown_backend
+        if backend is None or not self._buckets.valid:
+            return self.get_cooldown_retry_after(ctx)
+
+        bucket = self._get_bucket(ctx)
+        if bucket is None:
+            return 0.0
+        dt = ctx.message.edited_at or ctx.message.created_at
+        current = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
+        return await backend._get_retry_after(
+            self._backend_key(ctx), bucket.rate, bucket.per, current
+        )
+
     async def invoke(self, ctx: Context) -> None:
         await self.prepare(ctx)
 
@@ -1223,6 +1299,10 @@ class GroupMixin(Generic[CogT]):
         objects.
     case_insensitive: :class:`bool`
         Whether the commands should be case-insensitive. Defaults to ``False``.
+
+        .. versionchanged:: 2.7
+            Can be changed after commands were added, which rebuilds the
+            index commands and subcommands are looked up in.
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -1230,9 +1310,34 @@ class GroupMixin(Generic[CogT]):
         self.prefixed_commands: dict[str, Command[CogT, Any, Any]] = (
             _CaseInsensitiveDict() if case_insensitive else {}
         )
-        self.case_insensitive: bool = case_insensitive
+        self._case_insensitive: bool = case_insensitive
         super().__init__(*args, **kwargs)
 
+    @property
+    def case_insensitive(self) -> bool:
+        return self._case_insensitive
+
+    @case_insensitive.setter
+    def case_insensitive(self, value: bool) -> None:
+        if value == self._case_insensitive:
+            return
+
+        # re-key the index from the original names, the keys of a
+        # case-insensitive index are casefolded
+        index: dict[str, Command[CogT, Any, Any]] = (
+            _CaseInsensitiveDict() if value else {}
+        )
+        for command in self.commands:
+            for name in (command.name, *command.aliases):
+                if name in index and index[name] is not command:
+                    raise CommandRegistrationError(
+                        name, alias_conflict=name != command.name
+                    )
+                index[name] = command
+
+        self.prefixed_commands = index
+        self._case_insensitive = value
+
     @property
     def all_commands(self):
         # merge app and prefixed commands
@@ -28,6 +28,7 @@ from __future__ import annotations
 import asyncio
 import concurrent.futures
 import logging
+import re
 import struct
 import sys
 import threading
@@ -43,6 +44,13 @@ from .activity import BaseActivity
 from .enums import SpeakingState
 from .errors import ConnectionClosed, InvalidArgument
 
+try:
+    import zstandard
+except ModuleNotFoundError:
+    HAS_ZSTD = False
+else:
+    HAS_ZSTD = True
+
 _log = logging.getLogger(__name__)
 
 __all__ = (
@@ -69,6 +77,113 @@ class WebSocketClosure(Exception):
 
 EventListener = namedtuple("EventListener", "predicate event result future")
 
+ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
+# Discord serializes dispatch payloads with "t" and "s" leading, which lets
+# the event type be read without decoding the rest of the payload
+_DISPATCH_HEADER = re.compile(rb'\{"t":"([A-Z_]+)","s":(\d+),')
+_DISPATCH_HEADER_STR = re.compile(r'\{"t":"([A-Z_]+)","s":(\d+),')
+
+
+class GatewayDecompressor:
+    """Base class for gateway transport compression contexts.
+
+    A context is created per websocket connection and fed every binary
+    message received. It returns the decompressed payload once a complete
+    one is available, which is handed to the JSON decoder as-is.
+
+    Subclasses must set :attr:`COMPRESSION_TYPE` to the value sent in the
+    ``compress`` query parameter of the gateway URL.
+    """
+
+    COMPRESSION_TYPE: str
+
+    def __init__(self):
+        self.compressed_bytes = 0
+        self.decompressed_bytes = 0
+
+    @property
+    def ratio(self) -> float:
+        """The ratio of decompressed to compressed bytes received so far."""
+        if not self.compressed_bytes:
+            return 1.0
+        return self.decompressed_bytes / self.compressed_bytes
+
+    def decompress(self, data: bytes, /) -> bytes | None:
+        raise NotImplementedError
+
+
+class ZlibStreamDecompressor(GatewayDecompressor):
+    COMPRESSION_TYPE = "zlib-stream"
+
+    def __init__(self):
+        super().__init__()
+        self._zlib = zlib.decompressobj()
+        self._buffer = bytearray()
+
+    def decompress(self, data: bytes, /) -> bytes | None:
+        self.compressed_bytes += len(data)
+        if not data.endswith(ZLIB_SUFFIX):
+            self._buffer.extend(data)
+            return None
+
+        # most payloads arrive in a single frame, in which case
+        # the frame is decompressed directly without buffering it first
+        if self._buffer:
+            self._buffer.extend(data)
+            msg = self._zlib.decompress(self._buffer)
+            self._buffer.clear()
+        else:
+            msg = self._zlib.decompress(data)
+
+        self.decompressed_bytes += len(msg)
+        return msg
+
+
+class ZstdStreamDecompressor(GatewayDecompressor):
+    COMPRESSION_TYPE = "zstd-stream"
+
+    def __init__(self):
+        super().__init__()
+        self._zstd = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes, /) -> bytes | None:
+        self.compressed_bytes += len(data)
+        msg = self._zstd.decompress(data)
+        if not msg:
+            return None
+
+        self.decompressed_bytes += len(msg)
+        return msg
+
+
+_DECOMPRESSORS: dict[str, type[GatewayDecompressor]] = {
+    ZlibStreamDecompressor.COMPRESSION_TYPE: ZlibStreamDecompressor,
+    ZstdStreamDecompressor.COMPRESSION_TYPE: ZstdStreamDecompressor,
+}
+
+
+def _resolve_decompressor(compression) -> type[GatewayDecompressor] | None:
+    if compression is None:
+        return None
+
+    if isinstance(compression, type) and issubclass(compression, GatewayDecompressor):
+        return compression
+
+    try:
+        cls = _DECOMPRESSORS[compression]
+    except KeyError:
+        raise InvalidArgument(
+            f"gateway_compression must be one of {', '.join(map(repr, _DECOMPRESSORS))}"
+            f" or None, not {compression!r}"
+        ) from None
+
+    if cls is ZstdStreamDecompressor and not HAS_ZSTD:
+        raise RuntimeError(
+            "zstandard library needed in order to use zstd-stream gateway compression"
+        )
+    return cls
+
 
 class GatewayRatelimiter:
     def __init__(self, count=110, per=60.0):
@@ -301,8 +416,9 @@ class DiscordWebSocket:
         self.session_id = None
         self.sequence = None
         self.resume_gateway_url = None
-        self._zlib = zlib.decompressobj()
-        self._buffer = bytearray()
+        # binary payloads are zlib compressed unless another transport
+        # compression is negotiated in from_client
+        self._decompressor: GatewayDecompressor = ZlibStreamDecompressor()
         self._close_code = None
         self._rate_limiter = GatewayRatelimiter()
 
@@ -313,7 +429,19 @@ class DiscordWebSocket:
     def is_ratelimited(self):
         return self._rate_limiter.is_ratelimited()
 
+    @property
+    def compression_ratio(self) -> float:
+        """The ratio of decompressed to compressed bytes received on this
+        connection. This is ``1.0`` if no compressed payload has been
+        received yet.
+
+        .. versionadded:: 2.7
+        """
+        return self._decompressor.ratio
+
     def debug_log_receive(self, data, /):
+        if type(data) is bytes:
+            data = data.decode("utf-8")
         self._dispatch("socket_raw_receive", data)
 
     def log_receive(self, _, /):
@@ -335,9 +463,14 @@ class DiscordWebSocket:
 
         This is for internal use only.
         """
-        gateway = gateway or await client.http.get_gateway()
+        decompressor = client._gateway_compression
+        gateway = gateway or await client.http.get_gateway(
+            compress=decompressor and decompressor.COMPRESSION_TYPE
+        )
         socket = await client.http.ws_connect(gateway)
         ws = cls(socket, loop=client.loop)
+        if decompressor is not None:
+            ws._decompressor = decompressor()
 
         # dynamically add attributes needed
         ws.token = client.http.token
@@ -453,15 +586,14 @@ class DiscordWebSocket:
 
     async def received_message(self, msg, /):
         if type(msg) is bytes:
-            self._buffer.extend(msg)
-
-            if len(msg) < 4 or msg[-4:] != b"\x00\x00\xff\xff":
+            msg = self._decompressor.decompress(msg)
+            if msg is None:
                 return
-            msg = self._zlib.decompress(self._buffer)
-            msg = msg.decode("utf-8")
-            self._buffer = bytearray()
 
         self.log_receive(msg)
+        if self._skip_unobserved(msg):
+            return
+
         msg = utils._from_json(msg)
 
         _log.debug("For Shard ID %s: WebSocket Event: %s", self.shard_id, msg)
@@ -579,6 +711,34 @@ class DiscordWebSocket:
         for index in reversed(removed):
             del self._dispatch_listeners[index]
 
+    def _skip_unobserved(self, msg, /) -> bool:
+        pattern = _DISPATCH_HEADER if type(msg) is bytes else _DISPATCH_HEADER_STR
+        match = pattern.match(msg)
+        if match is None:
+            return False
+
+        event, seq = match.groups()
+        if type(event) is bytes:
+            event = event.decode("ascii")
+
+        if not self._connection._is_event_skippable(event):
+            return False
+
+        for entry in self._dispatch_listeners:
+            if entry.event == event:
+                return False
+
+        _log.debug(
+            "For Shard ID %s: Skipping unobserved WebSocket Event: %s",
+            self.shard_id,
+            event,
+        )
+        self._dispatch("socket_event_type", event)
+        self.sequence = int(seq)
+        if self._keep_alive:
+            self._keep_alive.tick()
+        return True
+
     @property
     def latency(self) -> float:
         """Measures latency between a HEARTBEAT and a HEARTBEAT_ACK in seconds. If no heartbeat
@@ -946,6 +1106,7 @@ class DiscordVoiceWebSocket:
     async def load_secret_key(self, data):
         _log.info("received secret key for voice connection")
         self.secret_key = self._connection.secret_key = data.get("secret_key")
+        self._connection._update_packetizer()
         await self.speak()
         await self.speak(False)
 
@@ -31,7 +31,9 @@ from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    Iterable,
     List,
+    MutableMapping,
     NamedTuple,
     Optional,
     Sequence,
@@ -43,6 +45,7 @@ from typing import (
 from . import abc, utils
 from .asset import Asset
 from .automod import AutoModAction, AutoModRule, AutoModTriggerMetadata
+from .cache import NameIndex, PermissionCache
 from .channel import *
 from .channel import _guild_channel_factory, _threaded_guild_channel_factory
 from .colour import Colour
@@ -74,7 +77,7 @@ from .iterators import (
     EntitlementIterator,
     MemberIterator,
 )
-from .member import Member, VoiceState
+from .member import CompactMemberStore, Member, VoiceState
 from .mixins import Hashable
 from .monetization import Entitlement
 from .onboarding import Onboarding
@@ -268,6 +271,8 @@ class Guild(Hashable):
         "nsfw_level",
         "_scheduled_events",
         "_members",
+        "_member_names",
+        "_permission_cache",
         "_channels",
         "_icon",
         "_banner",
@@ -302,11 +307,15 @@ class Guild(Hashable):
         # the attr doesn't exist? it has something to do with the order
         # of the attr in __slots__
 
-        self._channels: dict[int, GuildChannel] = {}
-        self._members: dict[int, Member] = {}
+        self._channels: MutableMapping[int, GuildChannel] = state._new_cache("channels")
+        self._members: MutableMapping[int, Member] = state._new_cache("members")
+        self._member_names: NameIndex | None = NameIndex() if state.name_index else None
+        self._permission_cache: PermissionCache | None = (
+            PermissionCache() if state.cache_permissions else None
+        )
         self._scheduled_events: dict[int, ScheduledEvent] = {}
         self._voice_states: dict[int, VoiceState] = {}
-        self._threads: dict[int, Thread] = {}
+        self._threads: MutableMapping[int, Thread] = state._new_cache("threads")
         self._state: ConnectionState = state
         self._from_data(data)
 
@@ -321,6 +330,21 @@ class Guild(Hashable):
 
     def _add_member(self, member: Member, /) -> None:
         self._members[member.id] = member
+        if self._member_names is not None:
+            self._member_names.add(
+                member.id, member.name, member.nick, member.global_name
+            )
+
+    def _reindex_member(self, user_id: int, /) -> None:
+        if self._member_names is None or user_id not in self._member_names:
+            return
+        member = self._members.get(user_id)
+        if member is None:
+            self._member_names.remove(user_id)
+        else:
+            self._member_names.add(
+                member.id, member.name, member.nick, member.global_name
+            )
 
     def _get_and_update_member(
         self, payload: MemberPayload, user_id: int, cache_flag: bool, /
@@ -329,7 +353,9 @@ class Guild(Hashable):
         # flag should always be MemberCacheFlag.interaction) is set to True
         if user_id in self._members:
             member = self.get_member(user_id)
-            member._update(payload) if cache_flag else None
+            if cache_flag:
+                member._update(payload)
+                self._add_member(member)
         else:
             # NOTE:
             # This is a fallback in case the member is not found in the guild's members.
@@ -337,7 +363,7 @@ class Guild(Hashable):
             # class will be incorrect such as status and activities.
             member = Member(guild=self, state=self._state, data=payload)  # type: ignore
             if cache_flag:
-                self._members[user_id] = member
+                self._add_member(member)
         return member
 
     def _store_thread(self, payload: ThreadPayload, /) -> Thread:
@@ -347,6 +373,8 @@ class Guild(Hashable):
 
     def _remove_member(self, member: Snowflake, /) -> None:
         self._members.pop(member.id, None)
+        if self._member_names is not None:
+            self._member_names.remove(member.id)
 
     def _add_scheduled_event(self, event: ScheduledEvent, /) -> None:
         self._scheduled_events[event.id] = event
@@ -434,10 +462,12 @@ class Guild(Hashable):
             r.position += not r.is_default()
 
         self._roles[role.id] = role
+        self._invalidate_permissions()
 
     def _remove_role(self, role_id: int, /) -> Role:
         # this raises KeyError if it fails.
         role = self._roles.pop(role_id)
+        self._invalidate_permissions()
 
         # since it didn't, we can change the positions now
         # basically the same as above except we only decrement
@@ -447,6 +477,10 @@ class Guild(Hashable):
 
         return role
 
+    def _invalidate_permissions(self) -> None:
+        if self._permission_cache is not None:
+            self._permission_cache.invalidate()
+
     def _from_data(self, guild: GuildPayload) -> None:
         member_count = guild.get("member_count")
         # Either the payload includes member_count, or it hasn't been set yet.
@@ -516,6 +550,14 @@ class Guild(Hashable):
             stage_instance = StageInstance(guild=self, data=s, state=state)
             self._stage_instances[stage_instance.id] = stage_instance
 
+        threshold = state.compact_member_threshold
+        if (
+            threshold is not None
+            and not isinstance(self._members, CompactMemberStore)
+            and (self._member_count or 0) >= threshold
+        ):
+            self._members = CompactMemberStore(self, self._members.values())
+
         cache_joined = self._state.member_cache_flags.joined
         self_id = self._state.self_id
         for mdata in guild.get("members", []):
@@ -550,6 +592,9 @@ class Guild(Hashable):
         for obj in guild.get("voice_states", []):
             self._update_voice_state(obj, int(obj["channel_id"]))
 
+        # the roles or the owner may have changed
+        self._invalidate_permissions()
+
     # TODO: refactor/remove?
     def _sync(self, data: GuildPayload) -> None:
         try:
@@ -563,6 +608,7 @@ class Guild(Hashable):
             member = self.get_member(user_id)
             if member is not None:
                 member._presence_update(presence, empty_tuple)  # type: ignore
+                self._add_member(member)
 
         if "channels" in data:
             channels = data["channels"]
@@ -845,9 +891,25 @@ class Guild(Hashable):
 
     @property
     def members(self) -> list[Member]:
-        """A list of members that belong to this guild."""
+        """A list of members that belong to this guild.
+
+        .. note::
+
+            When the guild stores its members compactly, as configured by the
+            ``compact_member_threshold`` client option, this builds every member
+            not recently accessed on each call.
+        """
         return list(self._members.values())
 
+    @property
+    def permission_cache(self) -> PermissionCache | None:
+        """The cache of resolved channel permissions of this guild, exposing its hit
+        and miss counters, if the ``cache_permissions`` client option is enabled.
+
+        .. versionadded:: 2.7
+        """
+        return self._permission_cache
+
     def get_member(self, user_id: int, /) -> Member | None:
         """Returns a member with the given ID.
 
@@ -1058,7 +1120,6 @@ class Guild(Hashable):
         """
 
         result = None
-        members = self.members
         if len(name) > 5 and name[-5] == "#":
             # The 5 length is checking to see if #0000 is in the string,
             # as a#0000 has a length of 6, the minimum for a potential
@@ -1068,12 +1129,33 @@ class Guild(Hashable):
             # do the actual lookup and return if found
             # if it isn't found then we'll do a full name lookup below.
             result = utils.get(
-                members, name=name[:-5], discriminator=potential_discriminator
+                self._members_named(name[:-5]),
+                name=name[:-5],
+                discriminator=potential_discriminator,
             )
             if result is not None:
                 return result
 
-        return utils.find(lambda m: name in (m.nick, m.name, m.global_name), members)
+        return utils.find(
+            lambda m: name in (m.nick, m.name, m.global_name),
+            self._members_named(name),
+        )
+
+    def _members_named(self, name: str, /) -> Iterable[Member]:
+        # the cached members that may have the name, narrowed down
+        # through the name index when it is enabled
+        if self._member_names is None:
+            return self.members
+        members = []
+        for member_id in self._member_names.get(name):
+            member = self._members.get(member_id)
+            if member is None:
+                # dropped by a bounded members cache without going
+                # through _remove_member
+                self._member_names.remove(member_id)
+            else:
+                members.append(member)
+        return members
 
     def _create_channel(
         self,
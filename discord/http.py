@@ -28,7 +28,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
-import weakref
 from typing import TYPE_CHECKING, Any, Coroutine, Iterable, Sequence, TypeVar
 from urllib.parse import quote as _uriquote
 
@@ -45,6 +44,7 @@ from .errors import (
     NotFound,
 )
 from .gateway import DiscordClientWebSocketResponse
+from .ratelimits import InMemoryRatelimitStore
 from .utils import MISSING, warn_deprecated
 
 _log = logging.getLogger(__name__)
@@ -54,6 +54,7 @@ if TYPE_CHECKING:
 
     from .enums import AuditLogAction, InteractionResponseType
     from .file import File
+    from .ratelimits import RatelimitStore
     from .types import (
         appinfo,
         application_role_connection,
@@ -85,8 +86,6 @@ if TYPE_CHECKING:
     from .types.snowflake import Snowflake, SnowflakeList
 
     T = TypeVar("T")
-    BE = TypeVar("BE", bound=BaseException)
-    MU = TypeVar("MU", bound="MaybeUnlock")
     Response = Coroutine[Any, Any, T]
 
 API_VERSION: int = 10
@@ -123,6 +122,7 @@ class Route:
         self.guild_id: Snowflake | None = parameters.get("guild_id")
         self.webhook_id: Snowflake | None = parameters.get("webhook_id")
         self.webhook_token: str | None = parameters.get("webhook_token")
+        self.is_interaction: bool = "interaction_token" in parameters
 
     @property
     def base(self) -> str:
@@ -133,26 +133,16 @@ class Route:
         # the bucket is just method + path w/ major parameters
         return f"{self.channel_id}:{self.guild_id}:{self.path}"
 
+    @property
+    def key(self) -> str:
+        # the key used to find the bucket hash Discord assigned to this route
+        return f"{self.method} {self.path}"
 
-class MaybeUnlock:
-    def __init__(self, lock: asyncio.Lock) -> None:
-        self.lock: asyncio.Lock = lock
-        self._unlock: bool = True
-
-    def __enter__(self: MU) -> MU:
-        return self
-
-    def defer(self) -> None:
-        self._unlock = False
-
-    def __exit__(
-        self,
-        exc_type: type[BE] | None,
-        exc: BE | None,
-        traceback: TracebackType | None,
-    ) -> None:
-        if self._unlock:
-            self.lock.release()
+    @property
+    def major_parameters(self) -> str:
+        return (
+            f"{self.channel_id}:{self.guild_id}:{self.webhook_id}:{self.webhook_token}"
+        )
 
 
 # For some reason, the Discord voice websocket expects this header to be
@@ -171,15 +161,26 @@ class HTTPClient:
         proxy_auth: aiohttp.BasicAuth | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
         unsync_clock: bool = True,
+        max_global_requests: int | None = None,
+        ratelimit_store: RatelimitStore | None = None,
     ) -> None:
         self.loop: asyncio.AbstractEventLoop = (
             asyncio.get_event_loop() if loop is None else loop
         )
         self.connector = connector
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
-        self._locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
-        self._global_over: asyncio.Event = asyncio.Event()
-        self._global_over.set()
+        if ratelimit_store is None:
+            ratelimit_store = InMemoryRatelimitStore(
+                max_global_requests=(
+                    50 if max_global_requests is None else max_global_requests
+                )
+            )
+        elif max_global_requests is not None:
+            raise TypeError(
+                "max_global_requests cannot be used with ratelimit_store, "
+                "pass it to the store instead."
+            )
+        self.ratelimit_store: RatelimitStore = ratelimit_store
         self.token: str | None = None
         self.bot_token: bool = False
         self.proxy: str | None = proxy
@@ -223,16 +224,10 @@ class HTTPClient:
         form: Iterable[dict[str, Any]] | None = None,
         **kwargs: Any,
     ) -> Any:
-        bucket = route.bucket
+        store = self.ratelimit_store
         method = route.method
         url = route.url
 
-        lock = self._locks.get(bucket)
-        if lock is None:
-            lock = asyncio.Lock()
-            if bucket is not None:
-                self._locks[bucket] = lock
-
         # header creation
         headers: dict[str, str] = {
             "User-Agent": self.user_agent,
@@ -263,14 +258,16 @@ class HTTPClient:
         if self.proxy_auth is not None:
             kwargs["proxy_auth"] = self.proxy_auth
 
-        if not self._global_over.is_set():
-            # wait until the global lock is complete
-            await self._global_over.wait()
-
         response: aiohttp.ClientResponse | None = None
         data: dict[str, Any] | str | None = None
-        await lock.acquire()
-        with MaybeUnlock(lock) as maybe_lock:
+        # the rate limit headers of the last response, sent along with the
+        # release of the bucket unless a retry needs them earlier
+        ratelimit_update: tuple[int, int, float] | None = None
+        # interaction endpoints are not bound to the global rate limit
+        bucket_hash, bucket = await store.acquire_request(
+            route.key, route.major_parameters, not route.is_interaction
+        )
+        try:
             for tries in range(5):
                 if files:
                     for f in files:
@@ -282,6 +279,10 @@ class HTTPClient:
                         form_data.add_field(**params)
                     kwargs["data"] = form_data
 
+                # the first try acquired the global rate limit along with the bucket
+                if tries and not route.is_interaction:
+                    await store.acquire_global()
+
                 try:
                     async with self.__session.request(
                         method, url, **kwargs
@@ -298,22 +299,38 @@ class HTTPClient:
                         data = await json_or_text(response)
 
                         # check if we have rate limit header information
-                        remaining = response.headers.get("X-Ratelimit-Remaining")
-                        if remaining == "0" and response.status != 429:
-                            # we've depleted our current bucket
+                        headers = response.headers
+                        new_hash = headers.get("X-Ratelimit-Bucket")
+                        if new_hash is not None and new_hash != bucket_hash:
+                            bucket_hash = new_hash
+                            # carry the state of the bucket over, so requests
+                            # made on the new one don't start from scratch
+                            await store.set_bucket_hash(
+                                route.key,
+                                bucket_hash,
+                                (bucket, f"{bucket_hash}:{route.major_parameters}"),
+                            )
+
+                        remaining = headers.get("X-Ratelimit-Remaining")
+                        if remaining is not None:
                             delta = utils._parse_ratelimit_header(
                                 response, use_clock=self.use_clock
                             )
-                            _log.debug(
-                                (
-                                    "A rate limit bucket has been exhausted (bucket:"
-                                    " %s, retry: %s)."
-                                ),
-                                bucket,
+                            ratelimit_update = (
+                                int(headers.get("X-Ratelimit-Limit", 1)),
+                                int(remaining),
                                 delta,
                             )
-                            maybe_lock.defer()
-                            self.loop.call_later(delta, lock.release)
+                            if remaining == "0" and response.status != 429:
+                                # we've depleted our current bucket
+                                _log.debug(
+                                    (
+                                        "A rate limit bucket has been exhausted"
+                                        " (bucket: %s, retry: %s)."
+                                    ),
+                                    bucket,
+                                    delta,
+                                )
 
                         # the request was successful so just return the text/json
                         if 300 > response.status >= 200:
@@ -345,21 +362,23 @@ class HTTPClient:
                                     ),
                                     retry_after,
                                 )
-                                self._global_over.clear()
+                                await store.set_global_ratelimit(retry_after)
+
+                            if ratelimit_update is not None:
+                                await store.update(bucket, *ratelimit_update)
+                                ratelimit_update = None
 
                             await asyncio.sleep(retry_after)
                             _log.debug("Done sleeping for the rate limit. Retrying...")
 
-                            # release the global lock now that the
-                            # global rate limit has passed
-                            if is_global:
-                                self._global_over.set()
-                                _log.debug("Global rate limit is now over.")
-
                             continue
 
                         # we've received a 500, 502, 503, or 504, unconditional retry
                         if response.status in {500, 502, 503, 504}:
+                            if ratelimit_update is not None:
+                                await store.update(bucket, *ratelimit_update)
+                                ratelimit_update = None
+
                             await asyncio.sleep(1 + tries * 2)
                             continue
 
@@ -389,6 +408,8 @@ class HTTPClient:
                 raise HTTPException(response, data)
 
             raise RuntimeError("Unreachable code in HTTP handling")
+        finally:
+            await store.release(bucket, ratelimit_update)
 
     async def get_from_cdn(self, url: str) -> bytes:
         async with self.__session.get(url) as resp:
@@ -406,6 +427,7 @@ class HTTPClient:
     async def close(self) -> None:
         if self.__session:
             await self.__session.close()
+        await self.ratelimit_store.close()
 
     # login management
 
@@ -3148,30 +3170,44 @@ class HTTPClient:
             )
         )
 
-    async def get_gateway(self, *, encoding: str = "json", zlib: bool = True) -> str:
+    @staticmethod
+    def _gateway_url(
+        url: str, encoding: str, compress: str | None, zlib: bool | None
+    ) -> str:
+        if zlib is not None:
+            warn_deprecated("zlib", "compress", "2.7", stacklevel=4)
+            compress = "zlib-stream" if zlib else None
+        if compress:
+            value = "{0}?encoding={1}&v={2}&compress={3}"
+        else:
+            value = "{0}?encoding={1}&v={2}"
+        return value.format(url, encoding, API_VERSION, compress)
+
+    async def get_gateway(
+        self,
+        *,
+        encoding: str = "json",
+        compress: str | None = "zlib-stream",
+        zlib: bool | None = None,
+    ) -> str:
         try:
             data = await self.request(Route("GET", "/gateway"))
         except HTTPException as exc:
             raise GatewayNotFound() from exc
-        if zlib:
-            value = "{0}?encoding={1}&v={2}&compress=zlib-stream"
-        else:
-            value = "{0}?encoding={1}&v={2}"
-        return value.format(data["url"], encoding, API_VERSION)
+        return self._gateway_url(data["url"], encoding, compress, zlib)
 
     async def get_bot_gateway(
-        self, *, encoding: str = "json", zlib: bool = True
+        self,
+        *,
+        encoding: str = "json",
+        compress: str | None = "zlib-stream",
+        zlib: bool | None = None,
     ) -> tuple[int, str]:
         try:
             data = await self.request(Route("GET", "/gateway/bot"))
         except HTTPException as exc:
             raise GatewayNotFound() from exc
-
-        if zlib:
-            value = "{0}?encoding={1}&v={2}&compress=zlib-stream"
-        else:
-            value = "{0}?encoding={1}&v={2}"
-        return data["shards"], value.format(data["url"], encoding, API_VERSION)
+        return data["shards"], self._gateway_url(data["url"], encoding, compress, zlib)
 
     def get_user(self, user_id: Snowflake) -> Response[user.User]:
         return self.request(Route("GET", "/users/{user_id}", user_id=user_id))
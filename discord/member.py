@@ -25,12 +25,24 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import array
 import datetime
 import inspect
 import itertools
 import sys
+from bisect import bisect_left
+from collections import OrderedDict
 from operator import attrgetter
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    MutableSequence,
+    TypeVar,
+    Union,
+)
 
 import discord.abc
 
@@ -65,6 +77,7 @@ if TYPE_CHECKING:
     from .types.user import User as UserPayload
     from .types.voice import GuildVoiceState as GuildVoiceStatePayload
     from .types.voice import VoiceState as VoiceStatePayload
+    from .user import ClientUser
 
     VocalGuildChannel = Union[VoiceChannel, StageChannel]
 
@@ -1155,3 +1168,656 @@ class Member(discord.abc.Messageable, _UserTag):
             The role or ``None`` if not found in the member's roles.
         """
         return self.guild.get_role(role_id) if self._roles.has(role_id) else None
+
+
+_NO_TIME = -(2**63)
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+# the client_status keys and values packed into 4 bits each, anything
+# else makes the whole mapping fall back to being stored as is
+_CLIENT_STATUS_KEYS = (None, "desktop", "mobile", "web")
+_STATUS_VALUES = (None, "online", "idle", "dnd", "offline", "invisible")
+_STATUS_CODES = {value: code for code, value in enumerate(_STATUS_VALUES)}
+
+_HASH_NONE = 0
+_HASH_STATIC = 1
+_HASH_ANIMATED = 2
+_HASH_OTHER = 3
+_HASH_SIZE = 17
+
+_DISCRIMINATOR_OTHER = 0xFFFF
+
+_PENDING = 1 << 0
+_BOT = 1 << 1
+_SYSTEM = 1 << 2
+
+
+def _pack_time(dt: datetime.datetime | None) -> int:
+    if dt is None:
+        return _NO_TIME
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _unpack_time(value: int) -> datetime.datetime | None:
+    if value == _NO_TIME:
+        return None
+    return _EPOCH + datetime.timedelta(microseconds=value)
+
+
+class _StringColumn:
+    """A column of optional strings stored UTF-8 encoded in a shared buffer."""
+
+    __slots__ = ("_data", "_offsets", "_lengths", "_wasted")
+
+    NONE = 0xFFFF
+
+    def __init__(self) -> None:
+        self._data: bytearray = bytearray()
+        self._offsets: array.array[int] = array.array("I")
+        self._lengths: array.array[int] = array.array("H")
+        self._wasted: int = 0
+
+    def __getitem__(self, row: int) -> str | None:
+        length = self._lengths[row]
+        if length == self.NONE:
+            return None
+        offset = self._offsets[row]
+        return self._data[offset : offset + length].decode()
+
+    def __setitem__(self, row: int, value: str | None) -> None:
+        old = self._lengths[row]
+        if old == self.NONE:
+            old = 0
+        if value is None:
+            self._lengths[row] = self.NONE
+            self._wasted += old
+            return
+
+        encoded = value.encode()
+        length = len(encoded)
+        if length <= old:
+            offset = self._offsets[row]
+            self._data[offset : offset + length] = encoded
+            self._wasted += old - length
+        else:
+            self._offsets[row] = len(self._data)
+            self._data += encoded
+            self._wasted += old
+        self._lengths[row] = length
+
+        if self._wasted > 4096 and self._wasted * 2 > len(self._data):
+            self._compact()
+
+    def append(self, value: str | None) -> None:
+        self._offsets.append(0)
+        self._lengths.append(self.NONE)
+        self[len(self._lengths) - 1] = value
+
+    def move(self, source: int, destination: int) -> None:
+        # the destination's string must have been released already
+        self._offsets[destination] = self._offsets[source]
+        self._lengths[destination] = self._lengths[source]
+
+    def pop(self) -> None:
+        self._offsets.pop()
+        self._lengths.pop()
+
+    def _compact(self) -> None:
+        old = self._data
+        data = bytearray()
+        for row, (offset, length) in enumerate(zip(self._offsets, self._lengths)):
+            if length != self.NONE:
+                self._offsets[row] = len(data)
+                data += old[offset : offset + length]
+        self._data = data
+        self._wasted = 0
+
+
+class _IdIndex:
+    """Maps user IDs to integers through a sorted array, with recently added
+    keys kept in a dict until they are merged into it in bulk. Removed keys
+    are marked as such in place and dropped on the next merge.
+    """
+
+    __slots__ = ("_ids", "_values", "_pending", "_removed", "_typecode", "_dead")
+
+    def __init__(self, typecode: str) -> None:
+        self._typecode: str = typecode
+        self._dead: int = (1 << (array.array(typecode).itemsize * 8)) - 1
+        self._ids: array.array[int] = array.array("Q")
+        self._values: array.array[int] = array.array(typecode)
+        self._pending: dict[int, int] = {}
+        self._removed: int = 0
+
+    def get(self, key: int) -> int | None:
+        value = self._pending.get(key)
+        if value is not None:
+            return value
+        ids = self._ids
+        i = bisect_left(ids, key)
+        if i != len(ids) and ids[i] == key:
+            value = self._values[i]
+            if value != self._dead:
+                return value
+        return None
+
+    def set(self, key: int, value: int) -> None:
+        if key not in self._pending:
+            ids = self._ids
+            i = bisect_left(ids, key)
+            if i != len(ids) and ids[i] == key:
+                if self._values[i] == self._dead:
+                    self._removed -= 1
+                self._values[i] = value
+                return
+        self._pending[key] = value
+        self._maybe_merge()
+
+    def remove(self, key: int) -> None:
+        if self._pending.pop(key, None) is not None:
+            return
+        ids = self._ids
+        i = bisect_left(ids, key)
+        if i != len(ids) and ids[i] == key and self._values[i] != self._dead:
+            self._values[i] = self._dead
+            self._removed += 1
+            self._maybe_merge()
+
+    def _maybe_merge(self) -> None:
+        if len(self._pending) + self._removed > max(256, len(self._ids) // 8):
+            self._merge()
+
+    def _merge(self) -> None:
+        dead = self._dead
+        entries = sorted(
+            itertools.chain(
+                (entry for entry in zip(self._ids, self._values) if entry[1] != dead),
+                self._pending.items(),
+            )
+        )
+        self._ids = array.array("Q", [key for key, _ in entries])
+        self._values = array.array(self._typecode, [value for _, value in entries])
+        self._pending.clear()
+        self._removed = 0
+
+
+class _CompactUsers:
+    """Finds the users kept in the :class:`CompactMemberStore` of any guild.
+
+    Each user ID maps to the number of stores holding the user and to the ID
+    of one of them. When that guild drops the user while others still hold
+    them, the owner is forgotten and looked up again on the next access, so
+    removing members never has to search the other guilds.
+    """
+
+    def __init__(self) -> None:
+        self.stores: dict[int, CompactMemberStore] = {}
+        self._counts: _IdIndex = _IdIndex("I")
+        self._owners: _IdIndex = _IdIndex("Q")
+
+    def add_store(self, store: CompactMemberStore) -> None:
+        old = self.stores.get(store.guild.id)
+        self.stores[store.guild.id] = store
+        if old is not None and old is not store:
+            self.remove_all(old)
+
+    def remove_store(self, guild_id: int) -> None:
+        store = self.stores.pop(guild_id, None)
+        if store is not None:
+            self.remove_all(store)
+
+    def add(self, user_id: int, guild_id: int) -> None:
+        self._counts.set(user_id, (self._counts.get(user_id) or 0) + 1)
+        if self._owners.get(user_id) is None:
+            self._owners.set(user_id, guild_id)
+
+    def remove(self, user_id: int, guild_id: int) -> None:
+        count = self._counts.get(user_id)
+        if count is None:
+            return
+        if count <= 1:
+            self._counts.remove(user_id)
+            self._owners.remove(user_id)
+            return
+
+        self._counts.set(user_id, count - 1)
+        if self._owners.get(user_id) == guild_id:
+            self._owners.remove(user_id)
+
+    def remove_all(self, store: CompactMemberStore) -> None:
+        guild_id = store.guild.id
+        for user_id in store._ids:
+            self.remove(user_id, guild_id)
+
+    def get_user(self, user_id: int) -> User | None:
+        guild_id = self._owners.get(user_id)
+        if guild_id is not None:
+            store = self.stores.get(guild_id)
+            return None if store is None else store.get_user(user_id)
+
+        if self._counts.get(user_id) is None:
+            return None
+        # the guild that owned the user dropped them, hand them over
+        for store in self.stores.values():
+            if user_id in store:
+                self._owners.set(user_id, store.guild.id)
+                return store.get_user(user_id)
+        return None
+
+
+class CompactMemberStore(MutableMapping[int, Member]):
+    """A mapping of user IDs to members of a guild holding them in
+    array-backed columns instead of as :class:`Member` objects.
+
+    The most recently used members, and the client's own member, are kept as
+    objects, so that they are returned as the same object on every access.
+    Other members are materialized from the columns when accessed, and any
+    change made to a member object is written back to the columns when it
+    stops being kept. The users of stored members are taken out of the user
+    cache and are rebuilt from the store as well.
+    """
+
+    def __init__(
+        self, guild: Guild, members: Iterable[Member] = (), *, recent: int = 1024
+    ) -> None:
+        self.guild: Guild = guild
+        self._state: ConnectionState = guild._state
+        self._recent_size: int = recent
+        self._users: _CompactUsers = guild._state._compact_users
+        self._reset()
+        self._users.add_store(self)
+
+        for member in members:
+            self[member.id] = member
+
+    def _reset(self) -> None:
+        # user ID -> row
+        self._rows: _IdIndex = _IdIndex("I")
+        # members handed out recently, in order of use
+        self._recent: OrderedDict[int, Member] = OrderedDict()
+        self._me: Member | None = None
+
+        self._ids: array.array[int] = array.array("Q")
+        self._joined_at: array.array[int] = array.array("q")
+        self._flags: array.array[int] = array.array("I")
+        self._discriminators: array.array[int] = array.array("H")
+        self._public_flags: array.array[int] = array.array("I")
+        self._bits: array.array[int] = array.array("B")
+        self._status: array.array[int] = array.array("H")
+        self._role_start: array.array[int] = array.array("I")
+        self._role_count: array.array[int] = array.array("H")
+        self._avatars: bytearray = bytearray()
+        self._names: _StringColumn = _StringColumn()
+        self._global_names: _StringColumn = _StringColumn()
+
+        # role IDs of all members, rows own a slice of it
+        self._roles: array.array[int] = array.array("Q")
+        self._wasted_roles: int = 0
+
+        # rarely set fields, keyed by user ID
+        self._nicks: dict[int, str] = {}
+        self._premium_since: dict[int, datetime.datetime] = {}
+        self._timed_out_until: dict[int, datetime.datetime] = {}
+        self._other_discriminators: dict[int, str] = {}
+        self._member_assets: dict[int, tuple[str | None, str | None]] = {}
+        self._user_extras: dict[int, tuple[Any, Any, Any]] = {}
+        self._other_avatars: dict[int, str] = {}
+        self._client_statuses: dict[int, dict[str | None, str]] = {}
+        self._activities: dict[int, tuple[ActivityTypes, ...]] = {}
+
+    def _columns(self) -> tuple[array.array[int], ...]:
+        return (
+            self._ids,
+            self._joined_at,
+            self._flags,
+            self._discriminators,
+            self._public_flags,
+            self._bits,
+            self._status,
+            self._role_start,
+            self._role_count,
+        )
+
+    def _find(self, user_id: int) -> int | None:
+        return self._rows.get(user_id)
+
+    def _keep(self, member: Member) -> Member:
+        user_id = member.id
+        if user_id == self._state.self_id:
+            self._me = member
+            return member
+
+        recent = self._recent
+        recent[user_id] = member
+        recent.move_to_end(user_id)
+        if len(recent) > self._recent_size:
+            old_id, old = recent.popitem(last=False)
+            # keep changes made to the object since it was handed out
+            row = self._find(old_id)
+            if row is not None:
+                self._store(old_id, row, old)
+        return member
+
+    def _kept(self, user_id: int) -> Member | None:
+        me = self._me
+        if me is not None and me.id == user_id:
+            return me
+        member = self._recent.get(user_id)
+        if member is not None:
+            self._recent.move_to_end(user_id)
+        return member
+
+    def _forget(self, user_id: int) -> None:
+        self._recent.pop(user_id, None)
+        if self._me is not None and self._me.id == user_id:
+            self._me = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids.tolist())
+
+    def __contains__(self, user_id: object) -> bool:
+        return isinstance(user_id, int) and self._find(user_id) is not None
+
+    def __getitem__(self, user_id: int) -> Member:
+        member = self.get(user_id, MISSING)
+        if member is MISSING:
+            raise KeyError(user_id)
+        return member
+
+    def get(self, user_id: int, default: Any = None) -> Any:
+        member = self._kept(user_id)
+        if member is not None:
+            return member
+        row = self._find(user_id)
+        if row is None:
+            return default
+        return self._keep(self._member_at(row))
+
+    def values(self) -> list[Member]:  # type: ignore
+        # members not kept as objects are materialized without being kept,
+        # so that listing every member doesn't churn the recent members
+        me = self._me
+        recent = self._recent
+        members = []
+        for row, user_id in enumerate(self._ids):
+            member = recent.get(user_id)
+            if member is None:
+                if me is not None and me.id == user_id:
+                    member = me
+                else:
+                    member = self._member_at(row)
+            members.append(member)
+        return members
+
+    def pop(self, user_id: int, default: Any = MISSING) -> Any:
+        row = self._find(user_id)
+        if row is None:
+            if default is MISSING:
+                raise KeyError(user_id)
+            return default
+        member = self._kept(user_id) or self._member_at(row)
+        self._remove_row(user_id, row)
+        return member
+
+    def __delitem__(self, user_id: int) -> None:
+        row = self._find(user_id)
+        if row is None:
+            raise KeyError(user_id)
+        self._remove_row(user_id, row)
+
+    def clear(self) -> None:
+        self._users.remove_all(self)
+        self._reset()
+
+    def __setitem__(self, user_id: int, member: Member) -> None:
+        row = self._find(user_id)
+        if row is None:
+            row = len(self._ids)
+            for column in self._columns():
+                column.append(0)
+            self._names.append(None)
+            self._global_names.append(None)
+            self._avatars.extend(bytes(_HASH_SIZE))
+            self._ids[row] = user_id
+            self._rows.set(user_id, row)
+            self._users.add(user_id, self.guild.id)
+
+        self._store(user_id, row, member)
+        self._keep(member)
+
+    def _store(self, user_id: int, row: int, member: Member) -> None:
+        user = member._user
+        self._names[row] = user.name
+        self._global_names[row] = user.global_name
+        self._joined_at[row] = _pack_time(member.joined_at)
+        self._set_sparse(self._premium_since, user_id, member.premium_since)
+        self._set_sparse(
+            self._timed_out_until, user_id, member.communication_disabled_until
+        )
+        self._flags[row] = member.flags.value
+        self._public_flags[row] = user._public_flags
+        self._bits[row] = (
+            (_PENDING if member.pending else 0)
+            | (_BOT if user.bot else 0)
+            | (_SYSTEM if user.system else 0)
+        )
+        self._set_roles(row, member._roles)
+        self._set_status(user_id, row, member._client_status)
+        self._set_avatar(user_id, row, user._avatar)
+
+        self._set_sparse(self._nicks, user_id, member.nick)
+        self._set_discriminator(user_id, row, user.discriminator)
+        self._set_sparse(self._activities, user_id, member.activities)
+        assets = (member._avatar, member._banner)
+        self._set_sparse(self._member_assets, user_id, assets if any(assets) else None)
+        extras = (user._banner, user._accent_colour, user._avatar_decoration)
+        self._set_sparse(
+            self._user_extras,
+            user_id,
+            extras if any(e is not None for e in extras) else None,
+        )
+
+        # the store now owns the user's data
+        state = self._state
+        if isinstance(user, User) and state._users.get(user_id) is user:
+            user._stored = False
+            state.deref_user(user_id)
+
+    @staticmethod
+    def _set_sparse(mapping: dict[int, Any], user_id: int, value: Any) -> None:
+        if value:
+            mapping[user_id] = value
+        else:
+            mapping.pop(user_id, None)
+
+    def _set_roles(self, row: int, roles: Iterable[int]) -> None:
+        new = array.array("Q", roles)
+        start = self._role_start[row]
+        count = self._role_count[row]
+        if len(new) <= count:
+            self._roles[start : start + len(new)] = new
+            self._wasted_roles += count - len(new)
+        else:
+            self._role_start[row] = len(self._roles)
+            self._roles.extend(new)
+            self._wasted_roles += count
+        self._role_count[row] = len(new)
+
+        if self._wasted_roles > 1024 and self._wasted_roles * 2 > len(self._roles):
+            self._compact_roles()
+
+    def _compact_roles(self) -> None:
+        old = self._roles
+        roles = array.array("Q")
+        for row, (start, count) in enumerate(zip(self._role_start, self._role_count)):
+            self._role_start[row] = len(roles)
+            roles.extend(old[start : start + count])
+        self._roles = roles
+        self._wasted_roles = 0
+
+    def _set_status(
+        self, user_id: int, row: int, client_status: dict[str | None, str]
+    ) -> None:
+        packed = 0
+        try:
+            for key, value in client_status.items():
+                shift = _CLIENT_STATUS_KEYS.index(key) * 4
+                packed |= _STATUS_CODES[value] << shift
+        except (ValueError, KeyError):
+            self._client_statuses[user_id] = client_status.copy()
+        else:
+            self._client_statuses.pop(user_id, None)
+        self._status[row] = packed
+
+    def _get_status(self, user_id: int, row: int) -> dict[str | None, str]:
+        try:
+            return self._client_statuses[user_id].copy()
+        except KeyError:
+            pass
+        packed = self._status[row]
+        client_status = {}
+        for key in _CLIENT_STATUS_KEYS:
+            code = packed & 0xF
+            if code:
+                client_status[key] = _STATUS_VALUES[code]
+            packed >>= 4
+        return client_status
+
+    def _set_discriminator(self, user_id: int, row: int, discriminator: str) -> None:
+        self._other_discriminators.pop(user_id, None)
+        if discriminator == "0":
+            self._discriminators[row] = 0
+        elif len(discriminator) == 4 and discriminator.isdigit():
+            self._discriminators[row] = int(discriminator) + 1
+        else:
+            self._other_discriminators[user_id] = discriminator
+            self._discriminators[row] = _DISCRIMINATOR_OTHER
+
+    def _get_discriminator(self, user_id: int, row: int) -> str:
+        value = self._discriminators[row]
+        if value == 0:
+            return "0"
+        if value == _DISCRIMINATOR_OTHER:
+            return self._other_discriminators[user_id]
+        return f"{value - 1:04}"
+
+    def _set_avatar(self, user_id: int, row: int, avatar: str | None) -> None:
+        offset = row * _HASH_SIZE
+        self._other_avatars.pop(user_id, None)
+        if avatar is None:
+            kind, digest = _HASH_NONE, bytes(16)
+        else:
+            kind = _HASH_ANIMATED if avatar.startswith("a_") else _HASH_STATIC
+            try:
+                digest = bytes.fromhex(avatar[2:] if kind == _HASH_ANIMATED else avatar)
+            except ValueError:
+                digest = b""
+            if len(digest) != 16:
+                self._other_avatars[user_id] = avatar
+                kind, digest = _HASH_OTHER, bytes(16)
+        self._avatars[offset] = kind
+        self._avatars[offset + 1 : offset + _HASH_SIZE] = digest
+
+    def _get_avatar(self, user_id: int, row: int) -> str | None:
+        offset = row * _HASH_SIZE
+        kind = self._avatars[offset]
+        if kind == _HASH_NONE:
+            return None
+        if kind == _HASH_OTHER:
+            return self._other_avatars[user_id]
+        digest = self._avatars[offset + 1 : offset + _HASH_SIZE].hex()
+        return f"a_{digest}" if kind == _HASH_ANIMATED else digest
+
+    def _remove_row(self, user_id: int, row: int) -> None:
+        self._rows.remove(user_id)
+        self._users.remove(user_id, self.guild.id)
+        self._forget(user_id)
+        self._wasted_roles += self._role_count[row]
+        self._names[row] = None
+        self._global_names[row] = None
+
+        last = len(self._ids) - 1
+        if row != last:
+            # move the last row into the hole to keep the columns dense
+            self._rows.set(self._ids[last], row)
+            for column in self._columns():
+                column[row] = column[last]
+            self._names.move(last, row)
+            self._global_names.move(last, row)
+            offset = last * _HASH_SIZE
+            self._avatars[row * _HASH_SIZE : (row + 1) * _HASH_SIZE] = self._avatars[
+                offset : offset + _HASH_SIZE
+            ]
+
+        for column in self._columns():
+            column.pop()
+        self._names.pop()
+        self._global_names.pop()
+        del self._avatars[-_HASH_SIZE:]
+
+        for mapping in (
+            self._nicks,
+            self._premium_since,
+            self._timed_out_until,
+            self._other_discriminators,
+            self._member_assets,
+            self._user_extras,
+            self._other_avatars,
+            self._client_statuses,
+            self._activities,
+        ):
+            mapping.pop(user_id, None)
+
+    def _user_at(self, row: int) -> User | ClientUser:
+        user_id = self._ids[row]
+        state = self._state
+        if user_id == state.self_id and state.user is not None:
+            return state.user
+        bits = self._bits[row]
+        user: User = User.__new__(User)
+        user._state = self._state
+        user._stored = False
+        user.id = user_id
+        user.name = self._names[row]  # type: ignore
+        user.discriminator = self._get_discriminator(user_id, row)
+        user.global_name = self._global_names[row]
+        user._avatar = self._get_avatar(user_id, row)
+        user._banner, user._accent_colour, user._avatar_decoration = (
+            self._user_extras.get(user_id, (None, None, None))
+        )
+        user._public_flags = self._public_flags[row]
+        user.bot = bool(bits & _BOT)
+        user.system = bool(bits & _SYSTEM)
+        return user
+
+    def _member_at(self, row: int) -> Member:
+        user_id = self._ids[row]
+        start = self._role_start[row]
+        member: Member = Member.__new__(Member)
+        member._state = self._state
+        member._user = self._user_at(row)
+        member.guild = self.guild
+        member.joined_at = _unpack_time(self._joined_at[row])
+        member.premium_since = self._premium_since.get(user_id)
+        member.communication_disabled_until = self._timed_out_until.get(user_id)
+        member._roles = utils.SnowflakeList(
+            self._roles[start : start + self._role_count[row]], is_sorted=True
+        )
+        member._client_status = self._get_status(user_id, row)
+        member.activities = self._activities.get(user_id, ())
+        member.nick = self._nicks.get(user_id)
+        member.pending = bool(self._bits[row] & _PENDING)
+        member._avatar, member._banner = self._member_assets.get(user_id, (None, None))
+        member.flags = MemberFlags._from_value(self._flags[row])
+        return member
+
+    def get_user(self, user_id: int) -> User | ClientUser | None:
+        member = self._kept(user_id)
+        if member is not None:
+            return member._user
+        row = self._find(user_id)
+        return None if row is None else self._user_at(row)
@@ -26,9 +26,9 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import array
+import copy
 import ctypes
 import ctypes.util
-import gc
 import logging
 import math
 import os.path
@@ -36,7 +36,8 @@ import struct
 import sys
 import threading
 import time
-from typing import TYPE_CHECKING, Any, Callable, Literal, TypedDict, TypeVar
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple, TypedDict, TypeVar
 
 from .errors import DiscordException
 from .sinks import RawData
@@ -65,6 +66,8 @@ __all__ = (
     "Encoder",
     "Decoder",
     "DecodeManager",
+    "DecodeStats",
+    "JitterBuffer",
     "OpusError",
     "OpusNotLoaded",
 )
@@ -77,6 +80,9 @@ c_float_ptr = ctypes.POINTER(ctypes.c_float)
 
 _lib = None
 
+# the frame Discord sends a few of when a user stops speaking
+OPUS_SILENCE = b"\xf8\xff\xfe"
+
 
 class EncoderStruct(ctypes.Structure):
     pass
@@ -518,50 +524,412 @@ class Decoder(_OpusStruct):
         return array.array("h", pcm[: ret * channel_count]).tobytes()
 
 
+class DecodeStats(NamedTuple):
+    """The statistics of a :class:`DecodeManager`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    queue_depth: :class:`int`
+        The number of frames waiting to be decoded.
+    decoded: :class:`int`
+        The number of frames decoded.
+    dropped: :class:`int`
+        The number of frames dropped because the queue was full, or because
+        they arrived too late for the jitter buffer.
+    concealed: :class:`int`
+        The number of lost frames recovered or concealed by the jitter buffer.
+    errors: :class:`int`
+        The number of frames that failed to decode.
+    average_latency: :class:`float`
+        The average time, in seconds, between a packet being received
+        and its frame being decoded.
+    max_latency: :class:`float`
+        The largest such time, in seconds.
+    """
+
+    queue_depth: int
+    decoded: int
+    dropped: int
+    concealed: int
+    errors: int
+    average_latency: float
+    max_latency: float
+
+
+class JitterBuffer:
+    """Puts the received packets of a single SSRC back in RTP sequence order.
+
+    Packets are held back while one is missing, until either it arrives,
+    ``depth`` packets are waiting or the oldest of them has waited ``max_delay``
+    seconds, at which point it is considered lost.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    depth: :class:`int`
+        The number of packets to hold back waiting for a missing one.
+    max_delay: Optional[:class:`float`]
+        The number of seconds a packet may be held back waiting for a missing
+        one. Defaults to the duration of ``depth`` frames.
+
+    Attributes
+    ----------
+    depth: :class:`int`
+        The number of packets held back waiting for a missing one.
+    max_delay: :class:`float`
+        The number of seconds a packet may be held back waiting for a missing one.
+    last: Optional[:class:`~discord.sinks.RawData`]
+        The last packet returned by :meth:`pop`.
+    late: :class:`int`
+        The number of packets dropped because they arrived after their
+        turn had passed.
+    """
+
+    # gaps larger than this aren't concealed, the timestamps account for them
+    MAX_CONCEALED: int = 5
+
+    def __init__(self, depth: int, max_delay: float | None = None) -> None:
+        if depth < 1:
+            raise ValueError("depth must be at least 1.")
+        if max_delay is None:
+            max_delay = depth * _OpusStruct.FRAME_LENGTH / 1000
+        elif max_delay < 0:
+            raise ValueError("max_delay cannot be negative.")
+
+        self.depth: int = depth
+        self.max_delay: float = max_delay
+        self.last: RawData | None = None
+        self.late: int = 0
+        self._packets: dict[int, RawData] = {}
+        self._next: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._packets)
+
+    def push(self, packet: RawData) -> bool:
+        """Adds a received packet to the buffer.
+
+        Returns ``False`` if the packet arrived too late and was dropped.
+        """
+        if self._next is None:
+            self._next = packet.sequence
+        elif (packet.sequence - self._next) & 0xFFFF >= 0x8000:
+            self.late += 1
+            return False
+
+        self._packets[packet.sequence] = packet
+        return True
+
+    def deadline(self) -> float | None:
+        """Returns the :func:`time.perf_counter` time at which the held packets
+        stop waiting for a missing one, or ``None`` if none are held.
+        """
+        if not self._packets:
+            return None
+        oldest = min(packet.receive_time for packet in self._packets.values())
+        return oldest + self.max_delay
+
+    def pop(self, *, flush: bool = False) -> list[RawData | None]:
+        """Takes the packets that are ready out of the buffer, in sequence order.
+
+        ``None`` stands for a lost packet.
+
+        Parameters
+        ----------
+        flush: :class:`bool`
+            Whether to take every packet, instead of holding them back
+            while one is missing, as is done once the :meth:`deadline` passed.
+        """
+        ready: list[RawData | None] = []
+        packets = self._packets
+        while packets:
+            packet = packets.pop(self._next, None)
+            if packet is None:
+                if not flush and len(packets) < self.depth:
+                    break
+
+                gap = min((sequence - self._next) & 0xFFFF for sequence in packets)
+                if gap > self.MAX_CONCEALED:
+                    self._next = (self._next + gap) & 0xFFFF
+                    continue
+            else:
+                self.last = packet
+
+            ready.append(packet)
+            self._next = (self._next + 1) & 0xFFFF
+        return ready
+
+
+class _DecodeQueue:
+    __slots__ = ("frames", "condition", "ssrcs", "buffers")
+
+    def __init__(self) -> None:
+        self.frames: deque[RawData] = deque()
+        self.condition: threading.Condition = threading.Condition()
+        self.ssrcs: int = 0
+        self.buffers: dict[int, JitterBuffer] = {}
+
+
 class DecodeManager(threading.Thread, _OpusStruct):
-    def __init__(self, client):
+    """Decodes the opus frames received while recording.
+
+    Frames are queued per worker thread, every frame of a given SSRC being
+    decoded by the same worker so that it keeps its decoder state.
+
+    Parameters
+    ----------
+    client: :class:`VoiceClient`
+        The voice client to deliver the decoded frames to.
+    workers: :class:`int`
+        The number of decoding threads. Defaults to ``1``.
+
+        .. versionadded:: 2.7
+    max_queue: :class:`int`
+        The number of frames each worker may have waiting before ``overflow``
+        applies. Defaults to ``250``, 5 seconds of a single speaker.
+
+        .. versionadded:: 2.7
+    overflow: :class:`str`
+        What to do with a frame arriving while its queue is full: ``"drop_oldest"``
+        drops the oldest waiting frame, ``"drop_newest"`` drops the arriving frame
+        and ``"block"`` waits for room in the queue. Defaults to ``"drop_oldest"``.
+
+        .. versionadded:: 2.7
+    jitter_buffer: :class:`int`
+        The depth of the :class:`JitterBuffer` reordering the packets of each SSRC.
+        Lost packets are then recovered with opus forward error correction when
+        the following packet carries it, or concealed otherwise. Defaults to ``0``,
+        which decodes packets in the order they arrive.
+
+        .. versionadded:: 2.7
+    """
+
+    OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+    def __init__(
+        self,
+        client,
+        *,
+        workers: int = 1,
+        max_queue: int = 250,
+        overflow: str = "drop_oldest",
+        jitter_buffer: int = 0,
+    ):
         super().__init__(daemon=True, name="DecodeManager")
 
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1.")
+        if jitter_buffer < 0:
+            raise ValueError("jitter_buffer cannot be negative.")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow must be one of {', '.join(self.OVERFLOW_POLICIES)}."
+            )
+
         self.client = client
-        self.decode_queue = []
+        self.max_queue: int = max_queue
+        self.overflow: str = overflow
+        self.jitter_buffer: int = jitter_buffer
 
         self.decoder = {}
 
+        self._queues: list[_DecodeQueue] = [_DecodeQueue() for _ in range(workers)]
+        self._assigned: dict[int, _DecodeQueue] = {}
+        self._workers: list[threading.Thread] = []
+        # recv_decoded_audio and the sinks aren't thread safe
+        self._deliver_lock: threading.Lock = threading.Lock()
         self._end_thread = threading.Event()
 
+        self._decoded: int = 0
+        self._dropped: int = 0
+        self._errors: int = 0
+        self._concealed: int = 0
+        self._total_latency: float = 0.0
+        self._max_latency: float = 0.0
+
+    def start(self):
+        super().start()
+        for index, queue in enumerate(self._queues[1:], 1):
+            worker = threading.Thread(
+                target=self._process,
+                args=(queue,),
+                daemon=True,
+                name=f"DecodeManager-{index}",
+            )
+            worker.start()
+            self._workers.append(worker)
+
     def decode(self, opus_frame):
         if not isinstance(opus_frame, RawData):
             raise TypeError("opus_frame should be a RawData object.")
-        self.decode_queue.append(opus_frame)
+
+        queue = self._assigned.get(opus_frame.ssrc)
+        if queue is None:
+            queue = min(self._queues, key=lambda q: q.ssrcs)
+            queue.ssrcs += 1
+            self._assigned[opus_frame.ssrc] = queue
+
+        with queue.condition:
+            frames = queue.frames
+            if len(frames) >= self.max_queue:
+                if self.overflow == "drop_newest":
+                    self._dropped += 1
+                    return
+                if self.overflow == "drop_oldest":
+                    frames.popleft()
+                    self._dropped += 1
+                else:
+                    queue.condition.wait_for(
+                        lambda: len(frames) < self.max_queue
+                        or self._end_thread.is_set()
+                    )
+            frames.append(opus_frame)
+            queue.condition.notify_all()
 
     def run(self):
-        while not self._end_thread.is_set():
-            try:
-                data = self.decode_queue.pop(0)
-            except IndexError:
-                time.sleep(0.001)
+        self._process(self._queues[0])
+
+    def _process(self, queue: _DecodeQueue) -> None:
+        frames = queue.frames
+        while True:
+            with queue.condition:
+                while not frames and not self._end_thread.is_set():
+                    timeout = self._until_deadline(queue)
+                    if timeout is not None and timeout <= 0:
+                        break
+                    queue.condition.wait(timeout)
+                if frames:
+                    data = frames.popleft()
+                    # wake up a receiver blocked on a full queue
+                    queue.condition.notify_all()
+                elif self._end_thread.is_set():
+                    # stopped and drained
+                    break
+                else:
+                    data = None
+
+            if not self.jitter_buffer:
+                self._play(None, [data])
                 continue
 
-            try:
-                if data.decrypted_data is None:
+            if data is not None:
+                buffer = queue.buffers.get(data.ssrc)
+                if buffer is None:
+                    buffer = queue.buffers[data.ssrc] = JitterBuffer(self.jitter_buffer)
+                previous = buffer.last
+                if buffer.push(data):
+                    self._play(previous, buffer.pop())
+
+            # release packets which waited too long for a missing one, so the
+            # end of an utterance isn't held until the speaker talks again
+            now = time.perf_counter()
+            for buffer in queue.buffers.values():
+                if buffer and buffer.deadline() <= now:
+                    self._play(buffer.last, buffer.pop(flush=True))
+
+        for buffer in queue.buffers.values():
+            self._play(buffer.last, buffer.pop(flush=True))
+
+    @staticmethod
+    def _until_deadline(queue: _DecodeQueue) -> float | None:
+        deadlines = [
+            deadline
+            for buffer in queue.buffers.values()
+            if (deadline := buffer.deadline()) is not None
+        ]
+        if not deadlines:
+            return None
+        return min(deadlines) - time.perf_counter()
+
+    def _play(self, previous: RawData | None, ready: list[RawData | None]) -> None:
+        for index, data in enumerate(ready):
+            if data is None:
+                following = ready[index + 1] if index + 1 < len(ready) else None
+                data = self._conceal(previous, following)
+                if data is None:
                     continue
-                else:
+            elif data.decrypted_data is None:
+                continue
+            elif data.decrypted_data == OPUS_SILENCE:
+                previous = data
+                continue
+            else:
+                try:
                     data.decoded_data = self.get_decoder(data.ssrc).decode(
                         data.decrypted_data
                     )
-            except OpusError:
-                print("Error occurred while decoding opus frame.")
-                continue
+                except OpusError:
+                    with self._deliver_lock:
+                        self._errors += 1
+                    _log.warning("Error occurred while decoding opus frame.")
+                    continue
 
-            self.client.recv_decoded_audio(data)
+            previous = data
+            latency = time.perf_counter() - data.receive_time
+            with self._deliver_lock:
+                self._decoded += 1
+                self._total_latency += latency
+                if latency > self._max_latency:
+                    self._max_latency = latency
+                # frames still draining once a new recording started belong
+                # to the previous one, they must not reach the new sink
+                if self.client.decoder is self:
+                    self.client.recv_decoded_audio(data)
+
+    def _conceal(self, previous: RawData, following: RawData | None) -> RawData | None:
+        decoder = self.get_decoder(previous.ssrc)
+        try:
+            if following is not None and following.decrypted_data:
+                # the following packet may carry a low bitrate copy of this one
+                pcm = decoder.decode(following.decrypted_data, fec=True)
+            else:
+                pcm = decoder.decode(None)
+        except OpusError:
+            with self._deliver_lock:
+                self._errors += 1
+            return None
+
+        with self._deliver_lock:
+            self._concealed += 1
+
+        # stand in for the lost packet, right after the previous one
+        frame = copy.copy(previous)
+        frame.sequence = (previous.sequence + 1) & 0xFFFF
+        frame.timestamp = (previous.timestamp + self.SAMPLES_PER_FRAME) & 0xFFFFFFFF
+        frame.decrypted_data = None
+        frame.decoded_data = pcm
+        return frame
 
     def stop(self):
-        while self.decoding:
-            time.sleep(0.1)
-            self.decoder = {}
-            gc.collect()
-            print("Decoder Process Killed")
+        """Tells the decoding threads to stop once every queued frame has been
+        decoded, without waiting for them.
+
+        .. versionchanged:: 2.7
+            No longer waits for the threads to finish, see :meth:`join`.
+        """
         self._end_thread.set()
+        for queue in self._queues:
+            with queue.condition:
+                queue.condition.notify_all()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Waits for the decoding threads to finish after :meth:`stop`.
+
+        This blocks, so it must not be called from the event loop.
+
+        .. versionadded:: 2.7
+        """
+        current = threading.current_thread()
+        if current is not self:
+            super().join(timeout)
+        for worker in self._workers:
+            if worker is not current:
+                worker.join(timeout)
 
     def get_decoder(self, ssrc):
         d = self.decoder.get(ssrc)
@@ -572,4 +940,22 @@ class DecodeManager(threading.Thread, _OpusStruct):
 
     @property
     def decoding(self):
-        return bool(self.decode_queue)
+        return any(queue.frames for queue in self._queues)
+
+    @property
+    def stats(self) -> DecodeStats:
+        """The queue depth and decoding latency statistics.
+
+        .. versionadded:: 2.7
+        """
+        decoded = self._decoded
+        return DecodeStats(
+            queue_depth=sum(len(queue.frames) for queue in self._queues),
+            decoded=decoded,
+            dropped=self._dropped
+            + sum(b.late for q in self._queues for b in list(q.buffers.values())),
+            concealed=self._concealed,
+            errors=self._errors,
+            average_latency=self._total_latency / decoded if decoded else 0.0,
+            max_latency=self._max_latency,
+        )
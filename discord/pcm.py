@@ -0,0 +1,338 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import array
+import warnings
+from math import floor, tanh
+from typing import Sequence
+
+try:
+    import numpy
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+try:
+    # deprecated since 3.11 and removed in 3.13, where the audioop-lts
+    # package provides it
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+except ModuleNotFoundError:
+    HAS_AUDIOOP = False
+else:
+    HAS_AUDIOOP = True
+
+__all__ = (
+    "gain",
+    "ramp",
+    "mix",
+    "FrameMixer",
+)
+
+# 16-bit signed native endian stereo, the format of non-opus audio sources
+CHANNELS = 2
+SAMPLE_WIDTH = 2
+MAX_SAMPLE = 0x7FFF
+MIN_SAMPLE = -0x8000
+
+# numpy applies ramps and soft limiting per sample at close to the speed
+# audioop manages plain gains, while audioop (deprecated since 3.11) has
+# no per-sample gains or nonlinear operations, so ramps and soft limits
+# with it fall back to the pure python path, see benchmarks/pcm_volume.py
+if HAS_NUMPY:
+    BACKEND = "numpy"
+elif HAS_AUDIOOP:
+    BACKEND = "audioop"
+else:
+    BACKEND = "python"
+
+
+def _limit_python(value: float, threshold: float) -> int:
+    # tanh knee above the threshold, approaching full scale asymptotically
+    magnitude = abs(value)
+    if magnitude > threshold:
+        headroom = MAX_SAMPLE - threshold
+        magnitude = threshold + headroom * tanh((magnitude - threshold) / headroom)
+        value = magnitude if value > 0 else -magnitude
+    return floor(value)
+
+
+def _process_python(
+    data: bytes, start: float, end: float, soft_limit: float | None
+) -> bytes:
+    samples = array.array("h")
+    samples.frombytes(data)
+    count = len(samples)
+
+    if soft_limit is not None:
+        threshold = soft_limit * MAX_SAMPLE
+        if samples and max(-min(samples), max(samples)) * max(start, end) > threshold:
+            step = (end - start) / (count // CHANNELS or 1)
+            for i in range(count):
+                gain = start + step * (i // CHANNELS)
+                samples[i] = _limit_python(samples[i] * gain, threshold)
+            return samples.tobytes()
+        # nothing reaches the knee, plain scaling is enough
+
+    if start == end:
+        return array.array(
+            "h",
+            [
+                (
+                    MAX_SAMPLE
+                    if value > MAX_SAMPLE
+                    else MIN_SAMPLE if value < MIN_SAMPLE else value
+                )
+                for value in [floor(sample * start) for sample in samples]
+            ],
+        ).tobytes()
+
+    step = (end - start) / (count // CHANNELS or 1)
+    gains = [start + step * (i // CHANNELS) for i in range(count)]
+    return array.array(
+        "h",
+        [
+            (
+                MAX_SAMPLE
+                if value > MAX_SAMPLE
+                else MIN_SAMPLE if value < MIN_SAMPLE else value
+            )
+            for value in [floor(s * g) for s, g in zip(samples, gains)]
+        ],
+    ).tobytes()
+
+
+def _process_numpy(
+    data: bytes, start: float, end: float, soft_limit: float | None
+) -> bytes:
+    samples = numpy.frombuffer(data, dtype=numpy.int16).astype(numpy.float32)
+    if start == end:
+        samples *= start
+    else:
+        frames = len(samples) // CHANNELS
+        gains = numpy.linspace(start, end, frames, endpoint=False, dtype=numpy.float32)
+        samples[: frames * CHANNELS] *= numpy.repeat(gains, CHANNELS)
+
+    if soft_limit is not None:
+        threshold = soft_limit * MAX_SAMPLE
+        magnitude = numpy.abs(samples)
+        over = magnitude > threshold
+        if over.any():
+            headroom = MAX_SAMPLE - threshold
+            limited = threshold + headroom * numpy.tanh(
+                (magnitude[over] - threshold) / headroom
+            )
+            samples[over] = numpy.copysign(limited, samples[over])
+
+    numpy.clip(samples, MIN_SAMPLE, MAX_SAMPLE, out=samples)
+    return numpy.floor(samples).astype(numpy.int16).tobytes()
+
+
+def _process_audioop(
+    data: bytes, start: float, end: float, soft_limit: float | None
+) -> bytes:
+    if start == end:
+        if soft_limit is None:
+            return audioop.mul(data, SAMPLE_WIDTH, start)
+        if audioop.max(data, SAMPLE_WIDTH) * start <= soft_limit * MAX_SAMPLE:
+            # nothing reaches the knee, plain scaling is enough
+            return audioop.mul(data, SAMPLE_WIDTH, start)
+    return _process_python(data, start, end, soft_limit)
+
+
+if BACKEND == "numpy":
+    _process = _process_numpy
+elif BACKEND == "audioop":
+    _process = _process_audioop
+else:
+    _process = _process_python
+
+
+def gain(data: bytes, gain: float, *, soft_limit: float | None = None) -> bytes:
+    """Scales 16-bit PCM audio by a gain, clipping it to the sample range.
+
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The audio to scale.
+    gain: :class:`float`
+        The factor to scale the audio by.
+    soft_limit: Optional[:class:`float`]
+        The fraction of full scale above which samples are compressed
+        smoothly instead of clipped.
+
+    Returns
+    -------
+    :class:`bytes`
+        The scaled audio.
+    """
+    if gain == 1.0 or not data:
+        return data
+    if gain <= 0.0:
+        return bytes(len(data))
+    return _process(data, gain, gain, soft_limit)
+
+
+def ramp(
+    data: bytes, start: float, end: float, *, soft_limit: float | None = None
+) -> bytes:
+    """Scales 16-bit stereo PCM audio by a gain changing linearly over its
+    duration, clipping it to the sample range.
+
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The audio to scale.
+    start: :class:`float`
+        The gain at the start of the audio.
+    end: :class:`float`
+        The gain the audio ramps towards.
+    soft_limit: Optional[:class:`float`]
+        The fraction of full scale above which samples are compressed
+        smoothly instead of clipped.
+
+    Returns
+    -------
+    :class:`bytes`
+        The scaled audio.
+    """
+    if start == end:
+        return gain(data, start, soft_limit=soft_limit)
+    if not data:
+        return data
+    return _process(data, start, end, soft_limit)
+
+
+def _mix_python(frames: Sequence[bytes], gains: Sequence[float], size: int) -> bytes:
+    totals = [0.0] * (size // SAMPLE_WIDTH)
+    for frame, factor in zip(frames, gains):
+        samples = array.array("h")
+        samples.frombytes(frame[:size])
+        for i, sample in enumerate(samples):
+            totals[i] += sample * factor
+    return array.array(
+        "h",
+        [
+            min(MAX_SAMPLE, max(value, MIN_SAMPLE))
+            for value in [floor(total) for total in totals]
+        ],
+    ).tobytes()
+
+
+def _mix_audioop(frames: Sequence[bytes], gains: Sequence[float], size: int) -> bytes:
+    # the sum saturates at every step rather than only at the end
+    mixed = bytes(size)
+    for frame, factor in zip(frames, gains):
+        if factor != 1.0:
+            frame = audioop.mul(frame, SAMPLE_WIDTH, factor)
+        mixed = audioop.add(mixed, frame[:size].ljust(size, b"\0"), SAMPLE_WIDTH)
+    return mixed
+
+
+class FrameMixer:
+    """Sums 16-bit PCM frames into a frame of a fixed size, reusing its
+    working buffers between calls when NumPy is used. Only the
+    returned frame is allocated for each call.
+
+    Frames shorter than the size are padded with silence, longer ones
+    are truncated.
+
+    Parameters
+    ----------
+    size: :class:`int`
+        The size of the mixed frames, in bytes.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size: int = size
+        if BACKEND == "numpy":
+            count = size // SAMPLE_WIDTH
+            self._total = numpy.zeros(count, dtype=numpy.float32)
+            self._scaled = numpy.empty(count, dtype=numpy.float32)
+            self._output = numpy.empty(count, dtype=numpy.int16)
+
+    def mix(self, frames: Sequence[bytes], gains: Sequence[float]) -> bytes:
+        """Sums frames, clipping the result to the sample range.
+
+        Parameters
+        ----------
+        frames: Sequence[:class:`bytes`]
+            The audio frames to mix.
+        gains: Sequence[:class:`float`]
+            The gain to apply to each frame before mixing.
+
+        Returns
+        -------
+        :class:`bytes`
+            The mixed audio.
+        """
+        if BACKEND == "audioop":
+            return _mix_audioop(frames, gains, self.size)
+        if BACKEND == "python":
+            return _mix_python(frames, gains, self.size)
+
+        total = self._total
+        total.fill(0.0)
+        for frame, factor in zip(frames, gains):
+            samples = numpy.frombuffer(frame, dtype=numpy.int16)[: len(total)]
+            scaled = self._scaled[: len(samples)]
+            numpy.multiply(samples, factor, out=scaled)
+            total[: len(samples)] += scaled
+        numpy.clip(total, MIN_SAMPLE, MAX_SAMPLE, out=total)
+        numpy.floor(total, out=total)
+        numpy.copyto(self._output, total, casting="unsafe")
+        return self._output.tobytes()
+
+
+def mix(frames: Sequence[bytes], gains: Sequence[float] | None = None) -> bytes:
+    """Sums 16-bit PCM audio frames, clipping the result to the sample range.
+
+    Frames shorter than the longest one are padded with silence.
+
+    Parameters
+    ----------
+    frames: Sequence[:class:`bytes`]
+        The audio frames to mix.
+    gains: Optional[Sequence[:class:`float`]]
+        The gain to apply to each frame before mixing.
+
+    Returns
+    -------
+    :class:`bytes`
+        The mixed audio.
+    """
+    if not frames:
+        return b""
+    if gains is None:
+        gains = [1.0] * len(frames)
+
+    size = max(len(frame) for frame in frames)
+    if len(frames) == 1:
+        return gain(frames[0], gains[0]).ljust(size, b"\0")
+    return FrameMixer(size).mix(frames, gains)
@@ -28,18 +28,32 @@ from __future__ import annotations
 import array
 import asyncio
 import io
+import itertools
 import json
 import logging
+import mmap
 import re
 import shlex
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 import traceback
-from math import floor
-from typing import IO, TYPE_CHECKING, Any, Callable, Generic, TypeVar
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    NamedTuple,
+    TypeVar,
+)
 
+from . import pcm
 from .errors import ClientException
 from .oggparse import OggStream
 from .opus import Encoder as OpusEncoder
@@ -61,6 +75,12 @@ __all__ = (
     "FFmpegPCMAudio",
     "FFmpegOpusAudio",
     "PCMVolumeTransformer",
+    "MixerSource",
+    "OpusClip",
+    "OpusClipAudio",
+    "OpusClipCache",
+    "VoiceScheduler",
+    "VoiceSchedulerStats",
 )
 
 CREATE_NO_WINDOW: int
@@ -666,6 +686,12 @@ class PCMVolumeTransformer(AudioSource, Generic[AT]):
     This does not work on audio sources that have :meth:`AudioSource.is_opus`
     set to ``True``.
 
+    The audio is processed a whole frame at a time, using NumPy when it is
+    installed and :mod:`audioop` otherwise, if available. Fades and soft
+    limiting are applied per sample with every backend, but without NumPy
+    they run in pure Python, which is several times slower than a plain
+    volume change.
+
     Parameters
     ----------
     original: :class:`AudioSource`
@@ -673,6 +699,11 @@ class PCMVolumeTransformer(AudioSource, Generic[AT]):
     volume: :class:`float`
         The initial volume to set it to.
         See :attr:`volume` for more info.
+    soft_limit: Optional[:class:`float`]
+        The fraction of full scale, e.g. ``0.9``, above which loud samples are
+        compressed smoothly instead of being clipped. Defaults to ``None``.
+
+        .. versionadded:: 2.7
 
     Raises
     ------
@@ -682,40 +713,541 @@ class PCMVolumeTransformer(AudioSource, Generic[AT]):
         The audio source is opus encoded.
     """
 
-    def __init__(self, original: AT, volume: float = 1.0):
+    def __init__(
+        self, original: AT, volume: float = 1.0, *, soft_limit: float | None = None
+    ):
         if not isinstance(original, AudioSource):
             raise TypeError(f"expected AudioSource not {original.__class__.__name__}.")
 
         if original.is_opus():
             raise ClientException("AudioSource must not be Opus encoded.")
 
+        if soft_limit is not None and not 0.0 < soft_limit < 1.0:
+            raise ValueError("soft_limit must be between 0.0 and 1.0.")
+
         self.original: AT = original
+        self.soft_limit: float | None = soft_limit
         self.volume = volume
 
     @property
     def volume(self) -> float:
-        """Retrieves or sets the volume as a floating point percentage (e.g. ``1.0`` for 100%)."""
+        """Retrieves or sets the volume as a floating point percentage (e.g. ``1.0`` for 100%).
+
+        Setting it cancels any ongoing :meth:`fade`.
+        """
         return self._volume
 
     @volume.setter
     def volume(self, value: float) -> None:
+        self._fade: tuple[float, float] | None = None
         self._volume = max(value, 0.0)
 
+    def fade(self, volume: float, duration: float) -> None:
+        """Gradually changes the volume over the given duration.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        volume: :class:`float`
+            The volume to fade to.
+        duration: :class:`float`
+            The duration of the fade, in seconds.
+        """
+        volume = max(volume, 0.0)
+        frames = max(round(duration * 1000 / OpusEncoder.FRAME_LENGTH), 1)
+        self._fade = ((volume - self._volume) / frames, volume)
+
     def cleanup(self) -> None:
         self.original.cleanup()
 
     def read(self) -> bytes:
-        maxval = 0x7FFF
-        minval = -0x8000
-
-        volume = min(self._volume, 2.0)
         ret = self.original.read()
-        samples = array.array("h")
-        samples.frombytes(ret)
-        for i in range(len(samples)):
-            samples[i] = int(floor(min(maxval, max(samples[i] * volume, minval))))
+        start = self._volume
+        fade = self._fade
+        if fade is None:
+            return pcm.gain(ret, min(start, 2.0), soft_limit=self.soft_limit)
+
+        step, target = fade
+        end = start + step
+        if (end >= target) if step >= 0 else (end <= target):
+            end = target
+            self._fade = None
+        self._volume = end
+        return pcm.ramp(ret, min(start, 2.0), min(end, 2.0), soft_limit=self.soft_limit)
+
+
+class MixerSource(AudioSource):
+    r"""Mixes any number of PCM audio sources into a single one.
+
+    Every frame, a frame is read from each source and the frames are summed,
+    each scaled by its source's volume. Sources can be added and removed
+    while the mixer is playing, and are removed and cleaned up once they
+    are done.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    \*sources: :class:`AudioSource`
+        The sources to start with, at full volume.
+    persistent: :class:`bool`
+        Whether to keep playing silence when there are no sources left
+        instead of ending, so that more sources can be added later.
+        Defaults to ``False``.
+
+    Raises
+    ------
+    TypeError
+        Not an audio source.
+    ClientException
+        An audio source is opus encoded.
+    """
+
+    def __init__(self, *sources: AudioSource, persistent: bool = False):
+        self.persistent: bool = persistent
+        self._lock: threading.Lock = threading.Lock()
+        self._volumes: dict[AudioSource, float] = {}
+        # removed sources, cleaned up by the thread reading the mixer so
+        # that they aren't cleaned up in the middle of a read
+        self._removed: list[AudioSource] = []
+        self._mixer: pcm.FrameMixer = pcm.FrameMixer(OpusEncoder.FRAME_SIZE)
+        self._silence: bytes = bytes(OpusEncoder.FRAME_SIZE)
+        for source in sources:
+            self.add(source)
+
+    @property
+    def sources(self) -> list[AudioSource]:
+        """The sources currently being mixed."""
+        return list(self._volumes)
+
+    def add(self, source: AudioSource, *, volume: float = 1.0) -> None:
+        """Adds a source to the mix, starting with the next frame.
+
+        Parameters
+        ----------
+        source: :class:`AudioSource`
+            The source to add.
+        volume: :class:`float`
+            The volume of the source as a floating point percentage.
+
+        Raises
+        ------
+        TypeError
+            Not an audio source.
+        ClientException
+            The audio source is opus encoded.
+        """
+        if not isinstance(source, AudioSource):
+            raise TypeError(f"expected AudioSource not {source.__class__.__name__}.")
+
+        if source.is_opus():
+            raise ClientException("AudioSource must not be Opus encoded.")
+
+        with self._lock:
+            self._volumes[source] = max(volume, 0.0)
+
+    def remove(self, source: AudioSource) -> None:
+        """Removes a source from the mix. It is cleaned up before the next
+        frame is read.
+
+        Parameters
+        ----------
+        source: :class:`AudioSource`
+            The source to remove.
+
+        Raises
+        ------
+        ValueError
+            The source is not being mixed.
+        """
+        with self._lock:
+            try:
+                del self._volumes[source]
+            except KeyError:
+                raise ValueError("source is not being mixed") from None
+            self._removed.append(source)
+
+    def _cleanup_removed(self) -> None:
+        with self._lock:
+            removed, self._removed = self._removed, []
+        for source in removed:
+            source.cleanup()
+
+    def get_volume(self, source: AudioSource) -> float:
+        """Returns the volume of a source being mixed.
+
+        Parameters
+        ----------
+        source: :class:`AudioSource`
+            The source to get the volume of.
+
+        Raises
+        ------
+        ValueError
+            The source is not being mixed.
+        """
+        try:
+            return self._volumes[source]
+        except KeyError:
+            raise ValueError("source is not being mixed") from None
+
+    def set_volume(self, source: AudioSource, volume: float) -> None:
+        """Changes the volume of a source being mixed.
+
+        Parameters
+        ----------
+        source: :class:`AudioSource`
+            The source to change the volume of.
+        volume: :class:`float`
+            The new volume as a floating point percentage.
+
+        Raises
+        ------
+        ValueError
+            The source is not being mixed.
+        """
+        with self._lock:
+            if source not in self._volumes:
+                raise ValueError("source is not being mixed")
+            self._volumes[source] = max(volume, 0.0)
+
+    def read(self) -> bytes:
+        if self._removed:
+            self._cleanup_removed()
+
+        with self._lock:
+            volumes = list(self._volumes.items())
+
+        frames = []
+        gains = []
+        for source, volume in volumes:
+            data = source.read()
+            if not data:
+                with self._lock:
+                    self._volumes.pop(source, None)
+                source.cleanup()
+            elif volume:
+                frames.append(data)
+                gains.append(volume)
+
+        if frames:
+            return self._mixer.mix(frames, gains)
+        if self._volumes or self.persistent:
+            # muted sources or nothing to mix yet, keep the stream going
+            return self._silence
+        return b""
+
+    def cleanup(self) -> None:
+        with self._lock:
+            sources = [*self._volumes, *self._removed]
+            self._volumes.clear()
+            self._removed.clear()
+        for source in sources:
+            source.cleanup()
+
 
-        return samples.tobytes()
+class OpusClip:
+    """A clip of audio encoded to opus packets ahead of time, so that it can be
+    played any number of times without running ffmpeg again.
+
+    Clips are usually created by an :class:`OpusClipCache`, and played through
+    the :class:`AudioSource` returned by :meth:`source`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    key: :class:`str`
+        The key of the clip in its cache.
+    """
+
+    # the OpusHead and OpusTags packets opening every ogg opus stream
+    _OGG_HEADER_PACKETS = 2
+
+    def __init__(self, key: str, packets: Iterable[bytes], *, mapped: bool = False):
+        self.key: str = key
+        offsets = array.array("I", [0])
+        size = 0
+        self._data: bytes | mmap.mmap
+        with tempfile.TemporaryFile() if mapped else io.BytesIO() as buffer:
+            for packet in packets:
+                buffer.write(packet)
+                size += len(packet)
+                offsets.append(size)
+
+            if not mapped:
+                self._data = buffer.getvalue()
+            elif size:
+                buffer.flush()
+                self._data = mmap.mmap(buffer.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # empty files can't be mapped
+                self._data = b""
+        self._offsets: array.array[int] = offsets
+
+    @classmethod
+    def from_ogg(cls, key: str, stream: IO[bytes], *, mapped: bool = False) -> OpusClip:
+        """Creates a clip from an Ogg Opus stream, without transcoding it.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the clip.
+        stream: :term:`py:file object`
+            The Ogg Opus stream to read the packets from.
+        mapped: :class:`bool`
+            Whether to keep the packets in a memory-mapped temporary file
+            instead of in memory.
+
+        Raises
+        ------
+        OggError
+            The stream isn't a valid Ogg stream.
+        """
+        packets = OggStream(stream).iter_packets()
+        return cls(
+            key,
+            itertools.islice(packets, cls._OGG_HEADER_PACKETS, None),
+            mapped=mapped,
+        )
+
+    def __repr__(self) -> str:
+        return f"<OpusClip key={self.key!r} packets={len(self)} size={self.size}>"
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        return self._data[self._offsets[index] : self._offsets[index + 1]]
+
+    @property
+    def size(self) -> int:
+        """The size of the clip's packets, in bytes."""
+        return self._offsets[-1]
+
+    @property
+    def mapped(self) -> bool:
+        """Whether the packets are kept in a memory-mapped file."""
+        return isinstance(self._data, mmap.mmap)
+
+    @property
+    def duration(self) -> float:
+        """The duration of the clip in seconds, assuming 20 ms packets."""
+        return len(self) * OpusEncoder.FRAME_LENGTH / 1000
+
+    def source(self) -> OpusClipAudio:
+        """Returns a new :class:`AudioSource` playing the clip from its start."""
+        return OpusClipAudio(self)
+
+
+class OpusClipAudio(AudioSource):
+    """An audio source playing an :class:`OpusClip`.
+
+    Several of them can play the same clip at once.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    clip: :class:`OpusClip`
+        The clip being played.
+    """
+
+    def __init__(self, clip: OpusClip) -> None:
+        self.clip: OpusClip = clip
+        self._index: int = 0
+
+    def read(self) -> bytes:
+        index = self._index
+        if index >= len(self.clip):
+            return b""
+        self._index = index + 1
+        return self.clip[index]
+
+    def is_opus(self) -> bool:
+        return True
+
+
+class OpusClipCache:
+    """A cache of :class:`OpusClip` objects, transcoding each source with ffmpeg
+    only the first time it is loaded.
+
+    The least recently used clips are dropped once the clips take up more than
+    ``max_size`` bytes. Clips still being played are not affected.
+
+    .. versionadded:: 2.7
+
+    .. warning::
+
+        You must have the ffmpeg or avconv executable in your path environment
+        variable in order to load clips that aren't already Ogg Opus.
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        The total size of the cached clips' packets, in bytes. Defaults to 64 MiB,
+        about 70 minutes of audio at 128 kbps.
+    mapped: :class:`bool`
+        Whether to keep the packets of the clips in memory-mapped temporary files
+        instead of in memory. Defaults to ``False``.
+
+    Examples
+    --------
+
+    Playing a clip: ::
+
+        clips = discord.OpusClipCache()
+        clip = await clips.fetch("airhorn.mp3")
+        voice_client.play(clip.source())
+    """
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024, *, mapped: bool = False):
+        self.max_size: int = max_size
+        self.mapped: bool = mapped
+        self._clips: OrderedDict[str, OpusClip] = OrderedDict()
+        self._size: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        # clips being transcoded by fetch, shared by concurrent calls
+        self._fetching: dict[str, asyncio.Future[OpusClip]] = {}
+
+    def __repr__(self) -> str:
+        return f"<OpusClipCache clips={len(self)} size={self._size} max_size={self.max_size}>"
+
+    def __len__(self) -> int:
+        return len(self._clips)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._clips
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached clips' packets, in bytes."""
+        return self._size
+
+    def get(self, key: str) -> OpusClip | None:
+        """Returns the cached clip with the given key, if any."""
+        with self._lock:
+            clip = self._clips.get(key)
+            if clip is not None:
+                self._clips.move_to_end(key)
+            return clip
+
+    def add(self, clip: OpusClip) -> None:
+        """Adds a clip to the cache, replacing any with the same key.
+
+        Clips larger than :attr:`max_size` are not cached.
+        """
+        with self._lock:
+            old = self._clips.pop(clip.key, None)
+            if old is not None:
+                self._size -= old.size
+            if clip.size > self.max_size:
+                return
+
+            self._clips[clip.key] = clip
+            self._size += clip.size
+            while self._size > self.max_size:
+                _, evicted = self._clips.popitem(last=False)
+                self._size -= evicted.size
+
+    def remove(self, key: str) -> OpusClip | None:
+        """Removes the clip with the given key from the cache and returns it, if any."""
+        with self._lock:
+            clip = self._clips.pop(key, None)
+            if clip is not None:
+                self._size -= clip.size
+            return clip
+
+    def clear(self) -> None:
+        """Removes every clip from the cache."""
+        with self._lock:
+            self._clips.clear()
+            self._size = 0
+
+    def load(self, source: str, *, key: str | None = None, **options: Any) -> OpusClip:
+        r"""Returns the clip of a source, transcoding and caching it if it isn't cached.
+
+        This blocks until the transcoding is done, see :meth:`fetch` for
+        the asynchronous version.
+
+        Parameters
+        ----------
+        source: :class:`str`
+            The input that ffmpeg will take and convert to opus.
+        key: Optional[:class:`str`]
+            The key of the clip in the cache. Defaults to ``source``.
+        \*\*options
+            The parameters to pass to :class:`FFmpegOpusAudio`,
+            such as ``bitrate`` or ``before_options``.
+
+        Raises
+        ------
+        ClientException
+            The ffmpeg process failed to be created.
+        OggError
+            ffmpeg didn't produce a valid Ogg stream.
+        """
+        key = source if key is None else key
+        clip = self.get(key)
+        if clip is not None:
+            return clip
+
+        audio = FFmpegOpusAudio(source, **options)
+        try:
+            clip = OpusClip(
+                key,
+                itertools.islice(
+                    audio._packet_iter, OpusClip._OGG_HEADER_PACKETS, None
+                ),
+                mapped=self.mapped,
+            )
+        finally:
+            audio.cleanup()
+
+        self.add(clip)
+        return clip
+
+    async def fetch(
+        self, source: str, *, key: str | None = None, **options: Any
+    ) -> OpusClip:
+        r"""|coro|
+
+        Returns the clip of a source, transcoding and caching it in a thread
+        if it isn't cached.
+
+        Parameters
+        ----------
+        source: :class:`str`
+            The input that ffmpeg will take and convert to opus.
+        key: Optional[:class:`str`]
+            The key of the clip in the cache. Defaults to ``source``.
+        \*\*options
+            The parameters to pass to :class:`FFmpegOpusAudio`,
+            such as ``bitrate`` or ``before_options``.
+
+        Raises
+        ------
+        ClientException
+            The ffmpeg process failed to be created.
+        OggError
+            ffmpeg didn't produce a valid Ogg stream.
+        """
+        key = source if key is None else key
+        clip = self.get(key)
+        if clip is not None:
+            return clip
+
+        future = self._fetching.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                None, lambda: self.load(source, key=key, **options)
+            )
+            self._fetching[key] = future
+            future.add_done_callback(lambda _: self._fetching.pop(key, None))
+        # a caller being cancelled must not cancel the others
+        return await asyncio.shield(future)
 
 
 class AudioPlayer(threading.Thread):
@@ -852,3 +1384,366 @@ class AudioPlayer(threading.Thread):
     def played_frames(self) -> int:
         """Gets the number of 20ms frames played since the start of the audio file."""
         return self._played_frames_offset + self.loops
+
+
+class VoiceSchedulerStats(NamedTuple):
+    """The timing statistics of a :class:`VoiceScheduler`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    players: :class:`int`
+        The number of players currently driven by the scheduler.
+    ticks: :class:`int`
+        The number of 20 ms ticks run, summed over the worker threads.
+    late_ticks: :class:`int`
+        The number of ticks that started later than the scheduler's
+        ``late_threshold``.
+    skipped_ticks: :class:`int`
+        The number of ticks given up on after falling too far behind.
+    average_lateness: :class:`float`
+        The average delay, in seconds, between when ticks were due and
+        when they started.
+    max_lateness: :class:`float`
+        The largest such delay, in seconds.
+    """
+
+    players: int
+    ticks: int
+    late_ticks: int
+    skipped_ticks: int
+    average_lateness: float
+    max_lateness: float
+
+
+class _SchedulerWorker(threading.Thread):
+    def __init__(self, scheduler: VoiceScheduler, index: int) -> None:
+        super().__init__(daemon=True, name=f"pycord-voice-scheduler-{index}")
+        self.scheduler: VoiceScheduler = scheduler
+        self.players: list[ScheduledAudioPlayer] = []
+        self._condition: threading.Condition = threading.Condition()
+        self._closed: bool = False
+
+        self.ticks: int = 0
+        self.late_ticks: int = 0
+        self.skipped_ticks: int = 0
+        self.total_lateness: float = 0.0
+        self.max_lateness: float = 0.0
+
+    @property
+    def dead(self) -> bool:
+        # closed, or started and since exited; threads can't be restarted
+        return self._closed or (self.ident is not None and not self.is_alive())
+
+    def add(self, player: ScheduledAudioPlayer) -> None:
+        with self._condition:
+            self.players.append(player)
+            self._condition.notify()
+            if self.ident is None:
+                self.start()
+
+    def remove(self, player: ScheduledAudioPlayer) -> None:
+        with self._condition:
+            try:
+                self.players.remove(player)
+            except ValueError:
+                pass
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def run(self) -> None:
+        delay = self.scheduler.DELAY
+        late_threshold = self.scheduler.late_threshold
+        max_lag = delay * self.scheduler.MAX_CATCH_UP
+        start = None
+        tick = 0
+        while True:
+            with self._condition:
+                if not self.players:
+                    start = None
+                    while not self.players and not self._closed:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                players = self.players.copy()
+
+            if start is None:
+                start = time.perf_counter()
+                tick = 0
+
+            due = start + delay * tick
+            lateness = time.perf_counter() - due
+            if lateness > max_lag:
+                # too far behind to catch up, drop the missed ticks
+                skipped = int(lateness // delay)
+                self.skipped_ticks += skipped
+                tick += skipped
+                due = start + delay * tick
+                lateness = time.perf_counter() - due
+
+            lateness = max(lateness, 0.0)
+            self.ticks += 1
+            self.total_lateness += lateness
+            self.max_lateness = max(self.max_lateness, lateness)
+            if lateness > late_threshold:
+                self.late_ticks += 1
+
+            # prepare every packet of the tick first, then send them
+            # back to back so they leave as close together as possible
+            packets = []
+            for player in players:
+                try:
+                    packet = player._tick()
+                except Exception as exc:
+                    self._fail(player, exc)
+                    continue
+                if packet is not None:
+                    packets.append((player, *packet))
+            for player, client, packet in packets:
+                try:
+                    client._send_packet(packet)
+                except Exception as exc:
+                    # e.g. the socket was closed by a disconnect, only this
+                    # player is affected so the others keep playing
+                    self._fail(player, exc)
+
+            tick += 1
+            wait = start + delay * tick - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+
+    def _fail(self, player: ScheduledAudioPlayer, exc: Exception) -> None:
+        _log.debug("Stopping scheduled player %r after an error.", player, exc_info=exc)
+        try:
+            player._current_error = exc
+            player.stop()
+            player._finish()
+        except Exception:
+            _log.exception("Failed to stop scheduled player %r.", player)
+            self.remove(player)
+
+
+class VoiceScheduler:
+    """Drives the audio playback of any number of voice clients from a
+    shared pool of threads, instead of one thread per playing voice client.
+
+    Every 20 ms, each worker thread reads and encodes a frame for every
+    player it drives, then sends all the packets of that tick together.
+    Use it through the ``voice_scheduler`` option of :class:`Client`;
+    multiple clients can share one scheduler.
+
+    Sources played through a scheduler must be able to return frames
+    without blocking, as a slow source delays every other player on the
+    same worker. The first frame is read before the player is scheduled,
+    so sources that take a while to start are fine.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    workers: :class:`int`
+        The number of worker threads, players are assigned to the least
+        busy one. Defaults to ``1``.
+    late_threshold: :class:`float`
+        The delay, in seconds, after which a tick counts as late in
+        :attr:`stats`. Defaults to ``0.005``.
+
+    Raises
+    ------
+    ValueError
+        ``workers`` is lower than 1.
+    """
+
+    DELAY: float = OpusEncoder.FRAME_LENGTH / 1000.0
+    # the number of ticks a worker may fall behind before dropping them
+    MAX_CATCH_UP: int = 5
+
+    def __init__(self, *, workers: int = 1, late_threshold: float = 0.005) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+
+        self.late_threshold: float = late_threshold
+        self._lock: threading.Lock = threading.Lock()
+        self._workers: list[_SchedulerWorker] = [
+            _SchedulerWorker(self, index) for index in range(workers)
+        ]
+        # runs the blocking parts of starting and finishing playback,
+        # away from the workers' ticks, created on demand
+        self._pool: ThreadPoolExecutor | None = None
+
+    def __repr__(self) -> str:
+        return f"<VoiceScheduler workers={len(self._workers)}>"
+
+    @property
+    def stats(self) -> VoiceSchedulerStats:
+        """The timing statistics of the scheduler."""
+        workers = self._workers
+        ticks = sum(w.ticks for w in workers)
+        return VoiceSchedulerStats(
+            players=sum(len(w.players) for w in workers),
+            ticks=ticks,
+            late_ticks=sum(w.late_ticks for w in workers),
+            skipped_ticks=sum(w.skipped_ticks for w in workers),
+            average_lateness=(
+                sum(w.total_lateness for w in workers) / ticks if ticks else 0.0
+            ),
+            max_lateness=max(w.max_lateness for w in workers),
+        )
+
+    def close(self) -> None:
+        """Stops the worker threads. Players still scheduled stop sending audio.
+
+        The scheduler can still be used afterwards, new worker threads are
+        started when something is played through it again.
+        """
+        with self._lock:
+            for worker in self._workers:
+                worker.close()
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="pycord-voice-scheduler-io"
+                )
+            return self._pool
+
+    def _replace_worker(self, index: int) -> _SchedulerWorker:
+        old = self._workers[index]
+        worker = _SchedulerWorker(self, index)
+        # keep the statistics cumulative across replacements
+        worker.ticks = old.ticks
+        worker.late_ticks = old.late_ticks
+        worker.skipped_ticks = old.skipped_ticks
+        worker.total_lateness = old.total_lateness
+        worker.max_lateness = old.max_lateness
+        if not old._closed:
+            # the thread died unexpectedly, move its players over
+            with old._condition:
+                players, old.players = old.players, []
+            for player in players:
+                player._worker = worker
+                worker.add(player)
+        self._workers[index] = worker
+        return worker
+
+    def _add(self, player: ScheduledAudioPlayer) -> None:
+        with self._lock:
+            for index, worker in enumerate(self._workers):
+                if worker.dead:
+                    self._replace_worker(index)
+            worker = min(self._workers, key=lambda w: len(w.players))
+            player._worker = worker
+            worker.add(player)
+
+    def _remove(self, player: ScheduledAudioPlayer) -> None:
+        if player._worker is not None:
+            player._worker.remove(player)
+
+
+class ScheduledAudioPlayer(AudioPlayer):
+    """An :class:`AudioPlayer` whose frames are sent by a :class:`VoiceScheduler`
+    rather than by its own thread.
+
+    It still derives from :class:`AudioPlayer`, and so from :class:`threading.Thread`,
+    to share its playback state and controls with the voice client, but the
+    thread itself is never started: :meth:`start` hands the player to the
+    scheduler instead.
+    """
+
+    def __init__(
+        self,
+        source: AudioSource,
+        client: VoiceClient,
+        scheduler: VoiceScheduler,
+        *,
+        after=None,
+    ):
+        super().__init__(source, client, after=after)
+        self.scheduler: VoiceScheduler = scheduler
+        self._worker: _SchedulerWorker | None = None
+        self._first_data: bytes | None = None
+        self._reconnecting: bool = False
+        self._finished: bool = False
+        self.loops: int = 0
+
+    def start(self) -> None:
+        self.scheduler._executor.submit(self._prepare)
+
+    def _prepare(self) -> None:
+        # attempt to read first audio segment from source before scheduling
+        # some sources can take a few seconds and would stall the tick
+        try:
+            self._first_data = self.source.read()
+        except Exception as exc:
+            self._current_error = exc
+            self.stop()
+            self._finalize()
+            return
+
+        self._speak(True)
+        self.scheduler._add(self)
+
+    def _tick(self) -> tuple[VoiceClient, bytes] | None:
+        if self._end.is_set():
+            self._finish()
+            return None
+
+        # are we paused?
+        if not self._resumed.is_set():
+            return None
+
+        # are we disconnected from voice?
+        if not self._connected.is_set():
+            self._reconnecting = True
+            return None
+
+        if self._reconnecting:
+            # reset our internal data
+            self._reconnecting = False
+            self._played_frames_offset += self.loops
+            self.loops = 0
+
+        try:
+            with self._lock:
+                self.loops += 1
+                if self._first_data is not None:
+                    data = self._first_data
+                    self._first_data = None
+                else:
+                    data = self.source.read()
+
+                if not data:
+                    self.stop()
+                    self._finish()
+                    return None
+
+                packet = self.client._prepare_audio_packet(
+                    data, encode=not self.source.is_opus()
+                )
+        except Exception as exc:
+            self._current_error = exc
+            self.stop()
+            self._finish()
+            return None
+        return self.client, packet
+
+    def _finish(self) -> None:
+        if not self._finished:
+            self._finished = True
+            self.scheduler._remove(self)
+            self.scheduler._executor.submit(self._finalize)
+
+    def _finalize(self) -> None:
+        try:
+            self.source.cleanup()
+        finally:
+            self._call_after()
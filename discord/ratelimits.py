@@ -0,0 +1,720 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import os
+import socket
+import time
+from collections import deque
+from typing import Any, Callable
+
+from . import utils
+
+try:
+    import fcntl
+except ModuleNotFoundError:
+    HAS_FCNTL = False
+else:
+    HAS_FCNTL = True
+
+__all__ = (
+    "RatelimitStore",
+    "InMemoryRatelimitStore",
+    "UnixSocketRatelimitStore",
+)
+
+_log = logging.getLogger(__name__)
+
+
+class Ratelimit:
+    """Represents the state of a single Discord rate limit bucket.
+
+    Up to :attr:`remaining` requests are allowed to be in flight at once.
+    Any further request waits until a response or the reset of the bucket
+    makes room for it.
+    """
+
+    __slots__ = (
+        "limit",
+        "remaining",
+        "outgoing",
+        "dirty",
+        "expires",
+        "last_used",
+        "_waiters",
+        "_reset_handle",
+    )
+
+    def __init__(self) -> None:
+        # until a response tells us otherwise assume a single request is allowed
+        self.limit: int = 1
+        self.remaining: int = 1
+        self.outgoing: int = 0
+        self.dirty: bool = False
+        self.expires: float | None = None
+        self.last_used: float = time.monotonic()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._reset_handle: asyncio.TimerHandle | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<Ratelimit limit={self.limit} remaining={self.remaining}"
+            f" outgoing={self.outgoing} expires={self.expires}>"
+        )
+
+    def is_inactive(self) -> bool:
+        return (
+            not self.outgoing
+            and not self._waiters
+            and time.monotonic() - self.last_used > 300.0
+        )
+
+    def reset(self) -> None:
+        self.remaining = self.limit - self.outgoing
+        self.expires = None
+        self.dirty = False
+        self._reset_handle = None
+        self._wake()
+
+    def update(self, limit: int, remaining: int, reset_after: float) -> None:
+        self.limit = limit
+        # the request being updated from is still counted as outgoing
+        remaining -= self.outgoing - 1
+        # responses can arrive out of order, so never trust a count
+        # higher than the one already known for the current window
+        if self.dirty:
+            remaining = min(self.remaining, remaining)
+        self.remaining = max(remaining, 0)
+        self.dirty = True
+
+        expires = time.monotonic() + reset_after
+        if self.expires is None or expires > self.expires:
+            if self._reset_handle is not None:
+                self._reset_handle.cancel()
+            self.expires = expires
+            self._reset_handle = asyncio.get_running_loop().call_later(
+                reset_after, self.reset
+            )
+
+        self._wake()
+
+    def _wake(self) -> None:
+        count = self.remaining
+        waiters = self._waiters
+        while count > 0 and waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                count -= 1
+
+    async def acquire(self) -> None:
+        self.last_used = time.monotonic()
+        while self.remaining <= 0:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                # pass the wake up on if it was given to us right before cancelling
+                if not future.cancelled():
+                    self._wake()
+                raise
+
+        self.remaining -= 1
+        self.outgoing += 1
+
+    def release(self) -> None:
+        if self.outgoing <= 0:
+            # nothing is in flight, e.g. a release from before a failover
+            return
+
+        self.outgoing -= 1
+        if self.expires is None:
+            # no reset is pending for this bucket, so the slot is handed
+            # back directly instead of waiting for the window to reset
+            self.remaining = min(self.remaining + 1, self.limit - self.outgoing)
+        self._wake()
+
+
+class RatelimitStore:
+    """Represents where the rate limit state of an HTTP client is kept.
+
+    Subclass this to share rate limits between several clients, e.g. the
+    processes of a bot split across a cluster. Buckets are identified by
+    opaque strings built from a route's bucket hash and major parameters.
+
+    .. versionadded:: 2.7
+    """
+
+    async def get_bucket_hash(self, key: str) -> str | None:
+        """|coro|
+
+        Returns the bucket hash Discord assigned to a route, if known.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The method and path of the route.
+        """
+        raise NotImplementedError
+
+    async def set_bucket_hash(
+        self, key: str, bucket_hash: str, moved: tuple[str, str] | None = None
+    ) -> None:
+        """|coro|
+
+        Stores the bucket hash Discord assigned to a route.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The method and path of the route.
+        bucket_hash: :class:`str`
+            The value of the ``X-RateLimit-Bucket`` header.
+        moved: Optional[Tuple[:class:`str`, :class:`str`]]
+            The bucket the request was made on and the bucket it maps to with
+            the new hash. If the latter isn't tracked yet, it should share the
+            state of the former.
+        """
+        raise NotImplementedError
+
+    async def acquire_request(
+        self, key: str, major_parameters: str, is_global: bool = True
+    ) -> tuple[str | None, str]:
+        """|coro|
+
+        Looks up the bucket of a route and acquires it, along with the global
+        rate limit. The HTTP client calls this once before each request, so
+        stores kept in another process can do it in a single round trip.
+
+        By default this calls :meth:`get_bucket_hash`, :meth:`acquire`
+        and :meth:`acquire_global` in turn.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The method and path of the route.
+        major_parameters: :class:`str`
+            The major parameters of the route, identifying its bucket
+            along with the bucket hash.
+        is_global: :class:`bool`
+            Whether the request counts towards the global rate limit.
+
+        Returns
+        -------
+        Tuple[Optional[:class:`str`], :class:`str`]
+            The bucket hash of the route, if known, and the bucket acquired.
+        """
+        bucket_hash = await self.get_bucket_hash(key)
+        bucket = f"{bucket_hash or key}:{major_parameters}"
+        await self.acquire(bucket)
+        if is_global:
+            try:
+                await self.acquire_global()
+            except BaseException:
+                await self.release(bucket)
+                raise
+        return bucket_hash, bucket
+
+    async def acquire(self, bucket: str) -> None:
+        """|coro|
+
+        Waits until a request can be made on a bucket and counts it as in flight.
+
+        Parameters
+        ----------
+        bucket: :class:`str`
+            The bucket the request is made on.
+        """
+        raise NotImplementedError
+
+    async def update(
+        self, bucket: str, limit: int, remaining: int, reset_after: float
+    ) -> None:
+        """|coro|
+
+        Updates a bucket from the rate limit headers of a response to a request
+        that is still counted as in flight.
+
+        Parameters
+        ----------
+        bucket: :class:`str`
+            The bucket the request was made on.
+        limit: :class:`int`
+            The number of requests allowed per window.
+        remaining: :class:`int`
+            The number of requests left in the current window.
+        reset_after: :class:`float`
+            The number of seconds until the window resets.
+        """
+        raise NotImplementedError
+
+    async def release(
+        self, bucket: str, update: tuple[int, int, float] | None = None
+    ) -> None:
+        """|coro|
+
+        Marks a request acquired with :meth:`acquire` as finished.
+
+        Parameters
+        ----------
+        bucket: :class:`str`
+            The bucket the request was made on.
+        update: Optional[Tuple[:class:`int`, :class:`int`, :class:`float`]]
+            The ``limit``, ``remaining`` and ``reset_after`` of the last response
+            to the request, applied as with :meth:`update` before releasing it.
+        """
+        raise NotImplementedError
+
+    async def acquire_global(self) -> None:
+        """|coro|
+
+        Waits until a request can be made without exceeding the global rate limit.
+        """
+        raise NotImplementedError
+
+    async def set_global_ratelimit(self, retry_after: float) -> None:
+        """|coro|
+
+        Blocks :meth:`acquire_global` after a global rate limit has been hit.
+
+        Parameters
+        ----------
+        retry_after: :class:`float`
+            The number of seconds to block requests for.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """|coro|
+
+        Releases any resource held by the store. Called when the client is closed.
+        """
+        return
+
+
+class InMemoryRatelimitStore(RatelimitStore):
+    """A :class:`RatelimitStore` that keeps the rate limit state in the current process.
+
+    This is the store used by default.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    max_global_requests: :class:`int`
+        The maximum number of requests per second before pre-emptively waiting
+        for the global rate limit to reset. Defaults to ``50``.
+    """
+
+    def __init__(self, *, max_global_requests: int = 50) -> None:
+        self.max_global_requests: int = max_global_requests
+        # route key -> bucket hash given in the X-Ratelimit-Bucket header
+        self._bucket_hashes: dict[str, str] = {}
+        self._buckets: dict[str, Ratelimit] = {}
+        self._buckets_cleanup_threshold: int = 1024
+        self._global_over: asyncio.Event = asyncio.Event()
+        self._global_over.set()
+        self._global_over_handle: asyncio.TimerHandle | None = None
+        self._global_remaining: int = max_global_requests
+        self._global_reset: float = 0.0
+
+    def _get_ratelimit(self, bucket: str) -> Ratelimit:
+        try:
+            return self._buckets[bucket]
+        except KeyError:
+            pass
+
+        if len(self._buckets) >= self._buckets_cleanup_threshold:
+            self._clear_inactive_ratelimits()
+
+        self._buckets[bucket] = ratelimit = Ratelimit()
+        return ratelimit
+
+    def _clear_inactive_ratelimits(self) -> None:
+        inactive = [key for key, value in self._buckets.items() if value.is_inactive()]
+        for key in inactive:
+            del self._buckets[key]
+
+        # sweeping again only once the mapping has doubled keeps this amortized O(1)
+        self._buckets_cleanup_threshold = max(1024, len(self._buckets) * 2)
+
+    async def get_bucket_hash(self, key: str) -> str | None:
+        return self._bucket_hashes.get(key)
+
+    async def set_bucket_hash(
+        self, key: str, bucket_hash: str, moved: tuple[str, str] | None = None
+    ) -> None:
+        self._bucket_hashes[key] = bucket_hash
+        if moved is not None:
+            old, new = moved
+            ratelimit = self._buckets.get(old)
+            if ratelimit is not None and new not in self._buckets:
+                # both names refer to the same state, in flight requests
+                # still release the old one
+                self._buckets[new] = ratelimit
+
+    async def acquire(self, bucket: str) -> None:
+        await self._get_ratelimit(bucket).acquire()
+
+    async def update(
+        self, bucket: str, limit: int, remaining: int, reset_after: float
+    ) -> None:
+        self._get_ratelimit(bucket).update(limit, remaining, reset_after)
+
+    async def release(
+        self, bucket: str, update: tuple[int, int, float] | None = None
+    ) -> None:
+        ratelimit = self._buckets.get(bucket)
+        if ratelimit is not None:
+            if update is not None:
+                ratelimit.update(*update)
+            ratelimit.release()
+
+    async def acquire_global(self) -> None:
+        # pre-emptively stay under the global rate limit instead of waiting for a 429
+        while True:
+            if not self._global_over.is_set():
+                await self._global_over.wait()
+
+            now = time.monotonic()
+            if now >= self._global_reset:
+                self._global_reset = now + 1.0
+                self._global_remaining = self.max_global_requests
+
+            if self._global_remaining > 0:
+                self._global_remaining -= 1
+                return
+
+            await asyncio.sleep(self._global_reset - now)
+
+    async def set_global_ratelimit(self, retry_after: float) -> None:
+        if self._global_over_handle is not None:
+            self._global_over_handle.cancel()
+
+        self._global_over.clear()
+        self._global_over_handle = asyncio.get_running_loop().call_later(
+            retry_after, self._global_over.set
+        )
+
+
+# operations a process connected to the serving process may request, and
+# whether the caller waits for their result
+_REMOTE_OPERATIONS: dict[str, bool] = {
+    "get_bucket_hash": True,
+    "set_bucket_hash": False,
+    "acquire_request": True,
+    "acquire": True,
+    "update": False,
+    "release": False,
+    "acquire_global": True,
+    "set_global_ratelimit": False,
+}
+
+
+class UnixSocketRatelimitStore(RatelimitStore):
+    """A :class:`RatelimitStore` shared by the processes of a host through a Unix socket.
+
+    The first process to use the socket path keeps the rate limit state in an
+    :class:`InMemoryRatelimitStore` and serves it to the other processes. If
+    that process exits, the next request made by one of the remaining processes
+    takes over, and the slots held by a disconnected process are handed back.
+
+    This is only available on platforms supporting Unix sockets.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the Unix socket. A lock file is created next to it
+        to elect the serving process.
+    max_global_requests: :class:`int`
+        The maximum number of requests per second, across all processes, before
+        pre-emptively waiting for the global rate limit to reset. Defaults to ``50``.
+    """
+
+    def __init__(self, path: str, *, max_global_requests: int = 50) -> None:
+        if not hasattr(socket, "AF_UNIX") or not HAS_FCNTL:
+            raise RuntimeError("Unix sockets are not supported on this platform")
+
+        self.path: str = path
+        self.max_global_requests: int = max_global_requests
+        self._local: InMemoryRatelimitStore | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._lock_fd: int | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._read_task: asyncio.Task | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._nonces = itertools.count()
+        self._connecting: asyncio.Lock | None = None
+
+    def _try_lock(self) -> bool:
+        fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        self._lock_fd = fd
+        return True
+
+    async def _connect(self) -> None:
+        if self._connecting is None:
+            self._connecting = asyncio.Lock()
+
+        async with self._connecting:
+            if self._local is not None or self._writer is not None:
+                return
+
+            while True:
+                # whoever holds the lock file serves the state, the lock is
+                # released by the OS if that process dies
+                if self._try_lock():
+                    await self._serve()
+                    return
+
+                try:
+                    reader, writer = await asyncio.open_unix_connection(self.path)
+                except OSError:
+                    # the serving process is still starting up
+                    await asyncio.sleep(0.1)
+                    continue
+
+                self._writer = writer
+                self._read_task = asyncio.create_task(self._read_responses(reader))
+                _log.debug("Connected to shared rate limit state on %s", self.path)
+                return
+
+    async def _serve(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+        self._local = InMemoryRatelimitStore(
+            max_global_requests=self.max_global_requests
+        )
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=self.path
+        )
+        _log.info("Serving shared rate limit state on %s", self.path)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # number of in flight requests per bucket of the connected process
+        held: dict[str, int] = {}
+        tasks: set[asyncio.Task] = set()
+        try:
+            async for line in reader:
+                payload = utils._from_json(line)
+                task = asyncio.create_task(self._handle_request(payload, writer, held))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            local = self._local
+            if local is not None:
+                for bucket, count in held.items():
+                    for _ in range(count):
+                        await local.release(bucket)
+
+            writer.close()
+
+    async def _handle_request(
+        self,
+        payload: dict[str, Any],
+        writer: asyncio.StreamWriter,
+        held: dict[str, int],
+    ) -> None:
+        op = payload["op"]
+        args = payload["args"]
+        if op not in _REMOTE_OPERATIONS:
+            return
+
+        if op == "release":
+            # only hand back slots acquired through this connection, a process
+            # that reconnected after a failover may release slots it held on
+            # the previous serving process
+            if not held.get(args[0]):
+                return
+            held[args[0]] -= 1
+
+        result = await getattr(self._local, op)(*args)
+        if op == "acquire":
+            held[args[0]] = held.get(args[0], 0) + 1
+        elif op == "acquire_request":
+            bucket = result[1]
+            held[bucket] = held.get(bucket, 0) + 1
+
+        if "n" in payload and not writer.is_closing():
+            writer.write(
+                utils._to_json({"n": payload["n"], "r": result}).encode() + b"\n"
+            )
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        try:
+            async for line in reader:
+                payload = utils._from_json(line)
+                future = self._pending.pop(payload["n"], None)
+                if future is not None and not future.done():
+                    future.set_result(payload["r"])
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+            pending = self._pending
+            self._pending = {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionResetError())
+
+    def _send(self, payload: dict[str, Any]) -> None:
+        writer = self._writer
+        if writer is None or writer.is_closing():
+            raise ConnectionResetError()
+        writer.write(utils._to_json(payload).encode() + b"\n")
+
+    async def _request(self, op: str, *args: Any) -> Any:
+        while True:
+            await self._connect()
+            if self._local is not None:
+                return await getattr(self._local, op)(*args)
+
+            if not _REMOTE_OPERATIONS[op]:
+                try:
+                    self._send({"op": op, "args": args})
+                except ConnectionResetError:
+                    # the state this belongs to went away with the serving process
+                    pass
+                return None
+
+            nonce = next(self._nonces)
+            future = asyncio.get_running_loop().create_future()
+            self._pending[nonce] = future
+            try:
+                self._send({"n": nonce, "op": op, "args": args})
+                return await asyncio.shield(future)
+            except ConnectionResetError:
+                self._pending.pop(nonce, None)
+                _log.info(
+                    "Lost connection to shared rate limit state on %s, reconnecting.",
+                    self.path,
+                )
+                continue
+            except asyncio.CancelledError:
+                # hand the slot back once it is granted
+                if op == "acquire":
+                    future.add_done_callback(self._release_abandoned(args[0]))
+                elif op == "acquire_request":
+                    future.add_done_callback(self._release_abandoned())
+                raise
+
+    def _release_abandoned(
+        self, bucket: str | None = None
+    ) -> Callable[[asyncio.Future], None]:
+        def callback(future: asyncio.Future) -> None:
+            if future.exception() is not None:
+                return
+
+            # acquire_request only tells which bucket it acquired in its result
+            name = future.result()[1] if bucket is None else bucket
+            try:
+                self._send({"op": "release", "args": [name]})
+            except ConnectionResetError:
+                pass
+
+        return callback
+
+    async def get_bucket_hash(self, key: str) -> str | None:
+        return await self._request("get_bucket_hash", key)
+
+    async def set_bucket_hash(
+        self, key: str, bucket_hash: str, moved: tuple[str, str] | None = None
+    ) -> None:
+        await self._request("set_bucket_hash", key, bucket_hash, moved)
+
+    async def acquire_request(
+        self, key: str, major_parameters: str, is_global: bool = True
+    ) -> tuple[str | None, str]:
+        bucket_hash, bucket = await self._request(
+            "acquire_request", key, major_parameters, is_global
+        )
+        return bucket_hash, bucket
+
+    async def acquire(self, bucket: str) -> None:
+        await self._request("acquire", bucket)
+
+    async def update(
+        self, bucket: str, limit: int, remaining: int, reset_after: float
+    ) -> None:
+        await self._request("update", bucket, limit, remaining, reset_after)
+
+    async def release(
+        self, bucket: str, update: tuple[int, int, float] | None = None
+    ) -> None:
+        await self._request("release", bucket, update)
+
+    async def acquire_global(self) -> None:
+        await self._request("acquire_global")
+
+    async def set_global_ratelimit(self, retry_after: float) -> None:
+        await self._request("set_global_ratelimit", retry_after)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+        if self._read_task is not None:
+            self._read_task.cancel()
+            self._read_task = None
+
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+        self._local = None
@@ -309,6 +309,15 @@ class ShardInfo:
         """
         return self._parent.ws.is_ratelimited()
 
+    @property
+    def compression_ratio(self) -> float:
+        """The ratio of decompressed to compressed bytes received by this shard
+        over its current connection.
+
+        .. versionadded:: 2.7
+        """
+        return self._parent.ws.compression_ratio
+
 
 class AutoShardedClient(Client):
     """A client similar to :class:`Client` except it handles the complications
@@ -441,10 +450,14 @@ class AutoShardedClient(Client):
         ret.launch()
 
     async def launch_shards(self) -> None:
+        decompressor = self._gateway_compression
+        compress = decompressor and decompressor.COMPRESSION_TYPE
         if self.shard_count is None:
-            self.shard_count, gateway = await self.http.get_bot_gateway()
+            self.shard_count, gateway = await self.http.get_bot_gateway(
+                compress=compress
+            )
         else:
-            gateway = await self.http.get_gateway()
+            gateway = await self.http.get_gateway(compress=compress)
 
         self._connection.shard_count = self.shard_count
 
@@ -53,6 +53,8 @@ else:
     CREATE_NO_WINDOW = 0x08000000
 
 
+_rtp_header = struct.Struct(">xxHII")
+
 default_filters = {
     "time": 0,
     "users": [],
@@ -104,17 +106,13 @@ class RawData:
     """
 
     def __init__(self, data, client):
-        self.data = bytearray(data)
         self.client = client
 
         self.header = data[:12]
-        self.data = self.data[12:]
+        self.data = bytearray(memoryview(data)[12:])
 
-        unpacker = struct.Struct(">xxHII")
-        self.sequence, self.timestamp, self.ssrc = unpacker.unpack_from(self.header)
-        self.decrypted_data = getattr(self.client, f"_decrypt_{self.client.mode}")(
-            self.header, self.data
-        )
+        self.sequence, self.timestamp, self.ssrc = _rtp_header.unpack_from(self.header)
+        self.decrypted_data = self.client._packetizer.decrypt(self.header, self.data)
         self.decoded_data = None
 
         self.user_id = None
@@ -125,11 +123,19 @@ class AudioData:
     """Handles data that's been completely decrypted and decoded and is ready to be saved to file.
 
     .. versionadded:: 2.0
+
+    Attributes
+    ----------
+    error: Optional[:class:`Exception`]
+        The error that prevented the audio from being formatted, if any.
+
+        .. versionadded:: 2.7
     """
 
     def __init__(self, file):
         self.file = file
         self.finished = False
+        self.error: Exception | None = None
 
     def write(self, data):
         """Writes audio data.
@@ -87,3 +87,10 @@ class MKASinkError(SinkException):
 
     .. versionadded:: 2.0
     """
+
+
+class FFmpegSinkError(SinkException):
+    """Exception thrown when an exception occurs with :class:`FFmpegSink`
+
+    .. versionadded:: 2.7
+    """
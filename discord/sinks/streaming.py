@@ -0,0 +1,235 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+
+from .core import CREATE_NO_WINDOW, AudioData, Filters, Sink
+from .errors import FFmpegSinkError
+
+__all__ = (
+    "TempFileSink",
+    "FFmpegSink",
+)
+
+
+class TempFileSink(Sink):
+    """A sink for .pcm files which keeps each user's audio in a temporary file,
+    instead of in memory for the whole recording.
+
+    Up to ``max_memory`` bytes of each user's audio are kept in memory,
+    beyond which it is moved to a temporary file on disk. The files are
+    deleted once closed or garbage collected.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    max_memory: :class:`int`
+        The number of bytes of each user's audio to keep in memory before
+        moving it to disk. Defaults to 1 MiB, about 5 seconds of audio.
+    directory: Optional[:class:`str`]
+        The directory to create the temporary files in. Defaults to the
+        platform's temporary directory.
+    """
+
+    def __init__(
+        self,
+        *,
+        filters=None,
+        max_memory: int = 1024 * 1024,
+        directory: str | None = None,
+    ):
+        super().__init__(filters=filters)
+        self.encoding = "pcm"
+        self.max_memory: int = max_memory
+        self.directory: str | None = directory
+
+    @Filters.container
+    def write(self, data, user):
+        if user not in self.audio_data:
+            file = tempfile.SpooledTemporaryFile(
+                max_size=self.max_memory, dir=self.directory
+            )
+            self.audio_data.update({user: AudioData(file)})
+
+        file = self.audio_data[user]
+        file.write(data)
+
+    def format_audio(self, audio):
+        return
+
+
+class FFmpegSink(Sink):
+    """A sink which encodes each user's audio as it is received, by piping it
+    into an ffmpeg process writing to a temporary file.
+
+    Unlike the other formatted sinks, which encode the whole recording held in
+    memory once it is finished, the memory used does not grow with the length
+    of the recording. Only formats which can be written without seeking are
+    supported.
+
+    If an encoder fails, the error is recorded in the :attr:`AudioData.error`
+    of the user's audio rather than raised, so that the other users' audio
+    still reaches the callback of :meth:`VoiceClient.start_recording`.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    encoding: :class:`str`
+        The format to encode to, one of ``"mp3"``, ``"ogg"`` or ``"mka"``.
+        Defaults to ``"mp3"``.
+    executable: :class:`str`
+        The ffmpeg executable to use. Defaults to ``"ffmpeg"``.
+    directory: Optional[:class:`str`]
+        The directory to create the temporary files in. Defaults to the
+        platform's temporary directory.
+
+    Raises
+    ------
+    FFmpegSinkError
+        The encoding is not supported.
+    """
+
+    FORMATS = {
+        "mp3": "mp3",
+        "ogg": "ogg",
+        "mka": "matroska",
+    }
+
+    def __init__(
+        self,
+        *,
+        filters=None,
+        encoding: str = "mp3",
+        executable: str = "ffmpeg",
+        directory: str | None = None,
+    ):
+        if encoding not in self.FORMATS:
+            raise FFmpegSinkError(
+                f"encoding must be one of {', '.join(self.FORMATS)}, not {encoding!r}."
+            )
+
+        super().__init__(filters=filters)
+        self.encoding = encoding
+        self.executable: str = executable
+        self.directory: str | None = directory
+        self._processes: dict[AudioData, subprocess.Popen] = {}
+
+    def init(self, vc):
+        """Checks that ffmpeg can be found before recording starts.
+
+        Raises
+        ------
+        FFmpegSinkError
+            ffmpeg was not found.
+        """
+        if shutil.which(self.executable) is None:
+            raise FFmpegSinkError(f"{self.executable} was not found.")
+        super().init(vc)
+
+    def _start_encoder(self, file) -> subprocess.Popen:
+        decoder = self.vc.decoder
+        args = [
+            self.executable,
+            "-f",
+            "s16le",
+            "-ar",
+            str(decoder.SAMPLING_RATE),
+            "-ac",
+            str(decoder.CHANNELS),
+            "-loglevel",
+            "error",
+            "-i",
+            "-",
+            "-f",
+            self.FORMATS[self.encoding],
+            "pipe:1",
+        ]
+        try:
+            return subprocess.Popen(
+                args,
+                creationflags=CREATE_NO_WINDOW,
+                stdin=subprocess.PIPE,
+                stdout=file,
+            )
+        except FileNotFoundError:
+            raise FFmpegSinkError(f"{self.executable} was not found.") from None
+        except subprocess.SubprocessError as exc:
+            raise FFmpegSinkError(
+                "Popen failed: {0.__class__.__name__}: {0}".format(exc)
+            ) from exc
+
+    @Filters.container
+    def write(self, data, user):
+        if user not in self.audio_data:
+            file = tempfile.TemporaryFile(dir=self.directory)
+            audio = AudioData(file)
+            self._processes[audio] = self._start_encoder(file)
+            self.audio_data.update({user: audio})
+
+        audio = self.audio_data[user]
+        if audio.finished:
+            raise FFmpegSinkError("The AudioData is already finished writing.")
+        try:
+            self._processes[audio].stdin.write(data)
+        except (BrokenPipeError, ValueError):
+            # the encoder exited, its error is recorded when formatting
+            pass
+
+    def cleanup(self):
+        # the encoders share the files' offsets, so they have to be done
+        # writing before the files are rewound
+        for process in self._processes.values():
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            process.wait()
+        super().cleanup()
+
+    def format_audio(self, audio):
+        """Checks that the audio was encoded, setting its :attr:`AudioData.error`
+        if it wasn't.
+
+        Raises
+        ------
+        FFmpegSinkError
+            Audio may only be formatted after recording is finished.
+        """
+        if self.vc.recording:
+            raise FFmpegSinkError(
+                "Audio may only be formatted after recording is finished."
+            )
+        returncode = self._processes[audio].returncode
+        if returncode:
+            audio.error = FFmpegSinkError(
+                f"{self.executable} exited with code {returncode}."
+            )
+            return
+        audio.on_format(self.encoding)
@@ -31,13 +31,14 @@ import inspect
 import itertools
 import logging
 import os
-from collections import OrderedDict, deque
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Coroutine,
-    Deque,
+    Iterator,
+    MutableMapping,
     Sequence,
     TypeVar,
     Union,
@@ -47,6 +48,7 @@ from . import utils
 from .activity import BaseActivity
 from .audit_logs import AuditLogEntry
 from .automod import AutoModRule
+from .cache import CACHE_TYPES, NameIndex
 from .channel import *
 from .channel import _channel_factory
 from .emoji import AppEmoji, GuildEmoji
@@ -56,7 +58,7 @@ from .guild import Guild
 from .integrations import _integration_factory
 from .interactions import Interaction
 from .invite import Invite
-from .member import Member
+from .member import Member, _CompactUsers
 from .mentions import AllowedMentions
 from .message import Message
 from .monetization import Entitlement
@@ -70,11 +72,12 @@ from .stage_instance import StageInstance
 from .sticker import GuildSticker
 from .threads import Thread, ThreadMember
 from .ui.modal import Modal, ModalStore
-from .ui.view import View, ViewStore
+from .ui.view import View, ViewStore, ViewStoreStats
 from .user import ClientUser, User
 
 if TYPE_CHECKING:
     from .abc import PrivateChannel
+    from .cache import CacheFactory
     from .client import Client
     from .gateway import DiscordWebSocket
     from .guild import GuildChannel, VocalGuildChannel
@@ -143,6 +146,166 @@ class ChunkRequest:
                 future.set_result(self.buffer)
 
 
+class MessageCache:
+    """An ordered cache of messages with lookups by ID.
+
+    Once ``max_messages`` is reached, the oldest message is evicted, or the
+    least recently accessed one if ``lru`` is enabled. Optional per-channel
+    and per-guild caps evict the oldest messages of that channel or guild,
+    private messages are not subject to the per-guild cap.
+    """
+
+    __slots__ = (
+        "max_messages",
+        "max_channel_messages",
+        "max_guild_messages",
+        "lru",
+        "_messages",
+        "_channels",
+        "_guilds",
+    )
+
+    def __init__(
+        self,
+        max_messages: int,
+        *,
+        max_channel_messages: int | None = None,
+        max_guild_messages: int | None = None,
+        lru: bool = False,
+    ) -> None:
+        self.max_messages: int = max_messages
+        self.max_channel_messages: int | None = max_channel_messages
+        self.max_guild_messages: int | None = max_guild_messages
+        self.lru: bool = lru
+        self._messages: OrderedDict[int, Message] = OrderedDict()
+        # secondary indexes are only kept when the respective cap is set
+        self._channels: dict[int, OrderedDict[int, None]] | None = (
+            {} if max_channel_messages is not None else None
+        )
+        self._guilds: dict[int, OrderedDict[int, None]] | None = (
+            {} if max_guild_messages is not None else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._messages.values())
+
+    def __reversed__(self) -> Iterator[Message]:
+        return reversed(self._messages.values())
+
+    def __contains__(self, message: Any) -> bool:
+        return self._messages.get(getattr(message, "id", None)) is message
+
+    def __getitem__(self, index: int) -> Message:
+        size = len(self._messages)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("message cache index out of range")
+
+        if index < size // 2:
+            return next(itertools.islice(self, index, None))
+        return next(itertools.islice(reversed(self), size - index - 1, None))
+
+    def index(self, message: Message) -> int:
+        for index, cached in enumerate(self):
+            if cached is message:
+                return index
+        raise ValueError("message is not in the cache")
+
+    def count(self, message: Message) -> int:
+        return int(message in self)
+
+    @staticmethod
+    def _guild_id(message: Message) -> int | None:
+        guild = message.guild
+        return guild.id if guild is not None else None
+
+    def get(self, message_id: int | None) -> Message | None:
+        message = self._messages.get(message_id)  # type: ignore
+        if message is not None and self.lru:
+            self._touch(message)
+        return message
+
+    def _touch(self, message: Message) -> None:
+        message_id = message.id
+        self._messages.move_to_end(message_id)
+        if self._channels is not None:
+            self._channels[message.channel.id].move_to_end(message_id)
+        guild_id = self._guild_id(message)
+        if self._guilds is not None and guild_id is not None:
+            self._guilds[guild_id].move_to_end(message_id)
+
+    def append(self, message: Message) -> None:
+        message_id = message.id
+        if message_id in self._messages:
+            self.pop(message_id)
+
+        self._messages[message_id] = message
+        if self._channels is not None:
+            ids = self._channels.setdefault(message.channel.id, OrderedDict())
+            ids[message_id] = None
+            if len(ids) > self.max_channel_messages:  # type: ignore
+                self.pop(next(iter(ids)))
+
+        guild_id = self._guild_id(message)
+        if self._guilds is not None and guild_id is not None:
+            ids = self._guilds.setdefault(guild_id, OrderedDict())
+            ids[message_id] = None
+            if len(ids) > self.max_guild_messages:  # type: ignore
+                self.pop(next(iter(ids)))
+
+        if len(self._messages) > self.max_messages:
+            self.pop(next(iter(self._messages)))
+
+    def pop(self, message_id: int) -> Message | None:
+        message = self._messages.pop(message_id, None)
+        if message is None:
+            return None
+
+        if self._channels is not None:
+            self._discard_index(self._channels, message.channel.id, message_id)
+        if self._guilds is not None:
+            self._discard_index(self._guilds, self._guild_id(message), message_id)
+        return message
+
+    @staticmethod
+    def _discard_index(
+        indexes: dict[Any, OrderedDict[int, None]], key: Any, message_id: int
+    ) -> None:
+        ids = indexes.get(key)
+        if ids is not None:
+            ids.pop(message_id, None)
+            if not ids:
+                del indexes[key]
+
+    def remove(self, message: Message) -> None:
+        if self.pop(message.id) is None:
+            raise ValueError("message is not in the cache")
+
+    def remove_guild(self, guild_id: int) -> None:
+        if self._guilds is not None:
+            message_ids = list(self._guilds.get(guild_id, ()))
+        else:
+            message_ids = [
+                message_id
+                for message_id, message in self._messages.items()
+                if self._guild_id(message) == guild_id
+            ]
+
+        for message_id in message_ids:
+            self.pop(message_id)
+
+    def clear(self) -> None:
+        self._messages.clear()
+        if self._channels is not None:
+            self._channels.clear()
+        if self._guilds is not None:
+            self._guilds.clear()
+
+
 _log = logging.getLogger(__name__)
 
 
@@ -174,6 +337,9 @@ class ConnectionState:
         self.max_messages: int | None = options.get("max_messages", 1000)
         if self.max_messages is not None and self.max_messages <= 0:
             self.max_messages = 1000
+        self.max_channel_messages: int | None = options.get("max_channel_messages")
+        self.max_guild_messages: int | None = options.get("max_guild_messages")
+        self.message_cache_lru: bool = options.get("message_cache_lru", False)
 
         self.dispatch: Callable = dispatch
         self.handlers: dict[str, Callable] = handlers
@@ -253,6 +419,57 @@ class ConnectionState:
 
         self.cache_app_emojis: bool = options.get("cache_app_emojis", False)
 
+        compact_member_threshold = options.get("compact_member_threshold")
+        if compact_member_threshold is not None and compact_member_threshold < 0:
+            raise ValueError("compact_member_threshold must be 0 or greater")
+        self.compact_member_threshold: int | None = compact_member_threshold
+
+        cache_providers = options.get("cache_providers") or {}
+        unknown = set(cache_providers) - CACHE_TYPES
+        if unknown:
+            raise ValueError(
+                f"unknown cache_providers keys: {', '.join(map(repr, sorted(unknown)))}"
+            )
+        if compact_member_threshold is not None and "members" in cache_providers:
+            raise ValueError(
+                "compact_member_threshold cannot be used with a 'members' cache provider"
+            )
+        self._cache_providers: dict[str, CacheFactory] = dict(cache_providers)
+        self.name_index: bool = options.get("name_index", False)
+        self.cache_permissions: bool = options.get("cache_permissions", False)
+
+        # gateway events whose parsers never touch the cache, mapped to the
+        # client events they dispatch; these are skipped by the gateway
+        # before decoding when nothing listens to any of those events
+        self._skip_unobserved: bool = options.get("skip_unobserved_events", False)
+        self._skippable_events: dict[str, tuple[str, ...]] = (
+            {
+                "TYPING_START": ("raw_typing", "typing"),
+                "INVITE_CREATE": ("invite_create",),
+                "INVITE_DELETE": ("invite_delete",),
+                "INTEGRATION_CREATE": ("integration_create",),
+                "INTEGRATION_UPDATE": ("integration_update",),
+                "INTEGRATION_DELETE": ("raw_integration_delete",),
+                "GUILD_INTEGRATIONS_UPDATE": ("guild_integrations_update",),
+                "WEBHOOKS_UPDATE": ("webhooks_update",),
+                "GUILD_AUDIT_LOG_ENTRY_CREATE": (
+                    "raw_audit_log_entry",
+                    "audit_log_entry",
+                ),
+                "AUTO_MODERATION_RULE_CREATE": ("auto_moderation_rule_create",),
+                "AUTO_MODERATION_RULE_UPDATE": ("auto_moderation_rule_update",),
+                "AUTO_MODERATION_RULE_DELETE": ("auto_moderation_rule_delete",),
+                "AUTO_MODERATION_ACTION_EXECUTION": (
+                    "auto_moderation_action_execution",
+                ),
+                "ENTITLEMENT_CREATE": ("entitlement_create",),
+                "ENTITLEMENT_UPDATE": ("entitlement_update",),
+                "ENTITLEMENT_DELETE": ("entitlement_delete",),
+            }
+            if self._skip_unobserved
+            else {}
+        )
+
         self.parsers = parsers = {}
         for attr, func in inspect.getmembers(self):
             if attr.startswith("parse_"):
@@ -274,10 +491,19 @@ class ConnectionState:
         # references now using a regular dictionary with eviction being done
         # using __del__. Testing this for memory leaks led to no discernible leaks,
         # though more testing will have to be done.
-        self._users: dict[int, User] = {}
-        self._emojis: dict[int, (GuildEmoji, AppEmoji)] = {}
-        self._stickers: dict[int, GuildSticker] = {}
-        self._guilds: dict[int, Guild] = {}
+        self._users: MutableMapping[int, User] = self._new_cache("users")
+        # custom user caches can drop users without telling us
+        self._user_names: NameIndex | None = (
+            NameIndex()
+            if self.name_index and "users" not in self._cache_providers
+            else None
+        )
+        self._emojis: MutableMapping[int, GuildEmoji | AppEmoji] = self._new_cache(
+            "emojis"
+        )
+        self._stickers: MutableMapping[int, GuildSticker] = self._new_cache("stickers")
+        self._guilds: MutableMapping[int, Guild] = self._new_cache("guilds")
+        self._compact_users: _CompactUsers = _CompactUsers()
         self._polls: dict[int, Poll] = {}
         if views:
             self._view_store: ViewStore = ViewStore(self)
@@ -289,9 +515,18 @@ class ConnectionState:
         # extra dict to look up private channels by user id
         self._private_channels_by_user: dict[int, DMChannel] = {}
         if self.max_messages is not None:
-            self._messages: Deque[Message] | None = deque(maxlen=self.max_messages)
+            self._messages: MessageCache | None = MessageCache(
+                self.max_messages,
+                max_channel_messages=self.max_channel_messages,
+                max_guild_messages=self.max_guild_messages,
+                lru=self.message_cache_lru,
+            )
         else:
-            self._messages: Deque[Message] | None = None
+            self._messages: MessageCache | None = None
+
+    def _new_cache(self, name: str) -> MutableMapping[int, Any]:
+        factory = self._cache_providers.get(name)
+        return {} if factory is None else factory()
 
     def process_chunk_requests(
         self, guild_id: int, nonce: str | None, members: list[Member], complete: bool
@@ -323,6 +558,21 @@ class ConnectionState:
         else:
             await coro(*args, **kwargs)
 
+    def _is_event_skippable(self, event: str) -> bool:
+        try:
+            events = self._skippable_events[event]
+        except KeyError:
+            return False
+
+        return not any(self._is_observed(name) for name in events)
+
+    def _is_observed(self, event: str) -> bool:
+        # whether anything would receive the event if it was dispatched now,
+        # always assumed when skipping unobserved events is turned off
+        if not self._skip_unobserved:
+            return True
+        return self._get_client()._has_listeners(event)
+
     @property
     def self_id(self) -> int | None:
         u = self.user
@@ -361,10 +611,31 @@ class ConnectionState:
             if user.discriminator != "0000":
                 self._users[user_id] = user
                 user._stored = True
+                self._index_user(user)
             return user
 
+    def _index_user(self, user: User) -> None:
+        if self._user_names is not None and self._users.get(user.id) is user:
+            self._user_names.add(user.id, user.name, user.global_name)
+
+    def _reindex_user(self, before: User | None, after: User) -> None:
+        self._index_user(after)
+        if not self.name_index or (
+            before is not None
+            and before.name == after.name
+            and before.global_name == after.global_name
+        ):
+            return
+
+        # members take their names from the shared user, so every guild
+        # caching the user indexes the old names
+        for guild in list(self._guilds.values()):
+            guild._reindex_member(after.id)
+
     def deref_user(self, user_id: int) -> None:
         self._users.pop(user_id, None)
+        if self._user_names is not None:
+            self._user_names.remove(user_id)
 
     def create_user(self, data: UserPayload) -> User:
         return User(state=self, data=data)
@@ -374,7 +645,11 @@ class ConnectionState:
 
     def get_user(self, id: int | None) -> User | None:
         # the keys of self._users are ints
-        return self._users.get(id)  # type: ignore
+        user = self._users.get(id)  # type: ignore
+        if user is None and id is not None:
+            # members of compact guilds keep their users out of the cache
+            user = self._compact_users.get_user(id)
+        return user
 
     def store_emoji(self, guild: Guild, data: EmojiPayload) -> GuildEmoji:
         # the id will be present here
@@ -410,6 +685,10 @@ class ConnectionState:
     def persistent_views(self) -> Sequence[View]:
         return self._view_store.persistent_views
 
+    @property
+    def view_store_stats(self) -> ViewStoreStats:
+        return self._view_store.stats
+
     @property
     def guilds(self) -> list[Guild]:
         return list(self._guilds.values())
@@ -423,6 +702,7 @@ class ConnectionState:
 
     def _remove_guild(self, guild: Guild) -> None:
         self._guilds.pop(guild.id, None)
+        self._compact_users.remove_store(guild.id)
 
         for emoji in guild.emojis:
             self._remove_emoji(emoji)
@@ -514,11 +794,7 @@ class ConnectionState:
                 self._private_channels_by_user.pop(recipient.id, None)
 
     def _get_message(self, msg_id: int | None) -> Message | None:
-        return (
-            utils.find(lambda m: m.id == msg_id, reversed(self._messages))
-            if self._messages
-            else None
-        )
+        return self._messages.get(msg_id) if self._messages else None
 
     def _add_guild_from_data(self, data: GuildPayload) -> Guild:
         guild = Guild(data=data, state=self)
@@ -747,7 +1023,9 @@ class ConnectionState:
         raw = RawBulkMessageDeleteEvent(data)
         if self._messages:
             found_messages = [
-                message for message in self._messages if message.id in raw.message_ids
+                message
+                for message_id in raw.message_ids
+                if (message := self._messages.get(message_id)) is not None
             ]
         else:
             found_messages = []
@@ -953,12 +1231,18 @@ class ConnectionState:
             )
             return
 
-        old_member = Member._copy(member)
+        # presence updates are by far the most frequent event, only
+        # snapshot the member when somebody is there to compare against
+        observed = self._is_observed("presence_update")
+        old_member = Member._copy(member) if observed else None
         user_update = member._presence_update(data=data, user=user)
+        guild._add_member(member)
         if user_update:
+            self._reindex_user(*user_update)
             self.dispatch("user_update", user_update[0], user_update[1])
 
-        self.dispatch("presence_update", old_member, member)
+        if observed:
+            self.dispatch("presence_update", old_member, member)
 
     def parse_user_update(self, data) -> None:
         # self.user is *always* cached when this is called
@@ -966,7 +1250,9 @@ class ConnectionState:
         user._update(data)
         ref = self._users.get(user.id)
         if ref:
+            before = copy.copy(ref) if self.name_index else None
             ref._update(data)
+            self._reindex_user(before, ref)
 
     def parse_invite_create(self, data) -> None:
         invite = Invite.from_gateway(state=self, data=data)
@@ -1166,7 +1452,7 @@ class ConnectionState:
         except KeyError:
             # If not provided, then the entire guild is being synced
             # So all previous thread data should be overwritten
-            previous_threads = guild._threads.copy()
+            previous_threads = dict(guild._threads)
             guild._clear_threads()
         else:
             previous_threads = guild._filter_threads(channel_ids)
@@ -1309,13 +1595,17 @@ class ConnectionState:
 
         member = guild.get_member(user_id)
         if member is not None:
-            old_member = Member._copy(member)
+            observed = self._is_observed("member_update")
+            old_member = Member._copy(member) if observed else None
             member._update(data)
             user_update = member._update_inner_user(user)
+            guild._add_member(member)
             if user_update:
+                self._reindex_user(*user_update)
                 self.dispatch("user_update", user_update[0], user_update[1])
 
-            self.dispatch("member_update", old_member, member)
+            if observed:
+                self.dispatch("member_update", old_member, member)
         else:
             if self.member_cache_flags.joined:
                 member = Member(data=data, guild=guild, state=self)
@@ -1323,6 +1613,7 @@ class ConnectionState:
                 # Force an update on the inner user if necessary
                 user_update = member._update_inner_user(user)
                 if user_update:
+                    self._reindex_user(*user_update)
                     self.dispatch("user_update", user_update[0], user_update[1])
 
                 guild._add_member(member)
@@ -1466,10 +1757,7 @@ class ConnectionState:
 
         # do a cleanup of the messages cache
         if self._messages is not None:
-            self._messages: Deque[Message] | None = deque(
-                (msg for msg in self._messages if msg.guild != guild),
-                maxlen=self.max_messages,
-            )
+            self._messages.remove_guild(guild.id)
 
         self._remove_guild(guild)
         self.dispatch("guild_remove", guild)
@@ -1555,6 +1843,7 @@ class ConnectionState:
             if role is not None:
                 old_role = copy.copy(role)
                 role._update(role_data)
+                guild._invalidate_permissions()
                 self.dispatch("guild_role_update", old_role, role)
         else:
             _log.debug(
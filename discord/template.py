@@ -68,6 +68,18 @@ class _PartialTemplateState:
     def member_cache_flags(self):
         return self.__state.member_cache_flags
 
+    @property
+    def compact_member_threshold(self):
+        return None
+
+    @property
+    def name_index(self):
+        return False
+
+    @property
+    def cache_permissions(self):
+        return False
+
     def store_emoji(self, guild, packet):
         return None
 
@@ -77,6 +89,9 @@ class _PartialTemplateState:
     def _get_message(self, id):
         return None
 
+    def _new_cache(self, name):
+        return {}
+
     def _get_guild(self, id):
         return self.__state._get_guild(id)
 
@@ -10,6 +10,7 @@ from itertools import groupby
 from typing import TYPE_CHECKING, Any, Callable
 
 from .input_text import InputText
+from .view import _TimeoutHandle, _TimeoutScheduler
 
 __all__ = (
     "Modal",
@@ -66,35 +67,32 @@ class Modal:
         self._stopped: asyncio.Future[bool] = loop.create_future()
         self.__cancel_callback: Callable[[Modal], None] | None = None
         self.__timeout_expiry: float | None = None
-        self.__timeout_task: asyncio.Task[None] | None = None
+        self.__timeout_handle: _TimeoutHandle | None = None
         self.loop = asyncio.get_event_loop()
 
     def _start_listening_from_store(self, store: ModalStore) -> None:
         self.__cancel_callback = partial(store.remove_modal)
         if self.timeout:
-            loop = asyncio.get_running_loop()
-            if self.__timeout_task is not None:
-                self.__timeout_task.cancel()
+            if self.__timeout_handle is not None:
+                self.__timeout_handle.cancel()
 
             self.__timeout_expiry = time.monotonic() + self.timeout
-            self.__timeout_task = loop.create_task(self.__timeout_task_impl())
-
-    async def __timeout_task_impl(self) -> None:
-        while True:
-            # Guard just in case someone changes the value of the timeout at runtime
-            if self.timeout is None:
-                return
+            self.__timeout_handle = store._timeouts.schedule(
+                self, self.__timeout_expiry
+            )
 
-            if self.__timeout_expiry is None:
-                return self._dispatch_timeout()
+    def _check_timeout(self, now: float) -> float | None:
+        # Guard just in case someone changes the value of the timeout at runtime
+        if self.timeout is None:
+            return None
 
-            # Check if we've elapsed our currently set timeout
-            now = time.monotonic()
-            if now >= self.__timeout_expiry:
-                return self._dispatch_timeout()
+        # Check if we've elapsed our currently set timeout
+        if self.__timeout_expiry is None or now >= self.__timeout_expiry:
+            self._dispatch_timeout()
+            return None
 
-            # Wait N seconds to see if timeout data has been refreshed
-            await asyncio.sleep(self.__timeout_expiry - now)
+        # The timeout data has been refreshed, check again when it elapses
+        return self.__timeout_expiry
 
     @property
     def _expires_at(self) -> float | None:
@@ -224,9 +222,9 @@ class Modal:
         if not self._stopped.done():
             self._stopped.set_result(True)
         self.__timeout_expiry = None
-        if self.__timeout_task is not None:
-            self.__timeout_task.cancel()
-            self.__timeout_task = None
+        if self.__timeout_handle is not None:
+            self.__timeout_handle.cancel()
+            self.__timeout_handle = None
 
     async def wait(self) -> bool:
         """Waits for the modal dialog to be submitted."""
@@ -312,6 +310,7 @@ class ModalStore:
         # (user_id, custom_id) : Modal
         self._modals: dict[tuple[int, str], Modal] = {}
         self._state: ConnectionState = state
+        self._timeouts: _TimeoutScheduler = _TimeoutScheduler()
 
     def add_modal(self, modal: Modal, user_id: int):
         self._modals[(user_id, modal.custom_id)] = modal
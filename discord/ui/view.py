@@ -26,13 +26,23 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import os
 import sys
 import time
 import traceback
 from functools import partial
 from itertools import groupby
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Iterator,
+    NamedTuple,
+    Sequence,
+)
 
 from ..components import ActionRow as ActionRowComponent
 from ..components import Button as ButtonComponent
@@ -42,7 +52,10 @@ from ..components import _component_factory
 from ..utils import get
 from .item import Item, ItemCallbackType
 
-__all__ = ("View",)
+__all__ = (
+    "View",
+    "ViewStoreStats",
+)
 
 
 if TYPE_CHECKING:
@@ -187,7 +200,7 @@ class View:
         self.id: str = os.urandom(16).hex()
         self.__cancel_callback: Callable[[View], None] | None = None
         self.__timeout_expiry: float | None = None
-        self.__timeout_task: asyncio.Task[None] | None = None
+        self.__timeout_handle: _TimeoutHandle | None = None
         self.__stopped: asyncio.Future[bool] = loop.create_future()
         self._message: Message | InteractionMessage | None = None
         self.parent: Interaction | None = None
@@ -195,22 +208,18 @@ class View:
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} timeout={self.timeout} children={len(self.children)}>"
 
-    async def __timeout_task_impl(self) -> None:
-        while True:
-            # Guard just in case someone changes the value of the timeout at runtime
-            if self.timeout is None:
-                return
+    def _check_timeout(self, now: float) -> float | None:
+        # Guard just in case someone changes the value of the timeout at runtime
+        if self.timeout is None:
+            return None
 
-            if self.__timeout_expiry is None:
-                return self._dispatch_timeout()
+        # Check if we've elapsed our currently set timeout
+        if self.__timeout_expiry is None or now >= self.__timeout_expiry:
+            self._dispatch_timeout()
+            return None
 
-            # Check if we've elapsed our currently set timeout
-            now = time.monotonic()
-            if now >= self.__timeout_expiry:
-                return self._dispatch_timeout()
-
-            # Wait N seconds to see if timeout data has been refreshed
-            await asyncio.sleep(self.__timeout_expiry - now)
+        # The timeout data has been refreshed, check again when it elapses
+        return self.__timeout_expiry
 
     def to_components(self) -> list[dict[str, Any]]:
         def key(item: Item) -> int:
@@ -430,18 +439,23 @@ class View:
     def _start_listening_from_store(self, store: ViewStore) -> None:
         self.__cancel_callback = partial(store.remove_view)
         if self.timeout:
-            loop = asyncio.get_running_loop()
-            if self.__timeout_task is not None:
-                self.__timeout_task.cancel()
+            if self.__timeout_handle is not None:
+                self.__timeout_handle.cancel()
 
             self.__timeout_expiry = time.monotonic() + self.timeout
-            self.__timeout_task = loop.create_task(self.__timeout_task_impl())
+            self.__timeout_handle = store._timeouts.schedule(
+                self, self.__timeout_expiry
+            )
 
     def _dispatch_timeout(self):
         if self.__stopped.done():
             return
 
         self.__stopped.set_result(True)
+        if self.__cancel_callback:
+            self.__cancel_callback(self)
+            self.__cancel_callback = None
+
         asyncio.create_task(
             self.on_timeout(), name=f"discord-ui-view-timeout-{self.id}"
         )
@@ -489,9 +503,9 @@ class View:
             self.__stopped.set_result(False)
 
         self.__timeout_expiry = None
-        if self.__timeout_task is not None:
-            self.__timeout_task.cancel()
-            self.__timeout_task = None
+        if self.__timeout_handle is not None:
+            self.__timeout_handle.cancel()
+            self.__timeout_handle = None
 
         if self.__cancel_callback:
             self.__cancel_callback(self)
@@ -564,13 +578,112 @@ class View:
         self._message = value
 
 
+class _TimeoutHandle:
+    __slots__ = ("owner",)
+
+    def __init__(self, owner: Any) -> None:
+        self.owner: Any = owner
+
+    def cancel(self) -> None:
+        self.owner = None
+
+
+class _TimeoutScheduler:
+    """Runs the timeouts of the views or modals of a store from a single
+    timer on the event loop instead of a sleeping task for each of them.
+
+    Owners are kept in a heap ordered by the time they were last known
+    to expire. Refreshing an expiry only has to update the owner; when the
+    old time comes up, ``owner._check_timeout(now)`` either dispatches the
+    timeout or returns the new expiry to wait for.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, _TimeoutHandle]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._deadline: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, owner: Any, expiry: float) -> _TimeoutHandle:
+        handle = _TimeoutHandle(owner)
+        heapq.heappush(self._heap, (expiry, next(self._sequence), handle))
+        if self._deadline is None or expiry < self._deadline:
+            self._arm(expiry)
+        return handle
+
+    def _arm(self, deadline: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+
+        loop = asyncio.get_running_loop()
+        self._deadline = deadline
+        self._timer = loop.call_later(max(deadline - time.monotonic(), 0), self._run)
+
+    def _run(self) -> None:
+        self._timer = None
+        self._deadline = None
+        heap = self._heap
+        now = time.monotonic()
+        while heap and heap[0][0] <= now:
+            _, _, handle = heapq.heappop(heap)
+            if handle.owner is None:
+                continue
+
+            expiry = handle.owner._check_timeout(now)
+            if expiry is not None:
+                heapq.heappush(heap, (expiry, next(self._sequence), handle))
+
+        if heap:
+            self._arm(heap[0][0])
+
+
+class ViewStoreStats(NamedTuple):
+    """The statistics of the store that dispatches component interactions to views.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    views: :class:`int`
+        The number of views currently listening for interactions.
+    items: :class:`int`
+        The number of components those views are listening on.
+    tracked_messages: :class:`int`
+        The number of messages whose views are updated when the message is edited.
+    dispatches: :class:`int`
+        The number of component interactions handed to the store.
+    average_dispatch_latency: :class:`float`
+        The average time, in seconds, spent routing an interaction to its view.
+    max_dispatch_latency: :class:`float`
+        The largest such time, in seconds.
+    """
+
+    views: int
+    items: int
+    tracked_messages: int
+    dispatches: int
+    average_dispatch_latency: float
+    max_dispatch_latency: float
+
+
 class ViewStore:
     def __init__(self, state: ConnectionState):
         # (component_type, message_id, custom_id): (View, Item)
         self._views: dict[tuple[int, int | None, str], tuple[View, Item]] = {}
+        # view.id: keys of _views added for the view
+        self._view_keys: dict[str, set[tuple[int, int | None, str]]] = {}
+        # view.id: message_ids the view is synced with
+        self._view_messages: dict[str, set[int]] = {}
         # message_id: View
         self._synced_message_views: dict[int, View] = {}
         self._state: ConnectionState = state
+        self._timeouts: _TimeoutScheduler = _TimeoutScheduler()
+        self._dispatches: int = 0
+        self._dispatch_time: float = 0.0
+        self._max_dispatch_time: float = 0.0
 
     @property
     def persistent_views(self) -> Sequence[View]:
@@ -581,38 +694,74 @@ class ViewStore:
         }
         return list(views.values())
 
-    def __verify_integrity(self):
-        to_remove: list[tuple[int, int | None, str]] = []
-        for k, (view, _) in self._views.items():
-            if view.is_finished():
-                to_remove.append(k)
-
-        for k in to_remove:
-            del self._views[k]
+    @property
+    def stats(self) -> ViewStoreStats:
+        dispatches = self._dispatches
+        return ViewStoreStats(
+            views=len(self._view_keys),
+            items=len(self._views),
+            tracked_messages=len(self._synced_message_views),
+            dispatches=dispatches,
+            average_dispatch_latency=(
+                self._dispatch_time / dispatches if dispatches else 0.0
+            ),
+            max_dispatch_latency=self._max_dispatch_time,
+        )
 
     def add_view(self, view: View, message_id: int | None = None):
-        self.__verify_integrity()
+        # finished views remove themselves through the cancel callback,
+        # so the store never has to look for them.
+        if view.is_finished():
+            return
 
         view._start_listening_from_store(self)
+        keys = self._view_keys.setdefault(view.id, set())
         for item in view.children:
             if item.is_dispatchable():
-                self._views[(item.type.value, message_id, item.custom_id)] = (view, item)  # type: ignore
+                key = (item.type.value, message_id, item.custom_id)  # type: ignore
+                previous = self._views.get(key)
+                if previous is not None and previous[0] is not view:
+                    self._release(previous[0], key=key)
+                self._views[key] = (view, item)
+                keys.add(key)
 
         if message_id is not None:
+            previous = self._synced_message_views.get(message_id)
+            if previous is not None and previous is not view:
+                self._release(previous, message_id=message_id)
             self._synced_message_views[message_id] = view
+            self._view_messages.setdefault(view.id, set()).add(message_id)
+
+    def _release(
+        self,
+        view: View,
+        *,
+        key: tuple[int, int | None, str] | None = None,
+        message_id: int | None = None,
+    ) -> None:
+        # another view took over a key or a message of this view, forget
+        # about the view once nothing routes to it anymore
+        keys = self._view_keys.get(view.id, set())
+        messages = self._view_messages.get(view.id, set())
+        keys.discard(key)  # type: ignore
+        messages.discard(message_id)  # type: ignore
+        if not keys and not messages:
+            self._view_keys.pop(view.id, None)
+            self._view_messages.pop(view.id, None)
 
     def remove_view(self, view: View):
-        for item in view.children:
-            if item.is_dispatchable():
-                self._views.pop((item.type.value, item.custom_id), None)  # type: ignore
+        for key in self._view_keys.pop(view.id, ()):
+            # the key may have been taken over by a view added later on
+            value = self._views.get(key)
+            if value is not None and value[0] is view:
+                del self._views[key]
 
-        for key, value in self._synced_message_views.items():
-            if value.id == view.id:
-                del self._synced_message_views[key]
-                break
+        for message_id in self._view_messages.pop(view.id, ()):
+            if self._synced_message_views.get(message_id) is view:
+                del self._synced_message_views[message_id]
 
     def dispatch(self, component_type: int, custom_id: str, interaction: Interaction):
-        self.__verify_integrity()
+        start = time.perf_counter()
         message_id: int | None = interaction.message and interaction.message.id
         key = (component_type, message_id, custom_id)
         # Fallback to None message_id searches in case a persistent view
@@ -620,12 +769,16 @@ class ViewStore:
         value = self._views.get(key) or self._views.get(
             (component_type, None, custom_id)
         )
-        if value is None:
-            return
-
-        view, item = value
-        item.refresh_state(interaction)
-        view._dispatch_item(item, interaction)
+        if value is not None:
+            view, item = value
+            item.refresh_state(interaction)
+            view._dispatch_item(item, interaction)
+
+        elapsed = time.perf_counter() - start
+        self._dispatches += 1
+        self._dispatch_time += elapsed
+        if elapsed > self._max_dispatch_time:
+            self._max_dispatch_time = elapsed
 
     def is_message_tracked(self, message_id: int):
         return message_id in self._synced_message_views
@@ -47,13 +47,15 @@ import socket
 import struct
 import threading
 import time
-from typing import TYPE_CHECKING, Any, Callable, Literal, overload
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple, overload
 
 from . import opus, utils
 from .backoff import ExponentialBackoff
 from .errors import ClientException, ConnectionClosed
 from .gateway import *
-from .player import AudioPlayer, AudioSource
+from .object import Object
+from .player import AudioPlayer, AudioSource, ScheduledAudioPlayer
 from .sinks import RawData, RecordingException, Sink
 from .utils import MISSING
 
@@ -61,6 +63,7 @@ if TYPE_CHECKING:
     from . import abc
     from .client import Client
     from .guild import Guild
+    from .member import Member
     from .opus import Encoder
     from .state import ConnectionState
     from .types.voice import GuildVoiceState as GuildVoiceStatePayload
@@ -73,6 +76,8 @@ has_nacl: bool
 
 try:
     import nacl.secret  # type: ignore
+    import nacl.utils  # type: ignore
+    from nacl.bindings import crypto_secretbox, crypto_secretbox_open  # type: ignore
 
     has_nacl = True
 except ImportError:
@@ -81,6 +86,8 @@ except ImportError:
 __all__ = (
     "VoiceProtocol",
     "VoiceClient",
+    "AudioStream",
+    "AudioFrame",
 )
 
 
@@ -256,17 +263,21 @@ class VoiceClient(VoiceProtocol):
         self._player: AudioPlayer | None = None
         self.encoder: Encoder = MISSING
         self.decoder = None
-        self._lite_nonce: int = 0
+        self._packetizer: VoicePacketizer | None = None
         self.ws: DiscordVoiceWebSocket = MISSING
 
         self.paused = False
         self.recording = False
         self.user_timestamps = {}
         self.sink = None
+        self._streams: list[AudioStream] = []
+        self._listen_sink: Sink | None = None
+        self._receiver: _VoiceReceiver | None = None
         self.starting_time = None
         self.stopping_time = None
 
     warn_nacl = not has_nacl
+    _MAX_STALE_PACKETS: int = 256
     supported_modes: tuple[SupportedModes, ...] = (
         "xsalsa20_poly1305_lite",
         "xsalsa20_poly1305_suffix",
@@ -375,6 +386,9 @@ class VoiceClient(VoiceProtocol):
         while ws.secret_key is None:
             await ws.poll_event()
         self._connected.set()
+        if self._receiver is not None:
+            # the socket may have been replaced while reconnecting
+            self._receiver.restart()
         return ws
 
     async def connect(self, *, reconnect: bool, timeout: float) -> None:
@@ -551,65 +565,15 @@ class VoiceClient(VoiceProtocol):
 
     # audio related
 
-    def _get_voice_packet(self, data):
-        header = bytearray(12)
-
-        # Formulate rtp header
-        header[0] = 0x80
-        header[1] = 0x78
-        struct.pack_into(">H", header, 2, self.sequence)
-        struct.pack_into(">I", header, 4, self.timestamp)
-        struct.pack_into(">I", header, 8, self.ssrc)
-
-        encrypt_packet = getattr(self, f"_encrypt_{self.mode}")
-        return encrypt_packet(header, data)
-
-    def _encrypt_xsalsa20_poly1305(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
-        nonce[:12] = header
-
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext
-
-    def _encrypt_xsalsa20_poly1305_suffix(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = nacl.utils.random(nacl.secret.SecretBox.NONCE_SIZE)
-
-        return header + box.encrypt(bytes(data), nonce).ciphertext + nonce
-
-    def _encrypt_xsalsa20_poly1305_lite(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
-
-        nonce[:4] = struct.pack(">I", self._lite_nonce)
-        self.checked_add("_lite_nonce", 1, 4294967295)
-
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext + nonce[:4]
-
-    def _decrypt_xsalsa20_poly1305(self, header, data):
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-
-        nonce = bytearray(24)
-        nonce[:12] = header
-
-        return self.strip_header_ext(box.decrypt(bytes(data), bytes(nonce)))
-
-    def _decrypt_xsalsa20_poly1305_suffix(self, header, data):
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-
-        nonce_size = nacl.secret.SecretBox.NONCE_SIZE
-        nonce = data[-nonce_size:]
-
-        return self.strip_header_ext(box.decrypt(bytes(data[:-nonce_size]), nonce))
-
-    def _decrypt_xsalsa20_poly1305_lite(self, header, data):
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-
-        nonce = bytearray(24)
-        nonce[:4] = data[-4:]
-        data = data[:-4]
+    def _update_packetizer(self) -> None:
+        previous = self._packetizer
+        self._packetizer = VoicePacketizer(self.mode, self.secret_key, self.ssrc)
+        if previous is not None:
+            # keep counting where the previous key left off
+            self._packetizer.lite_nonce = previous.lite_nonce
 
-        return self.strip_header_ext(box.decrypt(bytes(data), bytes(nonce)))
+    def _get_voice_packet(self, data):
+        return self._packetizer.packet(self.sequence, self.timestamp, data)
 
     @staticmethod
     def strip_header_ext(data):
@@ -712,7 +676,11 @@ class VoiceClient(VoiceProtocol):
 
             after = _after
 
-        self._player = AudioPlayer(source, self, after=after)
+        scheduler = self.client._voice_scheduler
+        if scheduler is not None:
+            self._player = ScheduledAudioPlayer(source, self, scheduler, after=after)
+        else:
+            self._player = AudioPlayer(source, self, after=after)
         self._player.start()
         return future
 
@@ -737,15 +705,39 @@ class VoiceClient(VoiceProtocol):
             return
         if self.paused:
             return
+        if self._packetizer is None:
+            # the secret key to decrypt packets with hasn't been received yet
+            return
 
         data = RawData(data, self)
 
-        if data.decrypted_data == b"\xf8\xff\xfe":  # Frame of silence
+        silent = data.decrypted_data == opus.OPUS_SILENCE
+        decode = self.sink is not self._listen_sink
+        for stream in self._streams:
+            if not stream.opus:
+                decode = True
+            elif not silent and data.decrypted_data is not None:
+                stream._put(data, data.decrypted_data)
+
+        # the jitter buffer keeps frames of silence to tell them apart from lost packets
+        if not decode or (silent and not self.decoder.jitter_buffer):
             return
 
         self.decoder.decode(data)
 
-    def start_recording(self, sink, callback, *args, sync_start: bool = False):
+    def start_recording(
+        self,
+        sink,
+        callback,
+        *args,
+        sync_start: bool = False,
+        decode_workers: int = 1,
+        decode_queue_size: int = 250,
+        decode_overflow: str = "drop_oldest",
+        jitter_buffer: int = 0,
+        use_datagram_endpoint: bool = False,
+        receive_batch_size: int = 16,
+    ):
         """The bot will begin recording audio from the current voice channel it is in.
         This function uses a thread so the current code line will not be stopped.
         Must be in a voice channel to use.
@@ -764,6 +756,40 @@ class VoiceClient(VoiceProtocol):
         sync_start: :class:`bool`
             If True, the recordings of subsequent users will start with silence.
             This is useful for recording audio just as it was heard.
+        decode_workers: :class:`int`
+            The number of threads decoding the received audio, the frames of each
+            speaker always being decoded by the same thread. Defaults to ``1``.
+
+            .. versionadded:: 2.7
+        decode_queue_size: :class:`int`
+            The number of received frames each decoding thread may have waiting.
+            Defaults to ``250``.
+
+            .. versionadded:: 2.7
+        decode_overflow: :class:`str`
+            What to do with a frame received while its decoding queue is full, one of
+            ``"drop_oldest"``, ``"drop_newest"`` or ``"block"``. Defaults to ``"drop_oldest"``.
+            The decoding statistics are then available through ``decoder.stats``.
+
+            .. versionadded:: 2.7
+        jitter_buffer: :class:`int`
+            The number of packets to hold back per speaker to put packets arriving
+            out of order back in sequence, lost packets being recovered or concealed
+            by the opus decoder. Defaults to ``0``, which disables reordering.
+
+            .. versionadded:: 2.7
+        use_datagram_endpoint: :class:`bool`
+            Whether to receive the audio through an asyncio datagram endpoint on the
+            client's event loop, instead of a thread polling the socket. Many voice
+            clients can then record without a thread each. Defaults to ``False``.
+
+            .. versionadded:: 2.7
+        receive_batch_size: :class:`int`
+            The number of queued packets read at once by the datagram endpoint,
+            saving event loop iterations when many packets arrive together.
+            Defaults to ``16``.
+
+            .. versionadded:: 2.7
 
         Raises
         ------
@@ -773,6 +799,9 @@ class VoiceClient(VoiceProtocol):
             Already recording.
         RecordingException
             Must provide a Sink object.
+        ValueError
+            Invalid decoding options, or ``decode_overflow`` is ``"block"``
+            with ``use_datagram_endpoint``, which would block the event loop.
         """
         if not self.is_connected():
             raise RecordingException("Not connected to voice channel.")
@@ -780,15 +809,46 @@ class VoiceClient(VoiceProtocol):
             raise RecordingException("Already recording.")
         if not isinstance(sink, Sink):
             raise RecordingException("Must provide a Sink object.")
+        if use_datagram_endpoint and decode_overflow == "block":
+            raise ValueError(
+                "decode_overflow cannot be 'block' when using a datagram endpoint."
+            )
+        if receive_batch_size < 1:
+            raise ValueError("receive_batch_size must be at least 1.")
 
         self.empty_socket()
 
-        self.decoder = opus.DecodeManager(self)
+        self.decoder = opus.DecodeManager(
+            self,
+            workers=decode_workers,
+            max_queue=decode_queue_size,
+            overflow=decode_overflow,
+            jitter_buffer=jitter_buffer,
+        )
         self.decoder.start()
         self.recording = True
         self.sync_start = sync_start
         self.sink = sink
-        sink.init(self)
+        try:
+            sink.init(self)
+        except BaseException:
+            # e.g. FFmpegSink when ffmpeg is missing, undo the above so
+            # that recording can be started again
+            self.decoder.stop()
+            self.recording = False
+            self.sink = None
+            raise
+
+        if use_datagram_endpoint:
+            self._start_receiving()
+            decoder = self.decoder
+            self._receiver = _VoiceReceiver(
+                self,
+                receive_batch_size,
+                finish=lambda: self._finish_recording(decoder, sink, callback, *args),
+            )
+            self.loop.call_soon_threadsafe(self._receiver.start)
+            return
 
         t = threading.Thread(
             target=self.recv_audio,
@@ -816,6 +876,57 @@ class VoiceClient(VoiceProtocol):
         self.decoder.stop()
         self.recording = False
         self.paused = False
+        self._listen_sink = None
+
+        receiver, self._receiver = self._receiver, None
+        if receiver is not None:
+            self.loop.call_soon_threadsafe(receiver.stop)
+
+        streams, self._streams = self._streams, []
+        for stream in streams:
+            stream._end()
+
+    def listen(self, *, opus: bool = False, max_queue: int = 250) -> AudioStream:
+        """Returns an :class:`AudioStream` of the audio received in the voice channel,
+        as it is received. ::
+
+            async with vc.listen() as stream:
+                async for user, frame in stream:
+                    ...
+
+        If not already recording, recording starts without storing the audio and
+        stops once every stream is closed. Otherwise, the stream ends when recording
+        stops.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        opus: :class:`bool`
+            Whether to receive the opus encoded frames instead of decoding them to PCM.
+            Frames are then not decoded at all unless a sink or another stream needs them.
+        max_queue: :class:`int`
+            The number of frames the stream may queue before dropping the oldest.
+            Defaults to ``250``.
+
+        Raises
+        ------
+        RecordingException
+            Not connected to a voice channel.
+        ValueError
+            ``max_queue`` is lower than 1.
+        """
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1.")
+
+        if not self.recording:
+            sink = _ListenSink()
+            self.start_recording(sink, _listen_finished)
+            self._listen_sink = sink
+
+        stream = AudioStream(self, opus=opus, max_queue=max_queue)
+        self._streams.append(stream)
+        return stream
 
     def toggle_pause(self):
         """Pauses or unpauses the recording.
@@ -833,21 +944,43 @@ class VoiceClient(VoiceProtocol):
         self.paused = not self.paused
 
     def empty_socket(self):
-        while True:
-            ready, _, _ = select.select([self.socket], [], [], 0.0)
-            if not ready:
+        # packets keep arriving while the socket is drained, so only about
+        # as many as the default receive buffer holds are discarded
+        for _ in range(self._MAX_STALE_PACKETS):
+            try:
+                self.socket.recv(4096)
+            except OSError:
+                # BlockingIOError once the buffered packets are gone
                 break
-            for s in ready:
-                s.recv(4096)
+
+    def _start_receiving(self) -> None:
+        self.user_timestamps: dict[int, tuple[int, float]] = {}
+        self.starting_time = time.perf_counter()
+        self.first_packet_timestamp: float
+
+    def _finish_recording(self, decoder, sink, callback, *args) -> None:
+        # runs off the event loop, stop_recording only signals the decoder
+        # so the sink is cleaned up once the queued frames are written to it
+        decoder.join()
+        self.stopping_time = time.perf_counter()
+        try:
+            sink.cleanup()
+        except Exception:
+            # the callback still gets the sink and whatever audio it has
+            _log.exception("Failed to clean up the recording sink.")
+        callback = asyncio.run_coroutine_threadsafe(callback(sink, *args), self.loop)
+        result = callback.result()
+
+        if result is not None:
+            print(result)
 
     def recv_audio(self, sink, callback, *args):
         # Gets data from _recv_audio and sorts
         # it by user, handles pcm files and
         # silence that should be added.
 
-        self.user_timestamps: dict[int, tuple[int, float]] = {}
-        self.starting_time = time.perf_counter()
-        self.first_packet_timestamp: float
+        decoder = self.decoder
+        self._start_receiving()
         while self.recording:
             ready, _, err = select.select([self.socket], [], [self.socket], 0.01)
             if not ready:
@@ -863,15 +996,15 @@ class VoiceClient(VoiceProtocol):
 
             self.unpack_audio(data)
 
-        self.stopping_time = time.perf_counter()
-        self.sink.cleanup()
-        callback = asyncio.run_coroutine_threadsafe(callback(sink, *args), self.loop)
-        result = callback.result()
-
-        if result is not None:
-            print(result)
+        self._finish_recording(decoder, sink, callback, *args)
 
     def recv_decoded_audio(self, data: RawData):
+        for stream in self._streams:
+            if not stream.opus:
+                stream._put(data, data.decoded_data)
+        if self.sink is self._listen_sink:
+            return
+
         # Add silence when they were not being recorded.
         if data.ssrc not in self.user_timestamps:  # First packet from user
             if (
@@ -890,9 +1023,8 @@ class VoiceClient(VoiceProtocol):
                 data.receive_time - self.user_timestamps[data.ssrc][1]
             ) * 48000  # delta receive time
             dT = data.timestamp - self.user_timestamps[data.ssrc][0]  # delta timestamp
-            diff = abs(100 - dT * 100 / dRT)
             if (
-                diff > 60 and dT != 960
+                dT != 960 and dRT and abs(100 - dT * 100 / dRT) > 60
             ):  # If the difference in change is more than 60% threshold
                 silence = dRT - 960
             else:
@@ -971,6 +1103,11 @@ class VoiceClient(VoiceProtocol):
             Encoding the data failed.
         """
 
+        self._send_packet(self._prepare_audio_packet(data, encode=encode))
+
+    def _prepare_audio_packet(self, data: bytes, *, encode: bool = True) -> bytes:
+        # advances the sequence and timestamp as if the packet was sent,
+        # so that packets can be built ahead of sending them in batches
         self.checked_add("sequence", 1, 65535)
         if encode:
             if not self.encoder:
@@ -979,19 +1116,346 @@ class VoiceClient(VoiceProtocol):
         else:
             encoded_data = data
         packet = self._get_voice_packet(encoded_data)
+        self.checked_add("timestamp", opus.Encoder.SAMPLES_PER_FRAME, 4294967295)
+        return packet
+
+    def _send_packet(self, packet: bytes) -> None:
         try:
             self.socket.sendto(packet, (self.endpoint_ip, self.voice_port))
         except BlockingIOError:
+            sequence, timestamp = struct.unpack_from(">HI", packet, 2)
             _log.warning(
                 "A packet has been dropped (seq: %s, timestamp: %s)",
-                self.sequence,
-                self.timestamp,
+                sequence,
+                timestamp,
             )
 
-        self.checked_add("timestamp", opus.Encoder.SAMPLES_PER_FRAME, 4294967295)
-
     def elapsed(self) -> datetime.timedelta:
         """Returns the elapsed time of the playing audio."""
         if self._player:
             return datetime.timedelta(milliseconds=self._player.played_frames() * 20)
         return datetime.timedelta()
+
+
+class VoicePacketizer:
+    """Builds and opens the encrypted RTP packets of a voice connection.
+
+    One is created every time the voice connection receives its secret key,
+    so that the key, the RTP header and the nonce are set up once instead of
+    for every 20 ms packet.
+    """
+
+    HEADER_SIZE: int = 12
+    NONCE_SIZE: int = 24
+
+    _rtp = struct.Struct(">HI")
+    _lite = struct.Struct(">I")
+
+    def __init__(self, mode: str, secret_key: list[int], ssrc: int) -> None:
+        self.mode: str = mode
+        self.lite_nonce: int = 0
+        self._key: bytes = bytes(secret_key)
+
+        self._header: bytearray = bytearray(self.HEADER_SIZE)
+        self._header[0] = 0x80
+        self._header[1] = 0x78
+        struct.pack_into(">I", self._header, 8, ssrc)
+        self._nonce: bytearray = bytearray(self.NONCE_SIZE)
+
+        self.encrypt: Callable[[bytearray, bytes], bytes] = getattr(
+            self, f"_encrypt_{mode}"
+        )
+        self.decrypt: Callable[[bytes, bytes], bytes] = getattr(
+            self, f"_decrypt_{mode}"
+        )
+
+    def packet(self, sequence: int, timestamp: int, data: bytes) -> bytes:
+        """Builds the encrypted packet of an opus frame."""
+        header = self._header
+        self._rtp.pack_into(header, 2, sequence, timestamp)
+        return self.encrypt(header, data)
+
+    def _encrypt_xsalsa20_poly1305(self, header: bytearray, data) -> bytes:
+        nonce = self._nonce
+        nonce[:12] = header
+        return b"".join((header, crypto_secretbox(data, bytes(nonce), self._key)))
+
+    def _encrypt_xsalsa20_poly1305_suffix(self, header: bytearray, data) -> bytes:
+        nonce = nacl.utils.random(self.NONCE_SIZE)
+        return b"".join((header, crypto_secretbox(data, nonce, self._key), nonce))
+
+    def _encrypt_xsalsa20_poly1305_lite(self, header: bytearray, data) -> bytes:
+        nonce = self._nonce
+        self._lite.pack_into(nonce, 0, self.lite_nonce)
+        self.lite_nonce = (self.lite_nonce + 1) & 0xFFFFFFFF
+        return b"".join(
+            (
+                header,
+                crypto_secretbox(data, bytes(nonce), self._key),
+                memoryview(nonce)[:4],
+            )
+        )
+
+    # the receive path runs on the recording thread, so it doesn't share
+    # the nonce buffer with the send path
+
+    def _decrypt_xsalsa20_poly1305(self, header, data) -> bytes:
+        nonce = bytes(header) + bytes(12)
+        return VoiceClient.strip_header_ext(
+            crypto_secretbox_open(data, nonce, self._key)
+        )
+
+    def _decrypt_xsalsa20_poly1305_suffix(self, header, data) -> bytes:
+        data = memoryview(data)
+        nonce = bytes(data[-self.NONCE_SIZE :])
+        return VoiceClient.strip_header_ext(
+            crypto_secretbox_open(data[: -self.NONCE_SIZE], nonce, self._key)
+        )
+
+    def _decrypt_xsalsa20_poly1305_lite(self, header, data) -> bytes:
+        data = memoryview(data)
+        nonce = bytes(data[-4:]) + bytes(20)
+        return VoiceClient.strip_header_ext(
+            crypto_secretbox_open(data[:-4], nonce, self._key)
+        )
+
+
+class AudioFrame(NamedTuple):
+    """A frame of audio received from a user, as yielded by :class:`AudioStream`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    ssrc: :class:`int`
+        The RTP synchronization source of the user's audio.
+    sequence: :class:`int`
+        The RTP sequence number of the packet.
+    timestamp: :class:`int`
+        The RTP timestamp of the packet, in 48 kHz samples.
+    receive_time: :class:`float`
+        The :func:`time.perf_counter` value when the packet was received.
+    data: :class:`bytes`
+        The opus encoded frame, or 16-bit 48 kHz stereo PCM when decoded.
+    """
+
+    ssrc: int
+    sequence: int
+    timestamp: int
+    receive_time: float
+    data: bytes
+
+
+class AudioStream:
+    """An asynchronous iterator over the audio received in a voice channel,
+    returned by :meth:`VoiceClient.listen`.
+
+    Iterating yields ``(user, frame)`` tuples, ``user`` being the
+    :class:`Member` who sent the :class:`AudioFrame`, a :class:`Object` if
+    they aren't cached or ``None`` if Discord hasn't yet said who they are.
+
+    Frames are queued until they are iterated over, the oldest ones being
+    dropped when the queue is full. The stream ends when it is closed, or
+    when recording stops.
+
+    This can also be used as an asynchronous context manager, closing the
+    stream on exit.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    opus: :class:`bool`
+        Whether the frames are opus encoded instead of decoded to PCM.
+    dropped: :class:`int`
+        The number of frames dropped because the queue was full.
+    """
+
+    def __init__(self, client: VoiceClient, *, opus: bool, max_queue: int) -> None:
+        self.client: VoiceClient = client
+        self.opus: bool = opus
+        self.dropped: int = 0
+        self._frames: deque[AudioFrame] = deque(maxlen=max_queue)
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._closed: bool = False
+
+    def __repr__(self) -> str:
+        return f"<AudioStream opus={self.opus} queued={len(self._frames)} closed={self._closed}>"
+
+    def __aiter__(self) -> AudioStream:
+        return self
+
+    async def __anext__(self) -> tuple[Member | Object | None, AudioFrame]:
+        while not self._frames:
+            if self._closed:
+                raise StopAsyncIteration
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+        frame = self._frames.popleft()
+        return self._resolve_user(frame.ssrc), frame
+
+    async def __aenter__(self) -> AudioStream:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
+
+    def _resolve_user(self, ssrc: int) -> Member | Object | None:
+        info = self.client.ws.ssrc_map.get(ssrc)
+        if info is None:
+            return None
+        user_id = int(info["user_id"])
+        return self.client.guild.get_member(user_id) or Object(id=user_id)
+
+    def _put(self, data: RawData, payload: bytes) -> None:
+        # called from the receiving and decoding threads
+        frames = self._frames
+        if len(frames) == frames.maxlen:
+            self.dropped += 1
+        frames.append(
+            AudioFrame(
+                data.ssrc, data.sequence, data.timestamp, data.receive_time, payload
+            )
+        )
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            self.client.loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # the loop is closed
+            pass
+
+    def _end(self) -> None:
+        self._closed = True
+        self._wake()
+
+    def close(self) -> None:
+        """Stops receiving audio into this stream.
+
+        The frames already queued are still yielded.
+        """
+        if self._closed:
+            return
+
+        self._end()
+        client = self.client
+        try:
+            client._streams.remove(self)
+        except ValueError:
+            pass
+        if (
+            not client._streams
+            and client.recording
+            and client.sink is client._listen_sink
+        ):
+            client.stop_recording()
+
+
+class _ListenSink(Sink):
+    # receives the audio while only streams are listening
+
+    def write(self, data, user):
+        return
+
+    def format_audio(self, audio):
+        return
+
+
+async def _listen_finished(sink: Sink) -> None:
+    return None
+
+
+class _VoiceReceiveProtocol(asyncio.DatagramProtocol):
+    def __init__(self, client: VoiceClient, batch_size: int) -> None:
+        self.client: VoiceClient = client
+        self.batch_size: int = batch_size
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        client = self.client
+        if not client.recording:
+            return
+
+        client.unpack_audio(data)
+        # read whatever else is already waiting, sparing a trip through the loop per packet
+        sock = client.socket
+        for _ in range(self.batch_size - 1):
+            try:
+                data = sock.recv(4096)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as exc:
+                self.error_received(exc)
+                break
+            client.unpack_audio(data)
+
+    def error_received(self, exc: Exception) -> None:
+        _log.warning("Error while receiving voice data: %s", exc)
+
+
+class _VoiceReceiver:
+    # receives the audio of a recording through a datagram endpoint
+
+    def __init__(
+        self, client: VoiceClient, batch_size: int, *, finish: Callable[[], None]
+    ) -> None:
+        self.client: VoiceClient = client
+        self.batch_size: int = batch_size
+        self.finish: Callable[[], None] = finish
+        self._transport: asyncio.DatagramTransport | None = None
+        self._task: asyncio.Task | None = None
+        self._stopped: bool = False
+
+    def start(self) -> None:
+        if not self._stopped:
+            self._task = self.client.loop.create_task(self._connect())
+
+    def restart(self) -> None:
+        # the voice client reconnected with a new socket
+        if self._task is not None:
+            self._task.cancel()
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        self.start()
+
+    async def _connect(self) -> None:
+        client = self.client
+        # the transport gets its own handle on the socket, so that closing it
+        # leaves the socket open for sending
+        sock = client.socket.dup()
+        sock.setblocking(False)
+        try:
+            transport, _ = await client.loop.create_datagram_endpoint(
+                lambda: _VoiceReceiveProtocol(client, self.batch_size), sock=sock
+            )
+        except BaseException as exc:
+            sock.close()
+            if not isinstance(exc, Exception):
+                raise
+            _log.exception("Failed to start receiving voice data.")
+            if not self._stopped and asyncio.current_task() is self._task:
+                # nothing would ever be received, so end the recording
+                # for its callback to run
+                self.client.stop_recording()
+            return
+
+        if self._stopped or asyncio.current_task() is not self._task:
+            # stopped or superseded by a restart in the meantime
+            transport.close()
+        else:
+            self._transport = transport
+
+    def stop(self) -> None:
+        if self._stopped:
+            return
+        self._stopped = True
+        if self._task is not None:
+            self._task.cancel()
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+        # cleaning sinks up can take a while, e.g. when they run ffmpeg
+        self.client.loop.run_in_executor(None, self.finish)
@@ -0,0 +1,59 @@
+import discord
+
+
+async def test_lookup_by_name_type_and_guild():
+    bot = discord.Bot()
+
+    @bot.slash_command(name="info")
+    async def info_slash(ctx):
+        pass
+
+    @bot.user_command(name="info")
+    async def info_user(ctx, user):
+        pass
+
+    @bot.slash_command(name="admin", guild_ids=[1, 2])
+    async def admin(ctx):
+        pass
+
+    assert bot._get_command_from_index("info", 1, None) is info_slash
+    assert bot._get_command_from_index("info", 2, None) is info_user
+    assert bot._get_command_from_index("admin", 1, 2) is admin
+    assert bot._get_command_from_index("admin", 1, 3) is None
+    assert bot._get_command_from_index("admin", 1, None) is None
+
+
+async def test_index_follows_added_and_removed_commands():
+    bot = discord.Bot()
+
+    @bot.slash_command(name="first")
+    async def first(ctx):
+        pass
+
+    assert bot._get_command_from_index("first", 1, None) is first
+
+    @bot.slash_command(name="second")
+    async def second(ctx):
+        pass
+
+    # added to the existing index
+    assert bot._command_index is not None
+    assert bot._get_command_from_index("second", 1, None) is second
+
+    bot.remove_application_command(first)
+    assert bot._get_command_from_index("first", 1, None) is None
+    assert bot._get_command_from_index("second", 1, None) is second
+
+
+async def test_registered_commands_come_first():
+    bot = discord.Bot()
+
+    @bot.slash_command(name="ping")
+    async def pending(ctx):
+        pass
+
+    registered = discord.SlashCommand(pending.callback, name="ping")
+    registered.id = 10
+    bot._application_commands[registered.id] = registered
+    bot._command_index = None
+    assert bot._get_command_from_index("ping", 1, None) is registered
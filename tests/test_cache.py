@@ -0,0 +1,199 @@
+import functools
+
+import pytest
+
+import discord
+from discord import cache
+from discord.cache import LRUCache, NameIndex, TTLCache
+from discord.guild import Guild
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    return clock
+
+
+def test_lru_cache_evicts_least_recently_used():
+    lru = LRUCache(2)
+    lru[1] = "a"
+    lru[2] = "b"
+    assert lru[1] == "a"
+    lru[3] = "c"
+    assert list(lru) == [1, 3]
+    assert lru.get(1) == "a"
+    lru[4] = "d"
+    assert list(lru) == [1, 4]
+    assert lru.get(3) is None
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_ttl_cache_expires_items(clock):
+    ttl = TTLCache(10)
+    ttl[1] = "a"
+    clock.now = 5
+    ttl[2] = "b"
+    assert 1 in ttl and ttl[1] == "a"
+    clock.now = 10
+    assert 1 not in ttl
+    assert ttl.get(1) is None
+    assert list(ttl) == [2]
+    assert len(ttl) == 1
+    clock.now = 15
+    assert len(ttl) == 0
+    assert not ttl._expires
+
+
+def test_ttl_cache_maxsize(clock):
+    ttl = TTLCache(10, maxsize=2)
+    for key in range(3):
+        ttl[key] = key
+    assert list(ttl.items()) == [(1, 1), (2, 2)]
+    ttl[1] = "one"
+    ttl[3] = 3
+    assert list(ttl) == [1, 3]
+
+
+def test_ttl_cache_mutators_keep_expiry_in_sync(clock):
+    ttl = TTLCache(10)
+    ttl[1] = "a"
+    ttl[2] = "b"
+    ttl[3] = "c"
+    assert ttl.pop(1) == "a"
+    assert ttl.popitem() == (3, "c")
+    assert ttl.setdefault(2, "x") == "b"
+    assert ttl.setdefault(4, "d") == "d"
+    assert list(ttl._expires) == list(ttl) == [2, 4]
+
+    clock.now = 10
+    assert ttl.pop(2, None) is None
+    with pytest.raises(KeyError):
+        ttl.pop(4)
+    with pytest.raises(KeyError):
+        ttl.popitem()
+    assert ttl.setdefault(2, "e") == "e"
+    assert list(ttl._expires) == list(ttl) == [2]
+    assert ttl.popitem(last=False) == (2, "e")
+    assert not ttl._expires and not ttl
+
+
+def test_name_index_get():
+    index = NameIndex()
+    index.add(1, "Alice", None, "alice")
+    index.add(2, "ALICE", "Bob")
+    assert index.get("alice") == [1, 2]
+    assert index.get("bob") == [2]
+    assert len(index) == 2
+
+    index.add(2, "Carol")
+    assert index.get("alice") == [1]
+    assert index.get("bob") == []
+
+    index.remove(1)
+    assert index.get("alice") == []
+    assert 1 not in index
+
+
+def test_name_index_search():
+    index = NameIndex()
+    index.add(1, "alpha")
+    assert index.search("al") == [1]
+
+    index.add(2, "Alfred")
+    index.add(3, "beta")
+    assert index.search("AL") == [2, 1]
+    assert index.search("b") == [3]
+
+    index.remove(2)
+    index.add(4, "alfonso")
+    assert index.search("alf") == [4]
+    assert index._sorted == sorted(index._ids)
+
+
+def test_member_name_index_prunes_evicted_members():
+    client = discord.Client(
+        intents=discord.Intents.all(),
+        name_index=True,
+        cache_providers={"members": functools.partial(LRUCache, 2)},
+    )
+    guild = Guild(
+        data={"id": "1", "name": "guild", "roles": []}, state=client._connection
+    )
+    for user_id in range(1, 4):
+        user = {
+            "id": str(user_id),
+            "username": "same",
+            "discriminator": "0",
+            "avatar": None,
+        }
+        guild._add_member(
+            discord.Member(
+                data={"user": user, "roles": []}, guild=guild, state=client._connection
+            )
+        )
+
+    assert len(guild._member_names) == 3
+    assert [m.id for m in guild._members_named("same")] == [2, 3]
+    assert len(guild._member_names) == 2
+
+
+def test_member_name_index_follows_renames_in_every_guild():
+    client = discord.Client(intents=discord.Intents.all(), name_index=True)
+    state = client._connection
+    user = {"id": "5", "username": "old", "discriminator": "0", "avatar": None}
+    guilds = []
+    for guild_id in (1, 2):
+        guild = Guild(
+            data={
+                "id": str(guild_id),
+                "name": "guild",
+                "roles": [],
+                "members": [{"user": user, "roles": []}],
+            },
+            state=state,
+        )
+        state._add_guild(guild)
+        guilds.append(guild)
+
+    state.parse_presence_update(
+        {
+            "guild_id": "1",
+            "user": {**user, "username": "new", "global_name": "Shown"},
+            "status": "online",
+            "activities": [],
+        }
+    )
+    for guild in guilds:
+        assert guild.get_member_named("old") is None
+        assert guild.get_member_named("new").id == 5
+        assert guild.get_member_named("Shown").id == 5
+
+
+def test_lru_cache_lookups_while_iterating():
+    lru = LRUCache(3)
+    lru.update({1: "a", 2: "b", 3: "c"})
+    with pytest.raises(RuntimeError):
+        for key in lru:
+            lru[key]
+
+    # the state's accessors hand out copies, which lookups don't affect
+    client = discord.Client(
+        intents=discord.Intents.all(),
+        cache_providers={"guilds": functools.partial(LRUCache, 10)},
+    )
+    state = client._connection
+    for guild_id in (1, 2, 3):
+        state._add_guild(
+            Guild(data={"id": str(guild_id), "name": "guild", "roles": []}, state=state)
+        )
+    assert [state._get_guild(guild.id).id for guild in client.guilds] == [1, 2, 3]
@@ -0,0 +1,169 @@
+import datetime
+
+import pytest
+
+import discord
+from discord.cache import LRUCache
+from discord.guild import Guild
+from discord.member import CompactMemberStore, _IdIndex
+from discord.user import ClientUser
+
+
+def member_data(user_id: int, **fields):
+    data = {
+        "user": {
+            "id": str(user_id),
+            "username": f"user{user_id}",
+            "discriminator": "0",
+            "global_name": None,
+            "avatar": "a_" + "ab" * 16 if user_id % 2 else None,
+        },
+        "roles": [str(10 + user_id % 3)],
+        "joined_at": "2021-01-01T00:00:00+00:00",
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+    data.update(fields)
+    return data
+
+
+@pytest.fixture
+def state():
+    client = discord.Client(compact_member_threshold=0, intents=discord.Intents.all())
+    state = client._connection
+    state.user = ClientUser(
+        state=state,
+        data={"id": "1", "username": "me", "discriminator": "0", "avatar": None},
+    )
+    state._users[state.user.id] = state.user
+    return state
+
+
+def make_guild(state, guild_id, user_ids):
+    guild = Guild(
+        data={
+            "id": str(guild_id),
+            "name": "guild",
+            "member_count": len(user_ids),
+            "roles": [],
+            "members": [member_data(user_id) for user_id in user_ids],
+        },
+        state=state,
+    )
+    state._add_guild(guild)
+    return guild
+
+
+def test_round_trip(state):
+    guild = make_guild(state, 100, [1])
+    store = guild._members
+    assert isinstance(store, CompactMemberStore)
+
+    premium = datetime.datetime(2022, 5, 1, tzinfo=datetime.timezone.utc)
+    data = member_data(3, nick="nick", premium_since=premium.isoformat(), pending=True)
+    data["user"].update(global_name="Three", discriminator="1234", bot=True)
+    original = discord.Member(data=data, guild=guild, state=state)
+    store[3] = original
+    store._recent.clear()
+
+    member = store[3]
+    assert member is not original
+    assert member.name == "user3"
+    assert member.global_name == "Three"
+    assert member.discriminator == "1234"
+    assert member.bot
+    assert member.nick == "nick"
+    assert member.pending
+    assert member.premium_since == premium
+    assert member.joined_at == original.joined_at
+    assert member.avatar == original.avatar
+    assert list(member._roles) == [10]
+
+
+def test_members_are_stable(state):
+    guild = make_guild(state, 100, range(1, 6))
+    assert guild.get_member(3) is guild.get_member(3)
+    assert guild.me is guild.me
+    assert guild.me._user is state.user
+
+
+def test_evicted_members_are_written_back(state):
+    guild = make_guild(state, 100, range(1, 6))
+    store = guild._members
+    store._recent_size = 1
+    store._recent.clear()
+
+    member = guild.get_member(3)
+    member.nick = "changed"
+    guild.get_member(4)
+    assert 3 not in store._recent
+    assert guild.get_member(3).nick == "changed"
+
+
+def test_remove_moves_last_row(state):
+    guild = make_guild(state, 100, range(1, 6))
+    store = guild._members
+    del store[2]
+    assert len(store) == 4
+    assert 2 not in store
+    assert sorted(store) == [1, 3, 4, 5]
+    store._recent.clear()
+    assert [store[user_id].name for user_id in (3, 4, 5)] == [
+        "user3",
+        "user4",
+        "user5",
+    ]
+
+
+def test_users_indexed_across_guilds(state):
+    first = make_guild(state, 100, [1, 2, 4])
+    make_guild(state, 200, [4, 7])
+
+    assert state.get_user(7).name == "user7"
+    assert state.get_user(99) is None
+
+    first._remove_member(discord.Object(4))
+    assert state.get_user(4).name == "user4"
+
+    state._remove_guild(state._get_guild(200))
+    assert state.get_user(4) is None
+    assert state.get_user(7) is None
+    assert state.get_user(2).name == "user2"
+
+
+def test_members_cache_provider_conflict():
+    with pytest.raises(ValueError):
+        discord.Client(
+            compact_member_threshold=0, cache_providers={"members": LRUCache}
+        )
+
+
+def test_id_index():
+    index = _IdIndex("I")
+    for key in range(1000, 0, -1):
+        index.set(key, key * 2)
+    for key in range(1, 1001, 2):
+        index.remove(key)
+
+    assert index.get(2) == 4
+    assert index.get(3) is None
+    index.set(3, 7)
+    assert index.get(3) == 7
+    index._merge()
+    assert index.get(3) == 7
+    assert index.get(5) is None
+    assert index.get(1000) == 2000
+
+
+def test_removing_members_does_not_search_other_guilds(state, monkeypatch):
+    first = make_guild(state, 100, range(1, 50))
+    make_guild(state, 200, range(1, 50))
+
+    def contains(self, user_id):
+        raise AssertionError("searched another guild")
+
+    monkeypatch.setattr(CompactMemberStore, "__contains__", contains)
+    state._remove_guild(first)
+    monkeypatch.undo()
+    assert state.get_user(3).name == "user3"
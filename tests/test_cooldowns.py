@@ -0,0 +1,132 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from discord.ext import commands
+from discord.ext.commands.cooldowns import (
+    BucketType,
+    Cooldown,
+    CooldownBackend,
+    CooldownMapping,
+    InMemoryCooldownBackend,
+)
+from discord.utils import utcnow
+
+
+def message(author_id: int):
+    return SimpleNamespace(author=SimpleNamespace(id=author_id))
+
+
+def test_stale_buckets_expire():
+    mapping = CooldownMapping(Cooldown(1, 10.0), BucketType.user)
+    first = mapping.get_bucket(message(1), 100.0)
+    first.update_rate_limit(100.0)
+    mapping.get_bucket(message(2), 105.0).update_rate_limit(105.0)
+    assert len(mapping._cache) == 2
+
+    mapping.get_bucket(message(3), 111.0)
+    assert set(mapping._cache) == {2, 3}
+
+    mapping.get_bucket(message(3), 116.0)
+    assert set(mapping._cache) == {3}
+
+
+def test_used_buckets_are_rescheduled():
+    mapping = CooldownMapping(Cooldown(2, 10.0), BucketType.user)
+    bucket = mapping.get_bucket(message(1), 100.0)
+    bucket.update_rate_limit(100.0)
+    bucket.update_rate_limit(108.0)
+
+    # due at 110, but used at 108 so kept until 118
+    mapping.get_bucket(message(2), 112.0)
+    assert mapping._cache[1] is bucket
+    mapping.get_bucket(message(2), 119.0)
+    assert 1 not in mapping._cache
+
+
+async def test_in_memory_backend():
+    backend = InMemoryCooldownBackend()
+    assert await backend.update_rate_limit("cmd:1", 1, 10.0, 100.0) is None
+    assert await backend.update_rate_limit("cmd:1", 1, 10.0, 101.0) == pytest.approx(
+        9.0
+    )
+    assert await backend.get_retry_after("cmd:1", 1, 10.0, 102.0) == pytest.approx(8.0)
+    assert await backend.get_retry_after("cmd:2", 1, 10.0, 102.0) == 0.0
+
+    backend._reset_later(asyncio.get_running_loop(), "cmd:1")
+    await backend._wait_for_reset("cmd:1")
+    assert await backend.get_retry_after("cmd:1", 1, 10.0, 102.0) == 0.0
+    assert not backend._resets
+
+
+def backend_context(backend, author_id: int = 1):
+    return SimpleNamespace(
+        bot=SimpleNamespace(cooldown_backend=backend, loop=asyncio.get_running_loop()),
+        message=SimpleNamespace(
+            author=SimpleNamespace(id=author_id), edited_at=None, created_at=utcnow()
+        ),
+    )
+
+
+async def test_cooldown_queries_with_backend():
+    @commands.command()
+    @commands.cooldown(1, 10.0, BucketType.user)
+    async def cmd(ctx):
+        pass
+
+    backend = InMemoryCooldownBackend()
+    ctx = backend_context(backend)
+    assert not cmd.is_on_cooldown(ctx)
+    assert cmd.get_cooldown_retry_after(ctx) == 0.0
+
+    await cmd._prepare_cooldowns(ctx)
+    with pytest.raises(commands.CommandOnCooldown):
+        await cmd._prepare_cooldowns(ctx)
+    assert cmd.is_on_cooldown(ctx)
+    assert cmd.get_cooldown_retry_after(ctx) > 0
+    assert await cmd.fetch_cooldown_retry_after(ctx) > 0
+    # the backend keeps the state, not the command
+    assert not cmd._buckets._cache
+
+    cmd.reset_cooldown(ctx)
+    assert await cmd.fetch_cooldown_retry_after(ctx) == 0.0
+    assert not cmd.is_on_cooldown(ctx)
+
+
+class RemoteBackend(CooldownBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.store = InMemoryCooldownBackend()
+
+    async def update_rate_limit(self, key, rate, per, current):
+        return await self.store.update_rate_limit(key, rate, per, current)
+
+    async def get_retry_after(self, key, rate, per, current):
+        return await self.store.get_retry_after(key, rate, per, current)
+
+    async def reset(self, key):
+        await self.store.reset(key)
+
+
+async def test_default_peek_knows_cooldowns_ran_into():
+    @commands.command()
+    @commands.cooldown(1, 10.0, BucketType.user)
+    async def cmd(ctx):
+        pass
+
+    backend = RemoteBackend()
+    ctx = backend_context(backend)
+    await cmd._prepare_cooldowns(ctx)
+    # the token was used, but nothing ran into the cooldown yet
+    assert not cmd.is_on_cooldown(ctx)
+
+    with pytest.raises(commands.CommandOnCooldown):
+        await cmd._prepare_cooldowns(ctx)
+    assert cmd.is_on_cooldown(ctx)
+    assert not cmd.is_on_cooldown(backend_context(backend, author_id=2))
+
+    cmd.reset_cooldown(ctx)
+    assert not cmd.is_on_cooldown(ctx)
+    await backend._wait_for_reset(cmd._backend_key(ctx))
+    assert await cmd.fetch_cooldown_retry_after(ctx) == 0.0
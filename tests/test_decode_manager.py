@@ -0,0 +1,111 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from discord.opus import DecodeManager
+from discord.sinks import RawData
+
+
+def packet(sequence: int, ssrc: int = 1) -> RawData:
+    data = RawData.__new__(RawData)
+    data.sequence = sequence
+    data.timestamp = sequence * 960
+    data.ssrc = ssrc
+    data.receive_time = time.perf_counter()
+    data.decrypted_data = b"frame"
+    data.decoded_data = None
+    return data
+
+
+def test_stop_does_not_wait_for_decoding():
+    manager = DecodeManager(SimpleNamespace())
+    release = threading.Event()
+    played = []
+
+    def play(previous, ready):
+        release.wait(5)
+        played.extend(ready)
+
+    manager._play = play
+    manager.start()
+    manager.decode(packet(1))
+    manager.decode(packet(2))
+
+    start = time.perf_counter()
+    manager.stop()
+    assert time.perf_counter() - start < 1
+    assert manager.is_alive()
+
+    release.set()
+    manager.join(5)
+    assert not manager.is_alive()
+    # frames queued before stopping are still decoded
+    assert [data.sequence for data in played] == [1, 2]
+
+
+def queued(manager: DecodeManager) -> list[int]:
+    return [data.sequence for queue in manager._queues for data in queue.frames]
+
+
+def test_drop_oldest():
+    manager = DecodeManager(SimpleNamespace(), max_queue=2)
+    for sequence in range(1, 4):
+        manager.decode(packet(sequence))
+    assert queued(manager) == [2, 3]
+    assert manager.stats.dropped == 1
+    assert manager.stats.queue_depth == 2
+
+
+def test_drop_newest():
+    manager = DecodeManager(SimpleNamespace(), max_queue=2, overflow="drop_newest")
+    for sequence in range(1, 5):
+        manager.decode(packet(sequence))
+    assert queued(manager) == [1, 2]
+    assert manager.stats.dropped == 2
+
+
+def test_block_waits_for_room():
+    manager = DecodeManager(SimpleNamespace(), max_queue=1, overflow="block")
+    manager.decode(packet(1))
+    blocked = threading.Thread(target=manager.decode, args=(packet(2),))
+    blocked.start()
+    blocked.join(0.1)
+    assert blocked.is_alive()
+
+    queue = manager._queues[0]
+    with queue.condition:
+        queue.frames.popleft()
+        queue.condition.notify_all()
+    blocked.join(5)
+    assert queued(manager) == [2]
+    assert manager.stats.dropped == 0
+
+
+def test_ssrcs_stick_to_their_worker():
+    manager = DecodeManager(SimpleNamespace(), workers=2)
+    for sequence, ssrc in enumerate((1, 2, 1, 3, 2, 1)):
+        manager.decode(packet(sequence, ssrc=ssrc))
+
+    first, second = manager._queues
+    assert {data.ssrc for data in first.frames} == {1, 3}
+    assert {data.ssrc for data in second.frames} == {2}
+    assert [data.sequence for data in first.frames if data.ssrc == 1] == [0, 2, 5]
+
+
+def test_stop_drains_queues():
+    manager = DecodeManager(SimpleNamespace(), workers=2)
+    played = []
+    lock = threading.Lock()
+
+    def play(previous, ready):
+        with lock:
+            played.extend(data.sequence for data in ready)
+
+    manager._play = play
+    for sequence in range(20):
+        manager.decode(packet(sequence, ssrc=sequence % 4))
+    manager.start()
+    manager.stop()
+    manager.join(5)
+    assert sorted(played) == list(range(20))
+    assert manager.stats.queue_depth == 0
@@ -0,0 +1,89 @@
+import zlib
+
+import pytest
+
+from discord.errors import InvalidArgument
+from discord.gateway import (
+    ZLIB_SUFFIX,
+    ZlibStreamDecompressor,
+    ZstdStreamDecompressor,
+    _resolve_decompressor,
+)
+from discord.http import API_VERSION, HTTPClient
+
+PAYLOADS = [b'{"op":10,"d":{"heartbeat_interval":41250}}', b'{"op":11}' * 50]
+
+
+def zlib_frames():
+    compressor = zlib.compressobj()
+    for payload in PAYLOADS:
+        yield compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def test_zlib_stream():
+    decompressor = ZlibStreamDecompressor()
+    for payload, frame in zip(PAYLOADS, zlib_frames()):
+        assert frame.endswith(ZLIB_SUFFIX)
+        assert decompressor.decompress(frame) == payload
+    assert decompressor.ratio > 1
+
+
+def test_zlib_stream_fragmented():
+    decompressor = ZlibStreamDecompressor()
+    for payload, frame in zip(PAYLOADS, zlib_frames()):
+        middle = len(frame) // 2
+        assert decompressor.decompress(frame[:middle]) is None
+        assert decompressor.decompress(frame[middle:]) == payload
+    assert decompressor.compressed_bytes == sum(map(len, zlib_frames()))
+    assert decompressor.decompressed_bytes == sum(map(len, PAYLOADS))
+
+
+def test_zstd_stream():
+    zstandard = pytest.importorskip("zstandard")
+    compressor = zstandard.ZstdCompressor().compressobj()
+    decompressor = ZstdStreamDecompressor()
+    for payload in PAYLOADS:
+        frame = compressor.compress(payload) + compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+        assert decompressor.decompress(frame) == payload
+    assert decompressor.decompressed_bytes == sum(map(len, PAYLOADS))
+
+
+def test_resolve_decompressor():
+    assert _resolve_decompressor(None) is None
+    assert _resolve_decompressor("zlib-stream") is ZlibStreamDecompressor
+    assert _resolve_decompressor(ZlibStreamDecompressor) is ZlibStreamDecompressor
+    with pytest.raises(InvalidArgument):
+        _resolve_decompressor("gzip")
+
+
+@pytest.fixture
+def http():
+    client = HTTPClient.__new__(HTTPClient)
+
+    async def request(route, **kwargs):
+        return {"url": "wss://gateway.discord.gg", "shards": 2}
+
+    client.request = request
+    return client
+
+
+async def test_gateway_url(http):
+    url = f"wss://gateway.discord.gg?encoding=json&v={API_VERSION}"
+    assert await http.get_gateway() == url + "&compress=zlib-stream"
+    assert await http.get_gateway(compress="zstd-stream") == (
+        url + "&compress=zstd-stream"
+    )
+    assert await http.get_bot_gateway(compress=None) == (2, url)
+
+
+async def test_gateway_url_zlib_is_deprecated(http):
+    url = f"wss://gateway.discord.gg?encoding=json&v={API_VERSION}"
+    with pytest.warns(DeprecationWarning):
+        assert await http.get_gateway(zlib=False) == url
+    with pytest.warns(DeprecationWarning):
+        assert await http.get_bot_gateway(zlib=True) == (
+            2,
+            url + "&compress=zlib-stream",
+        )
@@ -0,0 +1,115 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from discord.opus import DecodeManager, JitterBuffer
+from discord.sinks import RawData
+
+
+def packet(sequence: int, receive_time: float = 0.0, ssrc: int = 1) -> RawData:
+    data = RawData.__new__(RawData)
+    data.sequence = sequence
+    data.timestamp = sequence * 960
+    data.ssrc = ssrc
+    data.receive_time = receive_time
+    data.decrypted_data = b"frame"
+    data.decoded_data = None
+    return data
+
+
+def sequences(ready):
+    return [None if data is None else data.sequence for data in ready]
+
+
+def test_reorders_packets():
+    buffer = JitterBuffer(3)
+    assert buffer.push(packet(10))
+    assert sequences(buffer.pop()) == [10]
+    buffer.push(packet(12))
+    assert buffer.pop() == []
+    buffer.push(packet(11))
+    assert sequences(buffer.pop()) == [11, 12]
+    assert buffer.last.sequence == 12
+
+
+def test_conceals_lost_packet_once_depth_is_reached():
+    buffer = JitterBuffer(2)
+    buffer.push(packet(1))
+    buffer.pop()
+    buffer.push(packet(3))
+    assert buffer.pop() == []
+    buffer.push(packet(4))
+    assert sequences(buffer.pop()) == [None, 3, 4]
+
+
+def test_skips_large_gaps():
+    buffer = JitterBuffer(1)
+    buffer.push(packet(1))
+    buffer.pop()
+    buffer.push(packet(100))
+    assert sequences(buffer.pop()) == [100]
+
+
+def test_wraps_around_sequence():
+    buffer = JitterBuffer(3)
+    buffer.push(packet(0xFFFF))
+    buffer.push(packet(1))
+    buffer.push(packet(0))
+    assert sequences(buffer.pop()) == [0xFFFF, 0, 1]
+
+
+def test_drops_late_packets():
+    buffer = JitterBuffer(3)
+    buffer.push(packet(5))
+    buffer.push(packet(6))
+    buffer.pop()
+    assert not buffer.push(packet(4))
+    assert buffer.late == 1
+    assert len(buffer) == 0
+
+
+def test_deadline():
+    buffer = JitterBuffer(5, max_delay=0.5)
+    assert buffer.deadline() is None
+    buffer.push(packet(1, receive_time=10.0))
+    buffer.pop()
+    buffer.push(packet(4, receive_time=12.0))
+    buffer.push(packet(3, receive_time=11.0))
+    assert buffer.pop() == []
+    assert buffer.deadline() == 11.5
+    assert sequences(buffer.pop(flush=True)) == [None, 3, 4]
+    assert buffer.deadline() is None
+
+
+def test_default_max_delay():
+    assert JitterBuffer(5).max_delay == pytest.approx(0.1)
+    with pytest.raises(ValueError):
+        JitterBuffer(0)
+    with pytest.raises(ValueError):
+        JitterBuffer(1, max_delay=-1)
+
+
+def test_decode_manager_flushes_held_packets_after_deadline():
+    manager = DecodeManager(SimpleNamespace(), jitter_buffer=50)
+    played = []
+    released = threading.Event()
+
+    def play(previous, ready):
+        played.extend(sequences(ready))
+        if 3 in played:
+            released.set()
+
+    manager._play = play
+    manager.start()
+    try:
+        now = time.perf_counter()
+        manager.decode(packet(1, receive_time=now))
+        manager.decode(packet(3, receive_time=now))
+        # nothing else arrives, the last packet is released once 50 frames passed
+        assert released.wait(5)
+        assert played == [1, None, 3]
+        assert time.perf_counter() - now >= 1.0
+    finally:
+        manager.stop()
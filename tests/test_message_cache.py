@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+import pytest
+
+from discord.state import MessageCache
+
+
+def message(id: int, channel: int = 1, guild: int | None = 1):
+    return SimpleNamespace(
+        id=id,
+        channel=SimpleNamespace(id=channel),
+        guild=SimpleNamespace(id=guild) if guild is not None else None,
+    )
+
+
+def ids(cache: MessageCache) -> list[int]:
+    return [cached.id for cached in cache]
+
+
+def test_evicts_oldest():
+    cache = MessageCache(3)
+    messages = [message(id) for id in range(5)]
+    for cached in messages:
+        cache.append(cached)
+    assert ids(cache) == [2, 3, 4]
+    assert cache.get(1) is None
+    assert cache.get(3) is messages[3]
+    cache.append(message(5))
+    assert ids(cache) == [3, 4, 5]
+
+
+def test_lru_evicts_least_recently_accessed():
+    cache = MessageCache(3, lru=True)
+    for id in range(3):
+        cache.append(message(id))
+    cache.get(0)
+    cache.append(message(3))
+    assert ids(cache) == [2, 0, 3]
+
+
+def test_sequence_protocol():
+    cache = MessageCache(10)
+    messages = [message(id) for id in range(5)]
+    for cached in messages:
+        cache.append(cached)
+    assert len(cache) == 5
+    assert cache[0] is messages[0]
+    assert cache[3] is messages[3]
+    assert cache[-1] is messages[4]
+    with pytest.raises(IndexError):
+        cache[5]
+    assert messages[2] in cache
+    assert message(2) not in cache
+    assert cache.index(messages[4]) == 4
+    assert [cached.id for cached in reversed(cache)] == [4, 3, 2, 1, 0]
+
+
+def test_remove():
+    cache = MessageCache(10)
+    cached = message(1)
+    cache.append(cached)
+    assert cache.pop(2) is None
+    cache.remove(cached)
+    assert not cache
+    with pytest.raises(ValueError):
+        cache.remove(cached)
+
+
+def test_channel_and_guild_caps():
+    cache = MessageCache(10, max_channel_messages=2, max_guild_messages=3)
+    cache.append(message(1, channel=1))
+    cache.append(message(2, channel=1))
+    cache.append(message(3, channel=1))
+    assert ids(cache) == [2, 3]
+
+    cache.append(message(4, channel=2))
+    cache.append(message(5, channel=2))
+    assert ids(cache) == [3, 4, 5]
+
+    # private messages aren't subject to the guild cap
+    cache.append(message(6, channel=3, guild=None))
+    assert ids(cache) == [3, 4, 5, 6]
+
+    cache.pop(3)
+    assert 1 not in cache._channels
+    assert list(cache._guilds[1]) == [4, 5]
+
+
+def test_remove_guild():
+    for cache in (MessageCache(10), MessageCache(10, max_guild_messages=5)):
+        cache.append(message(1, guild=1))
+        cache.append(message(2, guild=2))
+        cache.append(message(3, guild=1))
+        cache.append(message(4, guild=None))
+        cache.remove_guild(1)
+        assert ids(cache) == [2, 4]
@@ -0,0 +1,110 @@
+import asyncio
+import io
+import struct
+import threading
+
+import pytest
+
+from discord.player import OpusClip, OpusClipCache
+
+PACKETS = [b"first", b"x" * 300, b"", b"last"]
+
+
+def ogg_page(packets: list[bytes], pagenum: int) -> bytes:
+    segments = bytearray()
+    for packet in packets:
+        segments += b"\xff" * (len(packet) // 255) + bytes([len(packet) % 255])
+    header = struct.pack("<BBQIIIB", 0, 0, 0, 1, pagenum, 0, len(segments))
+    return b"OggS" + header + bytes(segments) + b"".join(packets)
+
+
+def ogg_stream(packets: list[bytes]) -> io.BytesIO:
+    # OpusHead and OpusTags get pages of their own, as in real streams
+    return io.BytesIO(
+        ogg_page([b"OpusHead\x01\x02"], 0)
+        + ogg_page([b"OpusTags\x08\x00"], 1)
+        + ogg_page(packets, 2)
+    )
+
+
+@pytest.mark.parametrize("mapped", [False, True])
+def test_from_ogg_skips_header_packets(mapped):
+    clip = OpusClip.from_ogg("clip", ogg_stream(PACKETS), mapped=mapped)
+    assert [clip[i] for i in range(len(clip))] == PACKETS
+    assert clip.size == sum(map(len, PACKETS))
+    assert clip.mapped is mapped
+
+
+def test_header_packets_are_only_skipped_at_the_start():
+    # an audio packet may start with the same bytes as a header
+    packets = [b"OpusTags-like audio"]
+    clip = OpusClip.from_ogg("clip", ogg_stream(packets))
+    assert clip[0] == packets[0]
+
+
+def test_mapped_clip():
+    clip = OpusClip("clip", iter(PACKETS), mapped=True)
+    assert clip.mapped
+    assert [clip[i] for i in range(len(clip))] == PACKETS
+
+    empty = OpusClip("empty", [], mapped=True)
+    assert len(empty) == 0 and empty.size == 0
+
+
+def test_clip_audio_is_exhausted():
+    clip = OpusClip("clip", PACKETS)
+    first, second = clip.source(), clip.source()
+    assert first.is_opus()
+    assert [first.read() for _ in PACKETS] == PACKETS
+    assert first.read() == b""
+    assert first.read() == b""
+    # sources of the same clip play independently
+    assert second.read() == PACKETS[0]
+
+
+def test_cache_skips_oversize_clips():
+    cache = OpusClipCache(max_size=10)
+    cache.add(OpusClip("small", [b"12345"]))
+    cache.add(OpusClip("large", [b"x" * 11]))
+    assert "large" not in cache
+    assert "small" in cache
+    assert cache.size == 5
+
+    # replacing a cached clip with an oversize one drops it
+    cache.add(OpusClip("small", [b"x" * 11]))
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = OpusClipCache(max_size=10)
+    cache.add(OpusClip("a", [b"12345"]))
+    cache.add(OpusClip("b", [b"12345"]))
+    assert cache.get("a") is not None
+    cache.add(OpusClip("c", [b"12345"]))
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.size == 10
+
+
+async def test_fetch_shares_concurrent_loads(monkeypatch):
+    cache = OpusClipCache()
+    release = threading.Event()
+    calls = []
+
+    def load(source, *, key=None, **options):
+        calls.append(source)
+        release.wait(1)
+        clip = OpusClip(source, [b"packet"])
+        cache.add(clip)
+        return clip
+
+    monkeypatch.setattr(cache, "load", load)
+    tasks = [asyncio.create_task(cache.fetch("clip.mp3")) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    release.set()
+    clips = await asyncio.gather(*tasks)
+
+    assert calls == ["clip.mp3"]
+    assert all(clip is clips[0] for clip in clips)
+    assert not cache._fetching
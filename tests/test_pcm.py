@@ -0,0 +1,114 @@
+import array
+
+import pytest
+
+from discord import pcm
+from discord.opus import Encoder
+from discord.player import AudioSource, MixerSource
+
+
+def frame(value: int) -> bytes:
+    return array.array("h", [value] * (Encoder.FRAME_SIZE // 2)).tobytes()
+
+
+class ConstantSource(AudioSource):
+    def __init__(self, value: int, frames: int = 10) -> None:
+        self.data = frame(value)
+        self.frames = frames
+        self.cleaned_up = 0
+
+    def read(self) -> bytes:
+        if not self.frames:
+            return b""
+        self.frames -= 1
+        return self.data
+
+    def cleanup(self) -> None:
+        self.cleaned_up += 1
+
+
+def test_mixer_sums_sources():
+    a, b = ConstantSource(100), ConstantSource(-30)
+    mixer = MixerSource(a, b)
+    mixer.set_volume(b, 2.0)
+    assert mixer.read() == frame(40)
+
+
+def test_mixer_removes_finished_sources():
+    source = ConstantSource(100, frames=1)
+    mixer = MixerSource(source)
+    assert mixer.read() == frame(100)
+    assert mixer.read() == b""
+    assert source.cleaned_up == 1
+    assert mixer.sources == []
+
+
+def test_mixer_cleans_up_removed_sources_on_read():
+    a, b = ConstantSource(100), ConstantSource(5)
+    mixer = MixerSource(a, b)
+    mixer.remove(a)
+    assert a.cleaned_up == 0
+    assert mixer.read() == frame(5)
+    assert a.cleaned_up == 1
+
+
+def test_persistent_mixer_plays_silence():
+    mixer = MixerSource(persistent=True)
+    assert mixer.read() == bytes(Encoder.FRAME_SIZE)
+
+
+BACKENDS = {"python": pcm._process_python}
+if pcm.HAS_AUDIOOP:
+    BACKENDS["audioop"] = pcm._process_audioop
+if pcm.HAS_NUMPY:
+    BACKENDS["numpy"] = pcm._process_numpy
+
+SAMPLES = array.array(
+    "h", [(i * 2654435761) % 65536 - 32768 for i in range(Encoder.FRAME_SIZE // 2)]
+)
+
+
+def samples(data: bytes) -> array.array:
+    return array.array("h", data)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("factor", [0.0, 0.25, 0.5, 1.5])
+def test_backend_gain_matches_reference(backend, factor):
+    data = SAMPLES.tobytes()
+    expected = samples(pcm._process_python(data, factor, factor, None))
+    result = samples(BACKENDS[backend](data, factor, factor, None))
+    assert max(abs(a - b) for a, b in zip(expected, result)) <= 1
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_ramp_close_to_reference(backend):
+    data = SAMPLES.tobytes()
+    expected = samples(pcm._process_python(data, 1.0, 0.0, None))
+    result = samples(BACKENDS[backend](data, 1.0, 0.0, None))
+    assert max(abs(a - b) for a, b in zip(expected, result)) <= 1
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_soft_limit(backend):
+    data = frame(20000)
+    result = samples(BACKENDS[backend](data, 2.0, 2.0, 0.8))
+    assert all(0.8 * pcm.MAX_SAMPLE < value < pcm.MAX_SAMPLE for value in result)
+
+    quiet = frame(1000)
+    assert BACKENDS[backend](quiet, 2.0, 2.0, 0.8) == frame(2000)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_soft_limit_per_sample(backend):
+    # only the loud samples are compressed, the quiet ones keep their gain
+    data = array.array("h", [1000, 1000, 20000, 20000] * 10).tobytes()
+    expected = samples(pcm._process_python(data, 2.0, 2.0, 0.8))
+    result = samples(BACKENDS[backend](data, 2.0, 2.0, 0.8))
+    assert result[:2] == array.array("h", [2000, 2000])
+    assert max(abs(a - b) for a, b in zip(expected, result)) <= 1
+
+
+def test_mix_saturates():
+    assert pcm.mix([frame(30000), frame(30000)]) == frame(pcm.MAX_SAMPLE)
+    assert pcm.mix([frame(100), frame(-50)], [1.0, 2.0]) == frame(0)
@@ -0,0 +1,124 @@
+import pytest
+
+import discord
+from discord.guild import Guild
+from discord.permissions import Permissions
+
+GUILD_ID = 100
+ROLE_ID = 200
+
+
+def role_data(role_id: int, permissions: Permissions, position: int = 0):
+    return {
+        "id": str(role_id),
+        "name": "role",
+        "permissions": str(permissions.value),
+        "position": position,
+        "color": 0,
+        "hoist": False,
+        "managed": False,
+        "mentionable": False,
+    }
+
+
+def channel_data(overwrites=()):
+    return {
+        "id": "300",
+        "type": 0,
+        "name": "general",
+        "position": 0,
+        "guild_id": str(GUILD_ID),
+        "permission_overwrites": list(overwrites),
+    }
+
+
+@pytest.fixture
+def state():
+    client = discord.Client(cache_permissions=True, intents=discord.Intents.all())
+    return client._connection
+
+
+@pytest.fixture
+def guild(state):
+    guild = Guild(
+        data={
+            "id": str(GUILD_ID),
+            "name": "guild",
+            "owner_id": "1",
+            "roles": [
+                role_data(GUILD_ID, Permissions(view_channel=True)),
+                role_data(ROLE_ID, Permissions(manage_messages=True), position=1),
+            ],
+            "channels": [channel_data()],
+        },
+        state=state,
+    )
+    state._add_guild(guild)
+    return guild
+
+
+def make_member(guild, state, roles=()):
+    user = {"id": "2", "username": "user", "discriminator": "0", "avatar": None}
+    member = discord.Member(
+        data={"user": user, "roles": [str(role) for role in roles]},
+        guild=guild,
+        state=state,
+    )
+    guild._add_member(member)
+    return member
+
+
+def test_results_are_cached(guild, state):
+    channel = guild.get_channel(300)
+    member = make_member(guild, state)
+    cache = guild.permission_cache
+
+    first = channel.permissions_for(member)
+    second = channel.permissions_for(member)
+    assert first == second and first is not second
+    assert first.view_channel and not first.manage_messages
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+
+    # members are keyed by their roles
+    member._roles.add(ROLE_ID)
+    assert channel.permissions_for(member).manage_messages
+    assert cache.misses == 2
+
+
+def test_role_update_invalidates(guild, state):
+    channel = guild.get_channel(300)
+    member = make_member(guild, state, roles=[ROLE_ID])
+    assert channel.permissions_for(member).manage_messages
+    generation = guild.permission_cache.generation
+
+    state.parse_guild_role_update(
+        {"guild_id": str(GUILD_ID), "role": role_data(ROLE_ID, Permissions.none(), 1)}
+    )
+    assert guild.permission_cache.generation == generation + 1
+    assert not channel.permissions_for(member).manage_messages
+
+    state.parse_guild_role_delete({"guild_id": str(GUILD_ID), "role_id": ROLE_ID})
+    assert guild.permission_cache.generation == generation + 2
+
+
+def test_overwrite_update_invalidates(guild, state):
+    channel = guild.get_channel(300)
+    member = make_member(guild, state)
+    assert channel.permissions_for(member).view_channel
+
+    deny = {
+        "id": str(GUILD_ID),
+        "type": 0,
+        "allow": "0",
+        "deny": str(Permissions(view_channel=True).value),
+    }
+    channel._update(guild, channel_data([deny]))
+    assert not channel.permissions_for(member).view_channel
+    assert guild.permission_cache.misses == 2
+
+
+def test_disabled_by_default():
+    client = discord.Client(intents=discord.Intents.all())
+    guild = Guild(data={"id": "1", "name": "guild"}, state=client._connection)
+    assert guild.permission_cache is None
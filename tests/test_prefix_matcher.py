@@ -0,0 +1,78 @@
+import pytest
+
+from discord.ext import commands
+from discord.ext.commands.bot import _PrefixMatcher
+
+
+def test_matches_earliest_prefix_in_order():
+    matcher = _PrefixMatcher(("!", "!!", "?"))
+    assert matcher.match("!!help") == "!"
+    assert matcher.match("?help") == "?"
+    assert matcher.match("help") is None
+
+    matcher = _PrefixMatcher(("!!", "!"))
+    assert matcher.match("!!help") == "!!"
+    assert matcher.match("!help") == "!"
+
+
+def test_empty_prefix():
+    matcher = _PrefixMatcher(("!", ""))
+    assert matcher.match("!help") == "!"
+    assert matcher.match("help") == ""
+
+
+def test_rejects_non_str_prefixes():
+    with pytest.raises(TypeError):
+        _PrefixMatcher(("!", 1))
+
+
+async def test_bot_caches_matchers():
+    bot = commands.Bot(command_prefix="!", max_prefix_matchers=2)
+    first = bot._get_prefix_matcher(("!", "?"))
+    assert bot._get_prefix_matcher(("!", "?")) is first
+    bot._get_prefix_matcher(("a",))
+    bot._get_prefix_matcher(("b",))
+    assert list(bot._prefix_matchers) == [("a",), ("b",)]
+
+    # a hit keeps the matcher from being the next one discarded
+    assert bot._get_prefix_matcher(("a",)) is bot._prefix_matchers[("a",)]
+    bot._get_prefix_matcher(("c",))
+    assert list(bot._prefix_matchers) == [("a",), ("c",)]
+
+
+def make_group():
+    @commands.group()
+    async def group(ctx):
+        pass
+
+    @group.command(aliases=["Hello"])
+    async def hi(ctx):
+        pass
+
+    return group
+
+
+def test_case_insensitive_setter():
+    group = make_group()
+    assert group.get_command("HI") is None
+
+    group.case_insensitive = True
+    assert group.get_command("HI").name == "hi"
+    assert group.get_command("hello").name == "hi"
+
+    group.case_insensitive = False
+    assert group.get_command("HI") is None
+    assert group.get_command("Hello").name == "hi"
+
+
+def test_case_insensitive_setter_conflict():
+    group = make_group()
+
+    @group.command()
+    async def HI(ctx):
+        pass
+
+    with pytest.raises(commands.CommandRegistrationError):
+        group.case_insensitive = True
+    assert not group.case_insensitive
+    assert group.get_command("HI").name == "HI"
@@ -0,0 +1,271 @@
+import asyncio
+import types
+
+import pytest
+
+from discord.http import HTTPClient, Route
+from discord.ratelimits import (
+    InMemoryRatelimitStore,
+    Ratelimit,
+    UnixSocketRatelimitStore,
+)
+
+
+async def test_ratelimit_starts_serialized():
+    ratelimit = Ratelimit()
+    await ratelimit.acquire()
+    assert ratelimit.remaining == 0
+    assert ratelimit.outgoing == 1
+
+    waiter = asyncio.create_task(ratelimit.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    ratelimit.release()
+    await asyncio.wait_for(waiter, 1)
+    assert ratelimit.outgoing == 1
+
+
+async def test_ratelimit_update_allows_concurrency():
+    ratelimit = Ratelimit()
+    await ratelimit.acquire()
+    ratelimit.update(5, 4, 10.0)
+    assert ratelimit.limit == 5
+    assert ratelimit.remaining == 4
+
+    for _ in range(4):
+        await asyncio.wait_for(ratelimit.acquire(), 1)
+    assert ratelimit.remaining == 0
+    assert ratelimit.outgoing == 5
+
+
+async def test_ratelimit_update_never_raises_remaining():
+    ratelimit = Ratelimit()
+    await ratelimit.acquire()
+    ratelimit.update(5, 2, 10.0)
+    # an older response arriving late reports more remaining requests
+    ratelimit.update(5, 4, 10.0)
+    assert ratelimit.remaining == 2
+
+
+async def test_ratelimit_reset():
+    ratelimit = Ratelimit()
+    await ratelimit.acquire()
+    ratelimit.update(2, 0, 0.01)
+    ratelimit.release()
+    assert ratelimit.remaining == 0
+
+    await asyncio.sleep(0.05)
+    assert ratelimit.remaining == 2
+    assert ratelimit.expires is None
+
+
+async def test_ratelimit_release_without_acquire():
+    ratelimit = Ratelimit()
+    ratelimit.limit = ratelimit.remaining = 5
+    ratelimit.release()
+    assert ratelimit.outgoing == 0
+    assert ratelimit.remaining == 5
+
+
+async def test_store_release_with_update():
+    store = InMemoryRatelimitStore()
+    await store.acquire("bucket")
+    await store.release("bucket", (3, 2, 10.0))
+    ratelimit = store._buckets["bucket"]
+    assert ratelimit.limit == 3
+    assert ratelimit.remaining == 2
+    assert ratelimit.outgoing == 0
+
+
+async def test_store_carries_state_to_hashed_bucket():
+    store = InMemoryRatelimitStore()
+    await store.acquire("GET /path:1")
+    await store.release("GET /path:1", (10, 9, 10.0))
+    await store.set_bucket_hash("GET /path", "abc", ("GET /path:1", "abc:1"))
+
+    assert await store.get_bucket_hash("GET /path") == "abc"
+    assert store._buckets["abc:1"] is store._buckets["GET /path:1"]
+    for _ in range(9):
+        await asyncio.wait_for(store.acquire("abc:1"), 1)
+
+
+async def test_shared_store_ignores_foreign_release(tmp_path):
+    store = UnixSocketRatelimitStore(str(tmp_path / "ratelimits.sock"))
+    store._local = local = InMemoryRatelimitStore()
+    await local.acquire("bucket")
+    held = {}
+
+    # a release for a slot acquired on a previous serving process
+    await store._handle_request({"op": "release", "args": ["bucket", None]}, None, held)
+    assert local._buckets["bucket"].outgoing == 1
+
+    await store._handle_request({"op": "acquire", "args": ["other"]}, None, held)
+    await store._handle_request({"op": "release", "args": ["other", None]}, None, held)
+    assert held == {"other": 0}
+    assert local._buckets["other"].outgoing == 0
+
+
+class FakeResponse:
+    def __init__(self, bucket_hash: str, remaining: int, status: int = 200) -> None:
+        self.status = status
+        self.headers = {
+            "content-type": "application/json",
+            "X-Ratelimit-Bucket": bucket_hash,
+            "X-Ratelimit-Limit": "5",
+            "X-Ratelimit-Remaining": str(remaining),
+            "X-Ratelimit-Reset-After": "10.0",
+        }
+
+    async def text(self, encoding: str) -> str:
+        return "{}"
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+class FakeSession:
+    def __init__(self, *responses: FakeResponse) -> None:
+        self.responses = list(responses)
+
+    def request(self, method: str, url: str, **kwargs) -> FakeResponse:
+        return self.responses.pop(0)
+
+
+def http_client(store, *responses: FakeResponse) -> HTTPClient:
+    client = HTTPClient(ratelimit_store=store)
+    client._HTTPClient__session = FakeSession(*responses)
+    return client
+
+
+async def test_request_moves_bucket_to_its_hash():
+    store = InMemoryRatelimitStore()
+    client = http_client(store, FakeResponse("abc", 4), FakeResponse("abc", 3))
+    route = Route("GET", "/channels/{channel_id}", channel_id=1)
+
+    await client.request(route)
+    assert await store.get_bucket_hash(route.key) == "abc"
+    ratelimit = store._buckets[f"abc:{route.major_parameters}"]
+    assert ratelimit is store._buckets[f"{route.key}:{route.major_parameters}"]
+    assert ratelimit.limit == 5
+    assert ratelimit.remaining == 4
+
+    # later requests go straight to the hashed bucket
+    await client.request(route)
+    assert ratelimit.remaining == 3
+    assert ratelimit.outgoing == 0
+
+
+async def test_request_follows_a_changed_hash():
+    store = InMemoryRatelimitStore()
+    client = http_client(store, FakeResponse("abc", 4), FakeResponse("def", 2))
+    route = Route("GET", "/channels/{channel_id}", channel_id=1)
+
+    await client.request(route)
+    await client.request(route)
+    assert await store.get_bucket_hash(route.key) == "def"
+    old = store._buckets[f"abc:{route.major_parameters}"]
+    assert store._buckets[f"def:{route.major_parameters}"] is old
+    assert old.remaining == 2
+
+
+async def test_concurrent_acquires_within_limit():
+    store = InMemoryRatelimitStore()
+    await store.acquire("bucket")
+    await store.release("bucket", (3, 3, 10.0))
+    ratelimit = store._buckets["bucket"]
+
+    tasks = [asyncio.create_task(store.acquire("bucket")) for _ in range(4)]
+    await asyncio.sleep(0.01)
+    assert [task.done() for task in tasks] == [True, True, True, False]
+    assert ratelimit.outgoing == 3
+
+    # a release within the window doesn't free a slot, the reset does
+    await store.release("bucket")
+    await asyncio.sleep(0.01)
+    assert not tasks[3].done()
+
+    ratelimit.reset()
+    await asyncio.wait_for(tasks[3], 1)
+    assert ratelimit.outgoing == 3
+
+
+async def test_global_limit_per_second(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(
+        "discord.ratelimits.time", types.SimpleNamespace(monotonic=lambda: now)
+    )
+    store = InMemoryRatelimitStore(max_global_requests=2)
+    await asyncio.wait_for(store.acquire_global(), 1)
+    await asyncio.wait_for(store.acquire_global(), 1)
+
+    now = 100.99
+    waiter = asyncio.create_task(store.acquire_global())
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    # a new second starts a new window
+    now = 101.0
+    await asyncio.wait_for(waiter, 1)
+
+
+async def test_global_ratelimit_blocks_requests():
+    store = InMemoryRatelimitStore()
+    await store.set_global_ratelimit(0.05)
+    waiter = asyncio.create_task(store.acquire_global())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    await asyncio.wait_for(waiter, 1)
+
+
+async def test_shared_store_acquires_request_in_one_round_trip(tmp_path):
+    path = str(tmp_path / "ratelimits.sock")
+    server = UnixSocketRatelimitStore(path)
+    client = UnixSocketRatelimitStore(path)
+    try:
+        await server.set_bucket_hash("GET /path", "abc")
+        await client._connect()
+        assert client._local is None
+
+        sent = []
+        send = client._send
+        client._send = lambda payload: (sent.append(payload["op"]), send(payload))
+
+        assert await client.acquire_request("GET /path", "1") == ("abc", "abc:1")
+        assert sent == ["acquire_request"]
+        assert server._local._buckets["abc:1"].outgoing == 1
+
+        await client.release("abc:1")
+        await asyncio.sleep(0.05)
+        assert server._local._buckets["abc:1"].outgoing == 0
+    finally:
+        await client.close()
+        # let the serving side see the disconnection before closing it
+        await asyncio.sleep(0.05)
+        await server.close()
+
+
+async def test_acquire_request_releases_bucket_on_global_failure():
+    store = InMemoryRatelimitStore()
+
+    async def acquire_global():
+        raise asyncio.CancelledError
+
+    store.acquire_global = acquire_global
+    try:
+        await store.acquire_request("GET /path", "1")
+    except asyncio.CancelledError:
+        pass
+    assert store._buckets["GET /path:1"].outgoing == 0
+    assert await store.acquire_request("GET /path", "1", False) == (
+        None,
+        "GET /path:1",
+    )
+
+
+def test_max_global_requests_needs_default_store():
+    with pytest.raises(TypeError):
+        HTTPClient(ratelimit_store=InMemoryRatelimitStore(), max_global_requests=10)
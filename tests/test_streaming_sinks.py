@@ -0,0 +1,119 @@
+import asyncio
+import stat
+import sys
+import types
+
+import pytest
+
+from discord.opus import Decoder
+from discord.sinks import FFmpegSink, FFmpegSinkError, TempFileSink
+from discord.voice_client import VoiceClient
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="the fake ffmpeg is a shebang script"
+)
+
+# copies its input to the output after a marker, or fails after reading it
+FAKE_FFMPEG = """#!{python}
+import sys
+data = sys.stdin.buffer.read()
+if {fail}:
+    sys.exit(3)
+sys.stdout.buffer.write(b"encoded:" + data)
+"""
+
+
+def fake_ffmpeg(tmp_path, name="ffmpeg", fail=False):
+    path = tmp_path / name
+    path.write_text(FAKE_FFMPEG.format(python=sys.executable, fail=fail))
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+def voice_client():
+    return types.SimpleNamespace(recording=True, decoder=Decoder)
+
+
+def test_temp_file_sink_spills_to_disk(tmp_path):
+    sink = TempFileSink(max_memory=4, directory=str(tmp_path))
+    sink.init(voice_client())
+    sink.write(b"ab", 1)
+    sink.write(b"cdef", 1)
+    sink.write(b"xy", 2)
+    sink.vc.recording = False
+    sink.cleanup()
+
+    assert sink.audio_data[1].file._rolled
+    assert not sink.audio_data[2].file._rolled
+    assert sink.audio_data[1].file.read() == b"abcdef"
+    assert sink.audio_data[2].file.read() == b"xy"
+    assert all(audio.error is None for audio in sink.audio_data.values())
+
+
+def test_ffmpeg_sink_rejects_unknown_encoding():
+    with pytest.raises(FFmpegSinkError):
+        FFmpegSink(encoding="wav")
+
+
+def test_ffmpeg_sink_checks_executable(tmp_path):
+    sink = FFmpegSink(executable=str(tmp_path / "missing"))
+    with pytest.raises(FFmpegSinkError):
+        sink.init(voice_client())
+
+
+def test_ffmpeg_sink_encodes_each_user(tmp_path):
+    sink = FFmpegSink(executable=fake_ffmpeg(tmp_path), directory=str(tmp_path))
+    sink.init(voice_client())
+    sink.write(b"one", 1)
+    sink.write(b"two", 2)
+    sink.write(b"three", 1)
+    sink.vc.recording = False
+    sink.cleanup()
+
+    first, second = sink.audio_data[1], sink.audio_data[2]
+    assert first.finished and second.finished
+    assert first.file.read() == b"encoded:onethree"
+    assert second.file.read() == b"encoded:two"
+    assert first.error is None and second.error is None
+
+
+def test_ffmpeg_sink_records_encoder_failures(tmp_path):
+    sink = FFmpegSink(executable=fake_ffmpeg(tmp_path, fail=True))
+    sink.init(voice_client())
+    sink.write(b"audio", 1)
+    sink.vc.recording = False
+    sink.cleanup()
+
+    audio = sink.audio_data[1]
+    assert audio.finished
+    assert isinstance(audio.error, FFmpegSinkError)
+    assert "code 3" in str(audio.error)
+
+
+def test_ffmpeg_sink_refuses_formatting_while_recording(tmp_path):
+    sink = FFmpegSink(executable=fake_ffmpeg(tmp_path))
+    sink.init(voice_client())
+    sink.write(b"audio", 1)
+    with pytest.raises(FFmpegSinkError):
+        sink.format_audio(sink.audio_data[1])
+    sink.vc.recording = False
+    sink.cleanup()
+
+
+async def test_failed_encoder_still_reaches_callback(tmp_path):
+    sink = FFmpegSink(executable=fake_ffmpeg(tmp_path, fail=True))
+    sink.init(voice_client())
+    sink.write(b"audio", 1)
+    sink.vc.recording = False
+
+    client = object.__new__(VoiceClient)
+    client.loop = asyncio.get_running_loop()
+    decoder = types.SimpleNamespace(join=lambda: None)
+    results = []
+
+    async def callback(sink, *args):
+        results.append((sink, args))
+
+    await asyncio.to_thread(client._finish_recording, decoder, sink, callback, "arg")
+    assert results == [(sink, ("arg",))]
+    assert sink.audio_data[1].error is not None
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+from discord.ui import Button, View
+from discord.ui.view import ViewStore, _TimeoutScheduler
+
+
+class Owner:
+    def __init__(self, expiry: float) -> None:
+        self.expiry = expiry
+        self.timed_out = asyncio.Event()
+
+    def _check_timeout(self, now: float) -> float | None:
+        if now >= self.expiry:
+            self.timed_out.set()
+            return None
+        return self.expiry
+
+
+async def test_runs_timeouts_in_order():
+    scheduler = _TimeoutScheduler()
+    now = time.monotonic()
+    late, early = Owner(now + 0.05), Owner(now + 0.01)
+    scheduler.schedule(late, late.expiry)
+    scheduler.schedule(early, early.expiry)
+    assert scheduler._deadline == early.expiry
+
+    await asyncio.wait_for(early.timed_out.wait(), 1)
+    assert not late.timed_out.is_set()
+    await asyncio.wait_for(late.timed_out.wait(), 1)
+    assert len(scheduler) == 0
+    assert scheduler._timer is None
+
+
+async def test_refreshed_expiry_is_rescheduled():
+    scheduler = _TimeoutScheduler()
+    owner = Owner(time.monotonic() + 0.01)
+    scheduler.schedule(owner, owner.expiry)
+    owner.expiry += 0.05
+
+    await asyncio.sleep(0.03)
+    assert not owner.timed_out.is_set()
+    assert len(scheduler) == 1
+    await asyncio.wait_for(owner.timed_out.wait(), 1)
+
+
+async def test_cancelled_handles_are_skipped():
+    scheduler = _TimeoutScheduler()
+    owner = Owner(time.monotonic() + 0.01)
+    scheduler.schedule(owner, owner.expiry).cancel()
+
+    await asyncio.sleep(0.03)
+    assert not owner.timed_out.is_set()
+    assert len(scheduler) == 0
+
+
+async def test_view_timeout_removes_view():
+    store = ViewStore(None)
+    view = View(Button(custom_id="a"), timeout=0.01)
+    store.add_view(view)
+    assert len(store._timeouts) == 1
+
+    assert await asyncio.wait_for(view.wait(), 1)
+    assert store.stats.views == 0
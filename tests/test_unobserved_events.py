@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+import discord
+from discord.gateway import DiscordWebSocket
+
+TYPING = b'{"t":"TYPING_START","s":42,"op":0,"d":{"channel_id":"1"}}'
+
+
+def test_unobserved_events_skipped_when_enabled():
+    client = discord.Client(skip_unobserved_events=True)
+    state = client._connection
+    assert not state._is_observed("presence_update")
+    assert state._is_event_skippable("TYPING_START")
+
+    @client.event
+    async def on_presence_update(before, after):
+        pass
+
+    assert state._is_observed("presence_update")
+
+
+def test_skip_unobserved_events_disabled_by_default():
+    client = discord.Client()
+    state = client._connection
+    assert state._is_observed("presence_update")
+    assert state._is_observed("member_update")
+    assert not state._is_event_skippable("TYPING_START")
+
+
+@pytest.fixture
+def ws():
+    client = discord.Client(skip_unobserved_events=True)
+    ws = DiscordWebSocket(None, loop=asyncio.new_event_loop())
+    ws._connection = client._connection
+    ws.shard_id = None
+    ws.dispatched = []
+    ws._dispatch = lambda *args: ws.dispatched.append(args)
+    yield ws
+    ws.loop.close()
+
+
+def test_gateway_skips_unobserved_event(ws):
+    assert ws._skip_unobserved(TYPING)
+    assert ws._skip_unobserved(TYPING.decode())
+    assert ws.sequence == 42
+    assert ws.dispatched[0] == ("socket_event_type", "TYPING_START")
+
+
+def test_gateway_keeps_observed_event(ws):
+    @ws._connection._get_client().event
+    async def on_typing(channel, user, when):
+        pass
+
+    assert not ws._skip_unobserved(TYPING)
+    assert ws.sequence is None
+
+
+def test_gateway_keeps_event_waited_for(ws):
+    ws.wait_for("TYPING_START", lambda data: True)
+    assert not ws._skip_unobserved(TYPING)
+
+
+def test_gateway_keeps_event_without_leading_type(ws):
+    # only payloads starting with "t" and "s" are inspected before decoding
+    assert not ws._skip_unobserved(b'{"op":0,"t":"TYPING_START","s":42,"d":{}}')
+    assert not ws._skip_unobserved(b'{"t":null,"s":null,"op":11,"d":null}')
+    assert ws.sequence is None
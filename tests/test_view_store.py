@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+from discord.ui import Button, View
+from discord.ui.view import ViewStore
+
+
+def interaction(message_id: int | None = None):
+    message = SimpleNamespace(id=message_id) if message_id is not None else None
+    return SimpleNamespace(message=message)
+
+
+async def test_add_and_remove_view():
+    store = ViewStore(None)
+    view = View(Button(custom_id="a"), Button(custom_id="b"), timeout=None)
+    store.add_view(view, message_id=1)
+    stats = store.stats
+    assert (stats.views, stats.items, stats.tracked_messages) == (1, 2, 1)
+    assert store.is_message_tracked(1)
+
+    view.stop()
+    stats = store.stats
+    assert (stats.views, stats.items, stats.tracked_messages) == (0, 0, 0)
+
+
+async def test_finished_views_are_not_added():
+    store = ViewStore(None)
+    view = View(Button(custom_id="a"), timeout=None)
+    view.stop()
+    store.add_view(view)
+    assert store.stats.views == 0
+
+
+async def test_view_taking_over_keys():
+    store = ViewStore(None)
+    first = View(Button(custom_id="a"), timeout=None)
+    second = View(Button(custom_id="a"), timeout=None)
+    store.add_view(first, message_id=1)
+    store.add_view(second, message_id=1)
+    # nothing routes to the first view anymore
+    assert store.stats.views == 1
+    assert store.stats.items == 1
+
+    # removing the replaced view leaves the new one in place
+    first.stop()
+    assert store.stats.items == 1
+    second.stop()
+    assert store.stats.items == 0
+    assert not store.is_message_tracked(1)
+
+
+async def test_dispatch_stats():
+    store = ViewStore(None)
+    view = View(Button(custom_id="a"), timeout=None)
+    store.add_view(view)
+    dispatched = []
+    view._dispatch_item = lambda item, interaction: dispatched.append(item)
+    view.children[0].refresh_state = lambda interaction: None
+
+    store.dispatch(2, "a", interaction(5))
+    store.dispatch(2, "missing", interaction())
+    assert dispatched == [view.children[0]]
+    stats = store.stats
+    assert stats.dispatches == 2
+    assert stats.max_dispatch_latency >= stats.average_dispatch_latency > 0
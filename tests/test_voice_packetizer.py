@@ -0,0 +1,60 @@
+import pytest
+
+pytest.importorskip("nacl")
+
+from nacl.exceptions import CryptoError
+
+from discord.sinks import RawData
+from discord.voice_client import VoiceClient, VoicePacketizer
+
+KEY = list(range(32))
+FRAME = bytes(range(1, 100))
+
+
+def voice_client(mode: str) -> VoiceClient:
+    client = object.__new__(VoiceClient)
+    client.mode = mode
+    client.secret_key = KEY
+    client.ssrc = 1234
+    client.paused = False
+    client._packetizer = None
+    return client
+
+
+@pytest.mark.parametrize("mode", VoiceClient.supported_modes)
+def test_packet_round_trip(mode):
+    client = voice_client(mode)
+    client._update_packetizer()
+    packet = client._packetizer.packet(7, 960, FRAME)
+
+    data = RawData(packet, client)
+    assert (data.sequence, data.timestamp, data.ssrc) == (7, 960, 1234)
+    assert data.decrypted_data == FRAME
+
+
+@pytest.mark.parametrize("mode", VoiceClient.supported_modes)
+def test_packet_from_another_key_is_rejected(mode):
+    packet = VoicePacketizer(mode, [0] * 32, 1234).packet(7, 960, FRAME)
+    client = voice_client(mode)
+    client._update_packetizer()
+    with pytest.raises(CryptoError):
+        RawData(packet, client)
+
+
+def test_lite_nonce_continues_across_key_updates():
+    client = voice_client("xsalsa20_poly1305_lite")
+    client._update_packetizer()
+    for sequence in range(3):
+        client._packetizer.packet(sequence, 0, FRAME)
+
+    client.secret_key = list(range(32, 64))
+    client._update_packetizer()
+    packet = client._packetizer.packet(3, 0, FRAME)
+    assert packet[-4:] == (3).to_bytes(4, "big")
+    assert RawData(packet, client).decrypted_data == FRAME
+
+
+def test_packets_before_session_description_are_ignored():
+    client = voice_client("xsalsa20_poly1305_lite")
+    packet = VoicePacketizer(client.mode, KEY, 1234).packet(0, 0, FRAME)
+    assert client.unpack_audio(packet) is None
@@ -0,0 +1,129 @@
+import asyncio
+import socket
+
+from discord import voice_client
+from discord.voice_client import VoiceClient, _VoiceReceiver
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("127.0.0.1", 0))
+        self.recording = True
+        self.received = []
+        self._receiver = None
+
+    def unpack_audio(self, data):
+        self.received.append(data)
+
+    def stop_recording(self):
+        self.recording = False
+        receiver, self._receiver = self._receiver, None
+        receiver.stop()
+
+
+def receiver_for(client, finished):
+    receiver = _VoiceReceiver(client, 4, finish=lambda: finished.append(True))
+    client._receiver = receiver
+    return receiver
+
+
+class TrackedProtocol(voice_client._VoiceReceiveProtocol):
+    open = set()
+
+    def connection_made(self, transport):
+        self.open.add(self)
+
+    def connection_lost(self, exc):
+        self.open.discard(self)
+
+
+async def test_restart_supersedes_pending_connect(monkeypatch):
+    monkeypatch.setattr(voice_client, "_VoiceReceiveProtocol", TrackedProtocol)
+    monkeypatch.setattr(TrackedProtocol, "open", set())
+    client = FakeClient()
+    receiver = _VoiceReceiver(client, 4, finish=lambda: None)
+    receiver.start()
+    first = receiver._task
+    receiver.restart()
+    await asyncio.sleep(0.05)
+
+    assert first.cancelled() or first.done()
+    assert receiver._transport is not None
+    assert len(TrackedProtocol.open) == 1
+
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.sendto(b"packet", client.socket.getsockname())
+    await asyncio.sleep(0.05)
+    assert client.received == [b"packet"]
+
+    receiver.stop()
+    await asyncio.sleep(0)
+    assert receiver._transport is None
+    assert not TrackedProtocol.open
+    sender.close()
+    client.socket.close()
+
+
+async def test_stop_before_connecting_closes_endpoint(monkeypatch):
+    monkeypatch.setattr(voice_client, "_VoiceReceiveProtocol", TrackedProtocol)
+    monkeypatch.setattr(TrackedProtocol, "open", set())
+    client = FakeClient()
+    finished = []
+    receiver = receiver_for(client, finished)
+    receiver.start()
+    receiver.stop()
+    await asyncio.sleep(0.05)
+
+    assert receiver._transport is None
+    assert not TrackedProtocol.open
+    assert finished == [True]
+
+    # neither a late restart nor a second stop does anything
+    receiver.restart()
+    receiver.stop()
+    await asyncio.sleep(0.05)
+    assert receiver._transport is None
+    assert not TrackedProtocol.open
+    assert finished == [True]
+    client.socket.close()
+
+
+async def test_failed_endpoint_stops_recording(monkeypatch):
+    client = FakeClient()
+
+    async def create_datagram_endpoint(*args, **kwargs):
+        raise OSError("no endpoint")
+
+    monkeypatch.setattr(
+        client.loop, "create_datagram_endpoint", create_datagram_endpoint
+    )
+    finished = []
+    receiver = receiver_for(client, finished)
+    receiver.start()
+    await asyncio.sleep(0.05)
+
+    assert not client.recording
+    assert client._receiver is None
+    assert finished == [True]
+    client.socket.close()
+
+
+def test_empty_socket_only_drains_buffered_packets(monkeypatch):
+    client = object.__new__(VoiceClient)
+    client.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    client.socket.bind(("127.0.0.1", 0))
+    client.socket.setblocking(False)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    for index in range(5):
+        sender.sendto(bytes([index]), client.socket.getsockname())
+
+    monkeypatch.setattr(VoiceClient, "_MAX_STALE_PACKETS", 3)
+    client.empty_socket()
+    assert client.socket.recv(4096) == bytes([3])
+
+    client.empty_socket()
+    client.empty_socket()
+    sender.close()
+    client.socket.close()
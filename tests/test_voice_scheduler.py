@@ -0,0 +1,62 @@
+import threading
+import time
+
+from discord.player import AudioSource, ScheduledAudioPlayer, VoiceScheduler
+
+
+class FakeClient:
+    def __init__(self, fail: bool = False) -> None:
+        self._connected = threading.Event()
+        self._connected.set()
+        self.loop = None
+        self.ws = None
+        self.fail = fail
+        self.sent = 0
+
+    def _prepare_audio_packet(self, data, *, encode):
+        return data
+
+    def _send_packet(self, packet):
+        if self.fail:
+            raise OSError("socket closed")
+        self.sent += 1
+
+
+class Silence(AudioSource):
+    def read(self):
+        return b"\xf8\xff\xfe"
+
+    def is_opus(self):
+        return True
+
+
+def test_failing_player_does_not_stop_worker():
+    scheduler = VoiceScheduler()
+    good, bad = FakeClient(), FakeClient(fail=True)
+    errors = []
+    ScheduledAudioPlayer(Silence(), good, scheduler).start()
+    ScheduledAudioPlayer(Silence(), bad, scheduler, after=errors.append).start()
+    try:
+        time.sleep(0.2)
+        assert good.sent > 0
+        assert len(errors) == 1 and isinstance(errors[0], OSError)
+        assert scheduler.stats.players == 1
+    finally:
+        scheduler.close()
+
+
+def test_scheduler_usable_after_close():
+    scheduler = VoiceScheduler()
+    client = FakeClient()
+    ScheduledAudioPlayer(Silence(), client, scheduler).start()
+    time.sleep(0.1)
+    scheduler.close()
+    time.sleep(0.05)
+
+    sent = client.sent
+    ScheduledAudioPlayer(Silence(), client, scheduler).start()
+    try:
+        time.sleep(0.1)
+        assert client.sent > sent
+    finally:
+        scheduler.close()